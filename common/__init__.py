@@ -0,0 +1,7 @@
+"""Общие инструменты для лабораторных работ."""
+
+from .memo_store import MemoStore, persistent_memoize
+from .timing import TimingResult, calibrate_timer, measure, measure_batched
+
+__all__ = ['MemoStore', 'TimingResult', 'calibrate_timer', 'measure',
+           'measure_batched', 'persistent_memoize']
@@ -0,0 +1,312 @@
+"""
+Постоянное хранилище мемоизации на SQLite.
+
+Результаты дорогих вычислений переживают завершение процесса, поэтому
+повторный запуск бенчмарка не пересчитывает уже известные значения.
+
+- Ключ: хеш blake2b от pickle аргументов, значение хранится в pickle.
+- Версия: хеш исходного кода функции (source_version). При открытии
+  хранилища с другой версией записи прежней версии того же
+  пространства имён удаляются - изменённая функция не получит
+  устаревших результатов.
+- Ограничения: max_entries и max_bytes на пространство имён; при
+  превышении вытесняются самые старые записи (FIFO по порядку вставки).
+  Последняя записанная запись не вытесняется никогда, даже если одна
+  превышает max_bytes, - после store[key] = value чтение store[key]
+  всегда успешно.
+  Счётчики занятого места хранятся в самой базе, поэтому проверка
+  лимита стоит O(1), а не COUNT(*) по таблице.
+- Конкурентный доступ: журнал WAL позволяет любому числу процессов
+  читать одновременно с одним пишущим; запись идёт короткими
+  транзакциями BEGIN IMMEDIATE. После fork соединение открывается заново.
+
+Хранилище поддерживает протокол словаря (in, [], []=), поэтому его
+можно передать вместо dict в функции вида Fibonacci.memoization(n, memo):
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+    from common.memo_store import MemoStore, persistent_memoize
+
+    @persistent_memoize('cache.sqlite3', max_entries=100_000)
+    def fibonacci(n): ...
+
+    Fibonacci.memoization(500, MemoStore('cache.sqlite3', 'lab09.fib'))
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    namespace TEXT NOT NULL,
+    version   TEXT NOT NULL,
+    key       BLOB NOT NULL,
+    value     BLOB NOT NULL,
+    size      INTEGER NOT NULL,
+    PRIMARY KEY (namespace, version, key)
+);
+CREATE INDEX IF NOT EXISTS memo_age ON memo (namespace, version);  -- rowid по возрастанию внутри
+CREATE TABLE IF NOT EXISTS usage (
+    namespace TEXT PRIMARY KEY,
+    version   TEXT NOT NULL,
+    entries   INTEGER NOT NULL,
+    bytes     INTEGER NOT NULL
+);
+"""
+
+_MISSING = object()
+
+
+def hash_key(key: Any) -> bytes:
+    """Хеш аргументов (должны сериализоваться pickle детерминированно). O(размер ключа)"""
+    return hashlib.blake2b(pickle.dumps(key, protocol=4), digest_size=16).digest()
+
+
+def source_version(func: Callable) -> str:
+    """
+    Тег версии функции по её исходному коду.
+
+    Если исходник недоступен (интерактивный режим), используется
+    байт-код и константы функции.
+    """
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = func.__code__
+        source = code.co_code + repr(code.co_consts).encode()
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
+class MemoStore:
+    """Постоянный словарь мемоизации одного пространства имён."""
+
+    def __init__(self, path: str, namespace: str, version: str = '',
+                 max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None, timeout: float = 30.0):
+        """
+        Args:
+            path: Файл базы SQLite (каталог создаётся при необходимости)
+            namespace: Пространство имён (обычно имя функции)
+            version: Тег версии; записи других версий удаляются
+            max_entries: Максимум записей пространства имён (не меньше 1)
+            max_bytes: Максимальный суммарный размер ключей и значений
+                (кроме последней записи, которая хранится всегда)
+            timeout: Ожидание блокировки другим процессом, секунды
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.namespace = namespace
+        self.version = version
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = self.misses = self.writes = self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        with self._write() as conn:
+            self._drop_stale_versions(conn)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Соединение текущего процесса (после fork открывается новое)."""
+        if self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _write(self):
+        return _WriteTransaction(self)
+
+    def _drop_stale_versions(self, conn: sqlite3.Connection) -> None:
+        conn.execute('DELETE FROM memo WHERE namespace = ? AND version != ?',
+                     (self.namespace, self.version))
+        conn.execute('INSERT INTO usage VALUES (?, ?, 0, 0) '
+                     'ON CONFLICT (namespace) DO UPDATE SET '
+                     'version = excluded.version, entries = 0, bytes = 0 '
+                     'WHERE usage.version != excluded.version',
+                     (self.namespace, self.version))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Значение по ключу или default. O(log n) - поиск по первичному ключу"""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT value FROM memo WHERE namespace = ? AND version = ? AND key = ?',
+                (self.namespace, self.version, hash_key(key))).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Сохранение значения и вытеснение старых записей сверх лимитов.
+
+        Если запись уже добавлена другим процессом, она не меняется.
+        Новая запись сохраняется всегда: вытесняются только более старые.
+
+        Complexity: O(log n) + O(k log n) на k вытесненных записей
+        """
+        digest = hash_key(key)
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(digest) + len(blob)
+        with self._write() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO memo VALUES (?, ?, ?, ?, ?)',
+                (self.namespace, self.version, digest, blob, size))
+            if not cursor.rowcount:
+                return
+            self.writes += 1
+            entries, nbytes = conn.execute(
+                'UPDATE usage SET entries = entries + 1, bytes = bytes + ? '
+                'WHERE namespace = ? RETURNING entries, bytes',
+                (size, self.namespace)).fetchone()
+            if ((self.max_entries is not None and entries > self.max_entries)
+                    or (self.max_bytes is not None and nbytes > self.max_bytes)):
+                self._evict(conn, entries, nbytes, cursor.lastrowid)
+
+    def _evict(self, conn: sqlite3.Connection, entries: int, nbytes: int,
+               keep: int) -> None:
+        """Удаление самых старых записей (кроме keep), пока не выполнены оба лимита."""
+        rows = conn.execute(
+            'SELECT rowid, size FROM memo WHERE namespace = ? AND version = ? '
+            'AND rowid != ? ORDER BY rowid', (self.namespace, self.version, keep))
+        victims, freed = [], 0
+        for rowid, size in rows:  # O(k) - только вытесняемые записи
+            if ((self.max_entries is None or entries - len(victims) <= self.max_entries)
+                    and (self.max_bytes is None or nbytes - freed <= self.max_bytes)):
+                break
+            victims.append((rowid,))
+            freed += size
+        rows.close()
+        conn.executemany('DELETE FROM memo WHERE rowid = ?', victims)
+        conn.execute('UPDATE usage SET entries = entries - ?, bytes = bytes - ? '
+                     'WHERE namespace = ?', (len(victims), freed, self.namespace))
+        self.evictions += len(victims)
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return self._connection().execute(
+                'SELECT 1 FROM memo WHERE namespace = ? AND version = ? AND key = ?',
+                (self.namespace, self.version, hash_key(key))).fetchone() is not None
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.put(key, value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT entries FROM usage WHERE namespace = ?',
+                (self.namespace,)).fetchone()
+        return row[0] if row else 0
+
+    def clear(self) -> None:
+        """Удаление всех записей пространства имён."""
+        with self._write() as conn:
+            conn.execute('DELETE FROM memo WHERE namespace = ?', (self.namespace,))
+            conn.execute('UPDATE usage SET entries = 0, bytes = 0 WHERE namespace = ?',
+                         (self.namespace,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Счётчики этого процесса и занятое место в базе."""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT entries, bytes FROM usage WHERE namespace = ?',
+                (self.namespace,)).fetchone() or (0, 0)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'entries': row[0],
+            'bytes': row[1],
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn, self._pid = None, None
+
+    def __enter__(self) -> 'MemoStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _WriteTransaction:
+    """Транзакция записи: BEGIN IMMEDIATE сразу берёт блокировку записи,
+    чтобы два процесса не упирались в повышение блокировки чтения."""
+
+    def __init__(self, store: MemoStore):
+        self.store = store
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.store._lock.acquire()
+        try:
+            conn = self.store._connection()
+            conn.execute('BEGIN IMMEDIATE')
+        except BaseException:
+            self.store._lock.release()
+            raise
+        return conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.store._conn.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+        finally:
+            self.store._lock.release()
+
+
+def persistent_memoize(path: str, namespace: Optional[str] = None,
+                       max_entries: Optional[int] = None,
+                       max_bytes: Optional[int] = None) -> Callable:
+    """
+    Декоратор мемоизации с хранением результатов в MemoStore.
+
+    Пространство имён по умолчанию - модуль и имя функции, версия -
+    хеш её исходного кода. У обёртки есть атрибут store.
+
+    Args:
+        path: Файл базы SQLite
+        namespace: Пространство имён (None - module.qualname)
+        max_entries: Максимум записей
+        max_bytes: Максимальный размер записей в байтах
+    """
+    def decorator(func: Callable) -> Callable:
+        store = MemoStore(path, namespace or f'{func.__module__}.{func.__qualname__}',
+                          source_version(func), max_entries, max_bytes)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = store.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                store.put(key, value)
+            return value
+
+        wrapper.store = store
+        return wrapper
+    return decorator
@@ -0,0 +1,123 @@
+# test_memo_store.py
+# Юнит-тесты постоянного хранилища мемоизации (запуск из корня: python -m unittest common.test_memo_store)
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from common.memo_store import MemoStore, persistent_memoize, source_version
+
+
+def _fill(path, start):
+    store = MemoStore(path, 'shared', max_entries=150)
+    for key in range(start, start + 100):
+        store[key] = key * key
+    store.close()
+
+
+def _memoized_fibonacci(n, memo=None):
+    # Стиль Fibonacci.memoization из lab09: memo - любой словарь
+    if memo is None:
+        memo = {}
+    if n in memo:
+        return memo[n]
+    if n <= 1:
+        return n
+    memo[n] = _memoized_fibonacci(n - 1, memo) + _memoized_fibonacci(n - 2, memo)
+    return memo[n]
+
+
+class TestMemoStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'memo', 'store.sqlite3')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_persists_between_instances(self):
+        with MemoStore(self.path, 'fib', 'v1') as store:
+            self.assertEqual(_memoized_fibonacci(90, store), 2880067194370816120)
+        with MemoStore(self.path, 'fib', 'v1') as store:
+            self.assertIn(90, store)
+            self.assertEqual(store[90], 2880067194370816120)
+            self.assertEqual(store.stats()['hits'], 1)
+            with self.assertRaises(KeyError):
+                store[1000]
+
+    def test_new_version_drops_old_entries(self):
+        with MemoStore(self.path, 'f', 'v1') as store:
+            store[(1, 2)] = 'old'
+        with MemoStore(self.path, 'other', 'v1') as other:
+            other[1] = 'kept'
+        with MemoStore(self.path, 'f', 'v2') as store:
+            self.assertNotIn((1, 2), store)
+            self.assertEqual(len(store), 0)
+        with MemoStore(self.path, 'other', 'v1') as other:
+            self.assertEqual(other[1], 'kept')
+
+    def test_limits_evict_oldest(self):
+        with MemoStore(self.path, 'n', max_entries=10) as store:
+            for key in range(25):
+                store[key] = key
+            self.assertEqual(len(store), 10)
+            self.assertNotIn(14, store)
+            self.assertIn(15, store)
+            self.assertEqual(store.evictions, 15)
+        with MemoStore(self.path, 'b', max_bytes=1000) as store:
+            for key in range(100):
+                store[key] = 'x' * 50
+            self.assertLessEqual(store.stats()['bytes'], 1000)
+            self.assertIn(99, store)
+
+    def test_last_write_is_always_kept(self):
+        with MemoStore(self.path, 'one', max_entries=1) as store:
+            store[5] = 8
+            self.assertEqual(store[5], 8)
+            store[6] = 9
+            self.assertEqual(store[6], 9)
+            self.assertNotIn(5, store)
+        with MemoStore(self.path, 'tiny', max_bytes=10) as store:
+            store[1] = 1
+            store[5] = 10 ** 100
+            self.assertEqual(store[5], 10 ** 100)
+            self.assertNotIn(1, store)
+            self.assertEqual(len(store), 1)
+        with self.assertRaises(ValueError):
+            MemoStore(self.path, 'zero', max_entries=0)
+
+    def test_decorator_and_source_version(self):
+        calls = []
+
+        def square(n):
+            calls.append(n)
+            return n * n
+
+        cached = persistent_memoize(self.path)(square)
+        self.assertEqual(cached(12), 144)
+        self.assertEqual(cached(12), 144)
+        self.assertEqual(calls, [12])
+        self.assertEqual(source_version(square), source_version(square))
+        self.assertNotEqual(source_version(square), source_version(_fill))
+        cached.store.close()
+
+    def test_multiple_processes(self):
+        MemoStore(self.path, 'shared', max_entries=150).close()
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=_fill, args=(self.path, start))
+                   for start in (0, 50, 100)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+        with MemoStore(self.path, 'shared', max_entries=150) as store:
+            self.assertEqual(len(store), 150)
+            present = [key for key in range(200) if key in store]
+            self.assertEqual(len(present), 150)
+            self.assertTrue(all(store[key] == key * key for key in present))
+
+
+if __name__ == '__main__':
+    unittest.main()
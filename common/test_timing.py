@@ -0,0 +1,86 @@
+# test_timing.py
+# Юнит-тесты общего модуля замеров (запуск из корня: python -m unittest common.test_timing)
+
+import gc
+import time
+import unittest
+
+from common.timing import TimingResult, calibrate_timer, measure, measure_batched
+
+
+class TestTimingResult(unittest.TestCase):
+    def test_statistics(self):
+        result = TimingResult([5.0, 1.0, 3.0, 2.0, 4.0], number=1,
+                              overhead=0.0, ci_halfwidth=0.1)
+        self.assertEqual(result.min, 1.0)
+        self.assertEqual(result.median, 3.0)
+        self.assertEqual(result.iqr, 2.0)
+        self.assertAlmostEqual(result.p95, 4.8)
+        self.assertEqual(result.as_dict()['repeats'], 5)
+
+
+class TestMeasure(unittest.TestCase):
+    def test_calibrate_timer_is_small(self):
+        overhead = calibrate_timer()
+        self.assertGreaterEqual(overhead, 0.0)
+        self.assertLess(overhead, 1e-3)
+
+    def test_measures_sleep(self):
+        result = measure(time.sleep, 0.002, warmup=0, min_repeats=3,
+                         max_time=0.1)
+        self.assertGreaterEqual(result.min, 0.0015)
+        self.assertLessEqual(result.min, result.median)
+        self.assertLessEqual(result.median, result.p95)
+
+    def test_adaptive_repeats_limits(self):
+        result = measure(sum, [1, 2, 3], min_repeats=4, max_repeats=10,
+                         target_ci=0.0)
+        self.assertEqual(result.repeats, 10)
+
+    def test_setup_and_gc_restored(self):
+        calls = []
+        result = measure(calls.append, setup=lambda: (len(calls),),
+                         warmup=2, min_repeats=3, max_repeats=3)
+        self.assertEqual(calls, list(range(5)))
+        self.assertEqual(result.repeats, 3)
+        self.assertTrue(gc.isenabled())
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            measure(sum, [], number=0)
+
+
+class TestMeasureBatched(unittest.TestCase):
+    def test_batch_reaches_min_sample_time(self):
+        calls = []
+        result = measure_batched(calls.append, 1, unroll=4,
+                                 min_sample_time=0.001, max_time=0.05)
+        self.assertEqual(result.number % 4, 0)
+        self.assertGreater(result.number, 4)
+        self.assertGreaterEqual(result.median, 0.0)
+
+    def test_baseline_subtracted(self):
+        # Пустая функция стоит столько же, сколько базовый цикл
+        noop = measure_batched(lambda: None, min_sample_time=0.001,
+                               max_time=0.05)
+        work = measure_batched(sorted, list(range(200)),
+                               min_sample_time=0.001, max_time=0.05)
+        self.assertLess(noop.median, work.median)
+        self.assertGreater(work.overhead, 0.0)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            measure_batched(len, [], unroll=0)
+
+    def test_slow_call_falls_back_to_measure(self):
+        # Вызов дольше min_sample_time измеряется без пакетов
+        start = time.perf_counter()
+        result = measure_batched(time.sleep, 0.01, min_sample_time=0.002,
+                                 max_time=0.1)
+        self.assertEqual(result.number, 1)
+        self.assertGreaterEqual(result.min, 0.009)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,287 @@
+"""
+Общий модуль замера времени для всех лабораторных работ.
+
+Функция measure() выполняет:
+1. Прогревочные запуски (кэши, ленивые инициализации, JIT аллокатора)
+2. Отключение сборщика мусора на время замеров
+3. Калибровку и вычитание накладных расходов таймера
+4. Адаптивное число повторов до достижения заданной ширины
+   доверительного интервала
+5. Устойчивую статистику: min / медиана / IQR / p95
+
+Для операций O(1) и O(log n) вызов таймера стоит столько же, сколько
+сама работа; для них предназначена measure_batched(): пакет из K
+вызовов в развёрнутом цикле между отметками времени и вычитание
+времени пустого цикла.
+
+Подключение из лабораторной (скрипты запускаются из labXX/src):
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+    from common.timing import measure, measure_batched
+"""
+
+import gc
+import math
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+_timer_overhead: Optional[float] = None
+
+
+class TimingResult:
+    """Результат серии замеров. Все времена - в секундах на один вызов."""
+
+    def __init__(self, samples: List[float], number: int, overhead: float,
+                 ci_halfwidth: float):
+        """
+        Args:
+            samples: Времена одного вызова по каждому повтору
+            number: Количество вызовов в одном повторе
+            overhead: Вычтенные накладные расходы таймера на повтор
+            ci_halfwidth: Относительная полуширина доверительного интервала
+        """
+        ordered = sorted(samples)  # O(r log r)
+        self.samples = samples
+        self.repeats = len(samples)
+        self.number = number
+        self.overhead = overhead
+        self.ci_halfwidth = ci_halfwidth
+        self.min = ordered[0]
+        self.max = ordered[-1]
+        self.mean = statistics.fmean(ordered)
+        self.median = statistics.median(ordered)
+        self.stdev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+        self.q1, self.q3 = _percentile(ordered, 25), _percentile(ordered, 75)
+        self.iqr = self.q3 - self.q1
+        self.p95 = _percentile(ordered, 95)
+
+    def as_dict(self) -> dict:
+        """Словарь для сохранения в JSON."""
+        return {
+            'min': self.min,
+            'median': self.median,
+            'mean': self.mean,
+            'iqr': self.iqr,
+            'p95': self.p95,
+            'stdev': self.stdev,
+            'repeats': self.repeats,
+            'number': self.number,
+            'ci_halfwidth': self.ci_halfwidth,
+        }
+
+    def __repr__(self) -> str:
+        return ('TimingResult(median={:.3e}s, min={:.3e}s, iqr={:.3e}s, '
+                'p95={:.3e}s, repeats={}, number={})').format(
+                    self.median, self.min, self.iqr, self.p95,
+                    self.repeats, self.number)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Перцентиль q (0..100) отсортированной выборки с интерполяцией."""
+    pos = (len(ordered) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def calibrate_timer(rounds: int = 2000) -> float:
+    """Оценивает стоимость пары вызовов time.perf_counter() в секундах.
+
+    Результат кэшируется на уровне модуля.
+
+    Сложность: O(rounds)
+    """
+    global _timer_overhead
+    if _timer_overhead is None:
+        timer = time.perf_counter
+        deltas = []
+        for _ in range(rounds):  # O(rounds)
+            start = timer()
+            deltas.append(timer() - start)
+        _timer_overhead = statistics.median(deltas)
+    return _timer_overhead
+
+
+def measure(func: Callable, *args, number: int = 1, warmup: int = 3,
+            min_repeats: int = 5, max_repeats: int = 1000,
+            target_ci: float = 0.05, max_time: float = 2.0,
+            disable_gc: bool = True, confidence: float = 0.95,
+            setup: Optional[Callable[[], Tuple]] = None) -> TimingResult:
+    """Замеряет время выполнения func(*args) с устойчивой статистикой.
+
+    Повторы продолжаются, пока относительная полуширина доверительного
+    интервала среднего не станет меньше target_ci, либо пока не будет
+    исчерпан лимит max_repeats или max_time секунд.
+
+    Args:
+        func: Измеряемая функция
+        *args: Аргументы функции
+        number: Вызовов в одном повторе (время делится на number)
+        warmup: Количество прогревочных запусков
+        min_repeats: Минимальное число повторов
+        max_repeats: Максимальное число повторов
+        target_ci: Целевая относительная полуширина интервала (0.05 = ±5%)
+        max_time: Ограничение общего времени замера в секундах
+        disable_gc: Отключать ли сборщик мусора на время повторов
+        confidence: Уровень доверия интервала
+        setup: Функция, возвращающая кортеж аргументов для очередного
+            повтора; вызывается вне замера (нужна для функций,
+            изменяющих вход, например сортировки на месте)
+
+    Returns:
+        TimingResult со статистикой времени одного вызова
+    """
+    if number < 1 or min_repeats < 2 or max_repeats < min_repeats:
+        raise ValueError('Invalid repeat configuration.')
+
+    timer = time.perf_counter
+    overhead = calibrate_timer()
+
+    for _ in range(warmup):  # O(warmup)
+        func(*(setup() if setup else args))
+
+    def sample() -> float:
+        call_args = setup() if setup else args
+        start = timer()
+        for _ in range(number):  # O(number)
+            func(*call_args)
+        elapsed = timer() - start
+        return max(elapsed - overhead, 0.0) / number
+
+    samples, ci = _collect(sample, min_repeats, max_repeats, target_ci,
+                           max_time, disable_gc, confidence)
+    return TimingResult(samples, number, overhead, ci)
+
+
+def _collect(sample: Callable[[], float], min_repeats: int, max_repeats: int,
+             target_ci: float, max_time: float, disable_gc: bool,
+             confidence: float) -> Tuple[List[float], float]:
+    """Адаптивно повторяет sample() до нужной точности.
+
+    Returns:
+        (времена одного вызова по повторам, относительная полуширина
+        доверительного интервала среднего)
+    """
+    timer = time.perf_counter
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()  # Убираем накопленный мусор до замеров
+    if disable_gc:
+        gc.disable()
+
+    samples: List[float] = []
+    ci = math.inf
+    deadline = timer() + max_time
+    try:
+        while len(samples) < max_repeats:
+            samples.append(sample())
+
+            if len(samples) >= min_repeats:
+                mean = statistics.fmean(samples)
+                if mean > 0:
+                    sem = statistics.stdev(samples) / math.sqrt(len(samples))
+                    ci = z * sem / mean
+                if ci <= target_ci or timer() > deadline:
+                    break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples, ci
+
+
+def _noop(*args) -> None:
+    """Пустая функция для замера базовой стоимости цикла вызовов."""
+
+
+_batch_runners: Dict[int, Callable] = {}
+
+
+def _batch_runner(unroll: int) -> Callable:
+    """Возвращает функцию, вызывающую func(*args) loops * unroll раз.
+
+    Тело цикла развёрнуто: unroll вызовов подряд без счётчика между
+    ними, поэтому накладные расходы цикла делятся на unroll. Код
+    генерируется один раз для каждого значения unroll.
+    """
+    if unroll not in _batch_runners:
+        body = '\n'.join(['        func(*args)'] * unroll)
+        source = ('def run(func, args, loops, timer):\n'
+                  '    start = timer()\n'
+                  '    for _ in range(loops):\n'
+                  f'{body}\n'
+                  '    return timer() - start\n')
+        namespace: dict = {}
+        exec(source, namespace)  # Развёрнутый цикл можно получить только генерацией кода
+        _batch_runners[unroll] = namespace['run']
+    return _batch_runners[unroll]
+
+
+def measure_batched(func: Callable, *args, unroll: int = 10,
+                    min_sample_time: float = 0.002, warmup: int = 3,
+                    min_repeats: int = 5, max_repeats: int = 200,
+                    target_ci: float = 0.02, max_time: float = 1.0,
+                    disable_gc: bool = True,
+                    confidence: float = 0.95) -> TimingResult:
+    """Микро-бенчмарк для быстрых операций (O(1), O(log n)).
+
+    Один замер - это K вызовов func(*args) в развёрнутом цикле между
+    двумя отметками времени. K = loops * unroll подбирается удвоением
+    так, чтобы замер длился не меньше min_sample_time. Из каждого
+    замера вычитается время того же цикла с пустой функцией, поэтому
+    результат не содержит ни стоимости таймера, ни стоимости цикла
+    и самого вызова.
+
+    Если один вызов уже длится не меньше min_sample_time (например,
+    линейный поиск на большом массиве), пакеты не нужны и только
+    растягивают замер далеко за max_time - тогда замер выполняет
+    measure() с number = 1.
+
+    Args:
+        func: Измеряемая функция (не должна изменять аргументы)
+        *args: Аргументы функции
+        unroll: Вызовов в теле цикла
+        min_sample_time: Минимальная длительность одного замера, секунды
+        warmup: Количество прогревочных запусков
+        min_repeats: Минимальное число замеров
+        max_repeats: Максимальное число замеров
+        target_ci: Целевая относительная полуширина интервала
+        max_time: Ограничение общего времени в секундах
+        disable_gc: Отключать ли сборщик мусора на время замеров
+        confidence: Уровень доверия интервала
+
+    Returns:
+        TimingResult: время одного вызова, number = K, overhead -
+        вычтенное время пустого цикла на замер
+    """
+    if unroll < 1 or min_repeats < 2 or max_repeats < min_repeats:
+        raise ValueError('Invalid repeat configuration.')
+
+    timer = time.perf_counter
+    run = _batch_runner(unroll)
+
+    start = timer()
+    func(*args)  # Первый прогревочный запуск заодно оценивает длительность
+    if timer() - start >= min_sample_time:  # Медленный вызов: пакеты не нужны
+        return measure(func, *args, warmup=0,  # Прогрев уже выполнен
+                       min_repeats=min_repeats, max_repeats=max_repeats,
+                       target_ci=target_ci, max_time=max_time,
+                       disable_gc=disable_gc, confidence=confidence)
+    for _ in range(warmup - 1):  # O(warmup)
+        func(*args)
+
+    loops = 1
+    while run(func, args, loops, timer) < min_sample_time and loops < 1 << 30:
+        loops *= 2  # O(log K) - подбор размера пакета
+    number = loops * unroll
+
+    baseline = statistics.median(  # Пустой цикл с тем же числом вызовов
+        run(_noop, args, loops, timer) for _ in range(5))
+
+    def sample() -> float:
+        return max(run(func, args, loops, timer) - baseline, 0.0) / number
+
+    samples, ci = _collect(sample, min_repeats, max_repeats, target_ci,
+                           max_time, disable_gc, confidence)
+    return TimingResult(samples, number, baseline, ci)
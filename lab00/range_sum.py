@@ -0,0 +1,184 @@
+"""Индексы для быстрых сумм на отрезках массива.
+
+PrefixSumIndex - статический массив префиксных сумм, O(1) на запрос.
+FenwickTree - дерево Фенвика, O(log N) на изменение и на запрос.
+Отрезки полуоткрытые: range_sum(lo, hi) == sum_array(arr[lo:hi]).
+"""
+
+import random
+import time
+from array import array
+from itertools import accumulate, chain
+from typing import Iterable, List, Sequence, Tuple, Union
+
+Storage = Union[array, List[int]]
+
+
+def _compact(values: Iterable[int]) -> Storage:
+    """Упаковывает числа в array('q'), а при выходе за int64 - в список."""
+    values = list(values) if not isinstance(values, (list, array)) else values
+    try:
+        return array('q', values)  # 8 байт на элемент
+    except OverflowError:
+        return list(values)  # Произвольная точность ценой памяти
+
+
+class PrefixSumIndex:
+    """Массив префиксных сумм для неизменяемых данных.
+
+    Построение: O(N), запрос: O(1), память: O(N).
+    """
+
+    def __init__(self, arr: Sequence[int]):
+        """
+        Args:
+            arr: Исходный массив целых чисел
+        """
+        self._prefix = _compact(accumulate(arr, initial=0))  # O(N)
+
+    def __len__(self) -> int:
+        return len(self._prefix) - 1
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        """Сумма элементов arr[lo:hi].
+
+        Complexity: O(1)
+        """
+        if not 0 <= lo <= hi <= len(self):  # O(1) - проверка границ
+            raise IndexError('Range out of bounds.')
+        return self._prefix[hi] - self._prefix[lo]  # O(1)
+
+
+class FenwickTree:
+    """Дерево Фенвика (binary indexed tree) для изменяемых данных.
+
+    Построение: O(N), изменение и запрос: O(log N), память: O(N).
+    """
+
+    def __init__(self, arr: Sequence[int]):
+        """
+        Args:
+            arr: Исходный массив целых чисел
+        """
+        tree = _compact(chain([0], arr))  # Индексация с 1: tree[0] не используется
+        try:
+            self._build(tree)
+        except OverflowError:
+            tree = list(chain([0], arr))  # Частичные суммы не влезли в int64
+            self._build(tree)
+        self._tree = tree
+        self._size = len(tree) - 1
+
+    @staticmethod
+    def _build(tree: Storage) -> None:
+        """Превращает массив значений в дерево Фенвика на месте. O(N)"""
+        n = len(tree) - 1
+        for i in range(1, n + 1):  # O(N) - построение снизу вверх
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, index: int, delta: int) -> None:
+        """Прибавляет delta к arr[index].
+
+        Complexity: O(log N)
+        """
+        if not 0 <= index < self._size:  # O(1) - проверка границ
+            raise IndexError('Index out of range.')
+        i = index + 1
+        tree = self._tree
+        try:
+            while i <= self._size:  # O(log N)
+                tree[i] += delta
+                i += i & -i
+        except OverflowError:
+            # Откатываем уже сделанные шаги и переходим на список
+            j = index + 1
+            while j < i:
+                tree[j] -= delta
+                j += j & -j
+            self._tree = list(tree)
+            self.add(index, delta)
+
+    def update(self, index: int, value: int) -> None:
+        """Присваивает arr[index] = value.
+
+        Complexity: O(log N)
+        """
+        self.add(index, value - self.range_sum(index, index + 1))
+
+    def prefix_sum(self, count: int) -> int:
+        """Сумма первых count элементов.
+
+        Complexity: O(log N)
+        """
+        if not 0 <= count <= self._size:  # O(1) - проверка границ
+            raise IndexError('Range out of bounds.')
+        total = 0
+        tree = self._tree
+        while count > 0:  # O(log N)
+            total += tree[count]
+            count &= count - 1  # Сброс младшего единичного бита
+        return total
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        """Сумма элементов arr[lo:hi].
+
+        Complexity: O(log N)
+        """
+        if not 0 <= lo <= hi <= self._size:  # O(1) - проверка границ
+            raise IndexError('Range out of bounds.')
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+
+def benchmark_range_sum(size: int = 200000, queries: int = 200,
+                        seed: int = 0) -> Tuple[float, float, float]:
+    """Сравнивает повторные вызовы sum_array на срезах с индексами.
+
+    Args:
+        size: Размер массива
+        queries: Количество запросов сумм на отрезках
+        seed: Зерно генератора случайных чисел
+
+    Returns:
+        Время в миллисекундах: (sum_array, PrefixSumIndex, FenwickTree),
+        для индексов - вместе со временем построения
+    """
+    from sum_analysis import sum_array  # Модуль тянет matplotlib
+
+    rng = random.Random(seed)
+    data = rng.choices(range(1, 1001), k=size)
+    bounds = [sorted(rng.sample(range(size + 1), 2)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    expected = [sum_array(data[lo:hi]) for lo, hi in bounds]  # O(Q * N)
+    naive_time = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    prefix = PrefixSumIndex(data)  # O(N)
+    prefix_result = [prefix.range_sum(lo, hi) for lo, hi in bounds]  # O(Q)
+    prefix_time = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    fenwick = FenwickTree(data)  # O(N)
+    fenwick_result = [fenwick.range_sum(lo, hi) for lo, hi in bounds]  # O(Q log N)
+    fenwick_time = (time.perf_counter() - start) * 1000
+
+    assert expected == prefix_result == fenwick_result
+    return naive_time, prefix_time, fenwick_time
+
+
+if __name__ == '__main__':
+    print('Сравнение сумм на отрезках (время в мс, с построением индекса):')
+    print('{:>10} {:>10} {:>12} {:>12} {:>12}'.format(
+        'Размер', 'Запросы', 'sum_array', 'Префиксы', 'Фенвик'
+    ))
+    for n in [10000, 100000, 1000000]:
+        for q in [10, 100, 1000]:
+            naive, prefix, fenwick = benchmark_range_sum(n, q)
+            print('{:>10} {:>10} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+                n, q, naive, prefix, fenwick
+            ))
@@ -0,0 +1,128 @@
+"""Потоковое чтение целых чисел из больших файлов через mmap."""
+
+import mmap
+import os
+import time
+from array import array
+from typing import Iterator
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 МБ - размер окна разбора
+WHITESPACE = (b' ', b'\n', b'\t', b'\r', b'\x0b', b'\x0c')  # Всё, что делит bytes.split()
+
+
+class IntStreamReader:
+    """Читает целые числа из файла блоками фиксированного размера.
+
+    Файл отображается в память (mmap) и разбирается окнами по
+    chunk_size байт. Каждое окно превращается в блок array('q'),
+    поэтому пиковое потребление памяти - O(chunk_size) и не зависит
+    от размера файла.
+
+    Числа должны помещаться в знаковое 64-битное целое, иначе при
+    разборе возникает OverflowError.
+
+    Attributes:
+        bytes_parsed: Количество разобранных байт
+        numbers_parsed: Количество прочитанных чисел
+        elapsed: Время разбора в секундах (без времени потребителя)
+    """
+
+    def __init__(self, filename: str = 'input.txt',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            filename: Имя файла для чтения
+            chunk_size: Размер окна разбора в байтах
+        """
+        if chunk_size <= 0:
+            raise ValueError('chunk_size должен быть положительным')
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.bytes_parsed = 0
+        self.numbers_parsed = 0
+        self.elapsed = 0.0
+
+    def blocks(self) -> Iterator[array]:
+        """Возвращает блоки чисел array('q') по мере разбора файла.
+
+        Сложность: O(N) по времени, O(chunk_size) по памяти.
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если файл содержит нечисловые данные
+        """
+        self.bytes_parsed = 0
+        self.numbers_parsed = 0
+        self.elapsed = 0.0
+
+        with open(self.filename, 'rb') as file:  # O(1) - открытие файла
+            size = os.fstat(file.fileno()).st_size  # O(1) - размер файла
+            if size == 0:  # O(1) - пустой файл нельзя отобразить
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)  # O(1) - подсказка ОС
+
+                tail = b''  # Незавершенное число с конца предыдущего окна
+                pos = 0
+                while pos < size:  # O(N / chunk_size) - цикл по окнам
+                    start = time.perf_counter()
+                    end = min(pos + self.chunk_size, size)
+                    chunk = tail + mm[pos:end]  # O(chunk_size) - копия окна
+
+                    if end < size:
+                        # Число может быть разрезано границей окна:
+                        # разбираем только до последнего разделителя
+                        cut = max(chunk.rfind(ws) for ws in WHITESPACE)
+                        tail = chunk[cut + 1:]  # O(1) - обычно пара байт
+                        chunk = chunk[:cut + 1]
+                    else:
+                        tail = b''
+
+                    block = array('q', map(int, chunk.split()))  # O(chunk_size)
+                    self.bytes_parsed += end - pos
+                    self.numbers_parsed += len(block)
+                    self.elapsed += time.perf_counter() - start
+                    pos = end
+
+                    if block:
+                        yield block
+
+    def __iter__(self) -> Iterator[int]:
+        """Возвращает числа файла по одному. Память: O(chunk_size)."""
+        for block in self.blocks():
+            yield from block
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Скорость разбора в байтах в секунду."""
+        if self.elapsed == 0:
+            return 0.0
+        return self.bytes_parsed / self.elapsed
+
+
+def stream_sum(filename: str = 'input.txt',
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               quiet: bool = True) -> int:
+    """Суммирует числа файла, не загружая его в память целиком.
+
+    Сложность: O(N) по времени, O(chunk_size) по памяти.
+
+    Args:
+        filename: Имя файла для чтения
+        chunk_size: Размер окна разбора в байтах
+        quiet: Если False, выводит статистику разбора
+
+    Returns:
+        Сумма всех чисел файла
+    """
+    reader = IntStreamReader(filename, chunk_size)
+    total = 0
+    for block in reader.blocks():  # O(N / chunk_size) блоков
+        total += sum(block)  # O(chunk_size) - суммирование на уровне C
+
+    if not quiet:
+        print(f'Прочитано чисел: {reader.numbers_parsed}, '
+              f'байт: {reader.bytes_parsed}, '
+              f'скорость: {reader.bytes_per_second / 2**20:.2f} МБ/с')
+    return total
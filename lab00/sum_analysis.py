@@ -1,10 +1,17 @@
 """Модуль для анализа сложности алгоритма суммирования."""
 
-import timeit
+import os
+import sys
 import random
+from array import array
 from typing import List, Optional, Callable
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.timing import measure
+from stream_reader import stream_sum
+from sum_engine import chunked_sum, parallel_sum
+
 
 def calculate_sum() -> None:
     """Считает сумму двух введенных чисел.
@@ -35,26 +42,33 @@ def sum_array(arr: List[int]) -> int:
 
 
 def measure_time(func: Callable, data: List[int], number: int = 10) -> float:
-    """Измеряет время выполнения функции2 в миллисекундах.
+    """Измеряет время выполнения функции в миллисекундах.
+    
+    Использует общий модуль common.timing: прогрев, отключение GC,
+    вычитание накладных расходов таймера и адаптивные повторы.
     
     Args:
         func: Функция для измерения времени выполнения
         data: Данные для передачи в функцию
-        number: Количество запусков для усреднения
+        number: Минимальное количество повторов
         
     Returns:
-        Среднее время выполнения в миллисекундах
+        Медианное время выполнения в миллисекундах
     """
-    total_time = timeit.timeit(lambda: func(data), number=number)
-    execution_time = total_time * 1000 / number
-    return execution_time
+    result = measure(func, data, warmup=1, min_repeats=max(number, 2))
+    return result.median * 1000
 
 
-def read_from_file(filename: str = 'input.txt') -> Optional[List[int]]:
+def read_from_file(filename: str = 'input.txt',
+                   quiet: bool = False) -> Optional[List[int]]:
     """Читает числа из файла и выводит содержимое.
     
+    Для больших файлов используйте stream_reader.IntStreamReader:
+    эта функция держит в памяти весь файл и список чисел.
+    
     Args:
         filename: Имя файла для чтения
+        quiet: Если True, содержимое файла не выводится
         
     Returns:
         Список чисел из файла или None если файл не найден
@@ -64,8 +78,9 @@ def read_from_file(filename: str = 'input.txt') -> Optional[List[int]]:
             content = file.read().split()  # O(N) - чтение и разделение
             numbers = [int(x) for x in content]  # O(N) - преобразование 
             
-            print(f'Содержимое файла {filename}:')  # O(1)
-            print(' '.join(content))  # O(N) - вывод содержимого
+            if not quiet:  # O(1) - проверка режима
+                print(f'Содержимое файла {filename}:')  # O(1)
+                print(' '.join(content))  # O(N) - вывод содержимого
             
             return numbers
     except FileNotFoundError:
@@ -106,33 +121,62 @@ def main() -> None:
             print('В файле недостаточно чисел для суммирования')  # O(1)
     print()
     
+    # Задание 2б: Потоковое чтение без загрузки файла в память
+    print('=== Задание 2б: Потоковое чтение файла ===')
+    filename = 'input.txt'
+    try:
+        total = stream_sum(filename, quiet=False)  # O(N) - разбор окнами, память O(1)
+        print(f'Сумма всех чисел: {total}')  # O(1)
+    except FileNotFoundError:
+        print(f'Файл {filename} не найден')  # O(1)
+    except OverflowError:  # Числа вне int64: обычное чтение в int Python
+        print('Числа не помещаются в int64, чтение без потокового разбора')  # O(1)
+        numbers = read_from_file(filename, quiet=True)  # O(N) - весь файл в памяти
+        if numbers is not None:
+            print(f'Сумма всех чисел: {sum(numbers)}')  # O(N)
+    except ValueError:
+        print('Ошибка: файл содержит нечисловые данные')  # O(1)
+    print()
+    
     # Задание 3: Анализ производительности
     print('=== Задание 3: Анализ производительности ===')
     
-    sizes = [1000, 5000, 10000, 50000, 100000, 500000]  # Размеры массивов
+    # Размеры массивов: последние два далеко за прежним пределом 500 000
+    sizes = [1000, 5000, 10000, 50000, 100000, 500000, 2000000, 10000000]
     times = []  # Время выполнения для каждого размера
+    chunked_times = []  # Время chunked_sum
+    parallel_times = []  # Время parallel_sum
     
     print('Замеры времени выполнения для алгоритма суммирования массива:')
-    print('{:>10} {:>15} {:>20}'.format('Размер', 'Время', 'Время/элемент'))
+    print('{:>10} {:>15} {:>20} {:>15} {:>15}'.format(
+        'Размер', 'Время', 'Время/элемент', 'chunked', 'parallel'
+    ))
     
     for size in sizes:
         # Генерация случайного массива заданного размера
-        data = [random.randint(1, 1000) for _ in range(size)]  # O(N)
+        data = random.choices(range(1, 1001), k=size)  # O(N)
+        buffer = array('q', data)  # O(N) - компактный буфер int64
+        number = 10 if size <= 500000 else 3  # Меньше повторов для больших N
         
         # Замер времени выполнения с усреднением
-        execution_time = measure_time(sum_array, data, number=10)  # O(N)
+        execution_time = measure_time(sum_array, data, number=number)  # O(N)
         times.append(execution_time)
+        chunked_times.append(measure_time(chunked_sum, buffer, number=number))
+        parallel_times.append(measure_time(parallel_sum, buffer, number=number))
         
         # Расчет времени на элемент
         time_per_element = (execution_time * 1000) / size if size > 0 else 0
         
-        print('{:>10} {:>15.4f} {:>20.4f}'.format(
-            size, execution_time, time_per_element
+        print('{:>10} {:>15.4f} {:>20.4f} {:>15.4f} {:>15.4f}'.format(
+            size, execution_time, time_per_element,
+            chunked_times[-1], parallel_times[-1]
         ))
     
     # Построение графика
     plt.figure(figsize=(12, 8))
     plt.plot(sizes, times, 'bo-', label='Измеренное время')
+    plt.plot(sizes, chunked_times, 'gs-', label='chunked_sum')
+    plt.plot(sizes, parallel_times, 'r^-', label='parallel_sum')
     plt.xlabel('Размер массива (N)')
     plt.ylabel('Время выполнения (мс)')
     plt.title('Зависимость времени выполнения от размера\nСложность: O(N)')
@@ -152,8 +196,11 @@ def main() -> None:
     
     # Проверка на больших объемах данных
     print('4. Программа корректно обрабатывает большие объемы данных:')
-    print('   - Максимальный тестируемый размер: 500,000 элементов')
+    print(f'   - Максимальный тестируемый размер: {sizes[-1]:,} элементов')
     print('   - Время выполнения: {:.2f} мс'.format(times[-1]))
+    print('   - Ускорение chunked_sum: {:.1f}x, parallel_sum: {:.1f}x'.format(
+        times[-1] / chunked_times[-1], times[-1] / parallel_times[-1]
+    ))
     print('   - Потребление памяти: линейное O(N)')
 
 
@@ -0,0 +1,165 @@
+"""Блочное и многопроцессное суммирование больших массивов."""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работает путь через sum()
+    np = None
+
+CHUNK_SIZE = 1 << 16  # Элементов в блоке векторного суммирования
+PARALLEL_THRESHOLD = 1 << 21  # Меньшие массивы выгоднее суммировать в одном процессе
+LOW_MASK = 0xFFFFFFFF
+
+
+def _numpy_sum(data, chunk_size: int) -> int:
+    """Суммирует целочисленный массив NumPy блоками без переполнения.
+
+    64-битные значения раскладываются на старшие и младшие 32 бита:
+    сумма каждой половины по блоку из chunk_size <= 2^31 элементов
+    помещается в int64, а перенос между блоками накапливается в int
+    Python произвольной точности.
+
+    Сложность: O(N)
+    """
+    if data.dtype.kind not in 'iu':  # O(N) - не целые: сумма NumPy по всем осям
+        total = data.sum()
+        return total.item() if isinstance(total, np.generic) else total
+
+    flat = data.reshape(-1)  # O(1) - представление без копирования
+    total = 0
+    wide = data.dtype.itemsize == 8
+    acc = np.uint64 if data.dtype.kind == 'u' else np.int64
+
+    for start in range(0, flat.shape[0], chunk_size):  # O(N / chunk_size)
+        chunk = flat[start:start + chunk_size]  # O(1) - срез без копирования
+        if wide:
+            high = int(np.sum(chunk >> 32, dtype=acc))  # O(chunk_size)
+            low = int(np.sum(chunk & LOW_MASK, dtype=acc))  # O(chunk_size)
+            total += (high << 32) + low
+        else:
+            total += int(np.sum(chunk, dtype=acc))  # O(chunk_size)
+    return total
+
+
+def chunked_sum(data: Sequence[int], chunk_size: int = CHUNK_SIZE) -> int:
+    """Возвращает точную сумму списка, array или массива NumPy.
+
+    Массивы NumPy, а также array и memoryview (через NumPy без
+    копирования) суммируются векторно блоками по chunk_size (см.
+    _numpy_sum). Списки суммируются встроенной sum(): цикл выполняется
+    на уровне C, даёт результат произвольной точности и быстрее
+    упаковки элементов в блоки NumPy, поэтому chunk_size для них не
+    используется.
+
+    Сложность: O(N)
+
+    Args:
+        data: Список, array, memoryview или массив NumPy целых чисел
+        chunk_size: Размер блока для векторного суммирования буферов
+
+    Returns:
+        Сумма всех элементов
+    """
+    if chunk_size <= 0 or chunk_size > 1 << 31:
+        raise ValueError('chunk_size должен быть в диапазоне (0, 2^31]')
+    if np is not None and isinstance(data, (array, memoryview)):
+        buffer = np.asarray(data)  # O(1) - представление буфера без копирования
+        if buffer.dtype.kind in 'iu':
+            return _numpy_sum(buffer, chunk_size)
+    if np is not None and isinstance(data, np.ndarray):
+        return _numpy_sum(data, chunk_size)
+    return sum(data)  # O(N) - цикл на уровне C
+
+
+def _sum_shared_range(name: str, start: int, stop: int,
+                      chunk_size: int) -> int:
+    """Суммирует срез [start, stop) int64-буфера в разделяемой памяти.
+
+    Выполняется в дочернем процессе; данные не копируются.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast('q')
+    try:
+        if np is not None:
+            part = np.frombuffer(view, dtype=np.int64)[start:stop]
+            total = _numpy_sum(part, chunk_size)
+            del part
+        else:
+            total = sum(view[start:stop])  # O(stop - start)
+    finally:
+        view.release()
+        shm.close()
+    return total
+
+
+def _fill_shared(view, data) -> bool:
+    """Копирует data в int64-буфер. False, если значения не влезают в int64."""
+    if np is not None and isinstance(data, np.ndarray):
+        if data.dtype.kind not in 'iu':
+            return False
+        if data.dtype == np.uint64 and data.size and int(data.max()) >= 1 << 63:
+            return False
+        np.frombuffer(view, dtype=np.int64)[:] = data.reshape(-1)
+        return True
+    if not (isinstance(data, array) and data.typecode == 'q'):
+        try:
+            data = array('q', data)  # O(N) - упаковка в компактный буфер
+        except (OverflowError, TypeError):
+            return False
+    view[:] = memoryview(data)  # O(N) - memcpy
+    return True
+
+
+def parallel_sum(data: Sequence[int], workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE) -> int:
+    """Суммирует большой массив на нескольких ядрах.
+
+    Данные один раз копируются в разделяемую память (int64), после
+    чего каждый процесс пула суммирует свой срез без копирования.
+    Малые массивы и значения вне диапазона int64 суммируются в
+    текущем процессе через chunked_sum.
+
+    Сложность: O(N) работы, O(N / workers) на процесс
+
+    Args:
+        data: Список, array или массив NumPy целых чисел
+        workers: Число процессов (по умолчанию os.cpu_count())
+        chunk_size: Размер блока для векторного суммирования
+
+    Returns:
+        Сумма всех элементов
+    """
+    workers = workers or os.cpu_count() or 1
+    if np is not None and isinstance(data, np.ndarray):
+        n = data.size  # Все элементы, а не число строк многомерного массива
+    else:
+        n = len(data)
+    if workers == 1 or n < PARALLEL_THRESHOLD:
+        return chunked_sum(data, chunk_size)
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    # Ядро ОС может округлить размер сегмента вверх до страницы
+    raw = shm.buf[:n * 8]
+    view = raw.cast('q')
+    try:
+        if not _fill_shared(view, data):
+            return chunked_sum(data, chunk_size)
+
+        step = -(-n // workers)  # Округление вверх
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_sum_shared_range, shm.name, start,
+                            min(start + step, n), chunk_size)
+                for start in range(0, n, step)
+            ]
+            return sum(future.result() for future in futures)
+    finally:
+        view.release()
+        raw.release()
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,146 @@
+# test_sum_analysis.py
+# Юнит-тесты для вспомогательных модулей лабораторной работы 00
+
+import os
+import tempfile
+import unittest
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from range_sum import FenwickTree, PrefixSumIndex
+from stream_reader import IntStreamReader, stream_sum
+from sum_engine import PARALLEL_THRESHOLD, chunked_sum, parallel_sum
+
+
+class TestIntStreamReader(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.txt')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def test_small_chunks_split_numbers(self):
+        numbers = list(range(-500, 1500, 7))
+        self.write('\n'.join(map(str, numbers)) + '\n')
+        # Окно меньше длины числа: числа разрезаются границами окон
+        reader = IntStreamReader(self.path, chunk_size=3)
+        self.assertEqual(list(reader), numbers)
+        self.assertEqual(reader.numbers_parsed, len(numbers))
+        self.assertEqual(reader.bytes_parsed, os.path.getsize(self.path))
+
+    def test_no_trailing_newline(self):
+        self.write('10 20\t30\r\n40 50')
+        self.assertEqual(list(IntStreamReader(self.path, chunk_size=4)),
+                         [10, 20, 30, 40, 50])
+        self.assertEqual(stream_sum(self.path, chunk_size=4), 150)
+
+    def test_vertical_tab_and_form_feed_separators(self):
+        numbers = list(range(100, 160))
+        self.write('\x0b'.join(map(str, numbers[:30])) + '\x0c'
+                   + '\x0c'.join(map(str, numbers[30:])))
+        reader = IntStreamReader(self.path, chunk_size=8)
+        blocks = list(reader.blocks())
+        self.assertEqual([n for block in blocks for n in block], numbers)
+        self.assertGreater(len(blocks), 20)  # Окна режутся по \x0b и \x0c
+
+    def test_empty_file(self):
+        self.write('')
+        self.assertEqual(list(IntStreamReader(self.path)), [])
+
+    def test_invalid_data(self):
+        self.write('1 2 abc 4')
+        with self.assertRaises(ValueError):
+            list(IntStreamReader(self.path))
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            list(IntStreamReader(self.path + '.missing'))
+
+
+class TestSumEngine(unittest.TestCase):
+    def test_chunked_sum_inputs(self):
+        data = list(range(-1000, 5000))
+        self.assertEqual(chunked_sum(data), sum(data))
+        self.assertEqual(chunked_sum(array('q', data), chunk_size=7), sum(data))
+        self.assertEqual(chunked_sum([]), 0)
+
+    def test_chunked_sum_buffers(self):
+        data = array('q', [2**62, 2**62, 2**62, -5, 7])
+        self.assertEqual(chunked_sum(data, chunk_size=2), sum(data))
+        self.assertEqual(chunked_sum(memoryview(array('i', [-3, 4, 5]))), 6)
+
+    @unittest.skipIf(np is None, 'NumPy не установлен')
+    def test_chunked_sum_float_matrix(self):
+        grid = np.arange(12, dtype=np.float64).reshape(3, 4) / 2
+        self.assertEqual(chunked_sum(grid), 33.0)
+
+    def test_chunked_sum_big_integers(self):
+        data = [2**63 - 1] * 10 + [2**80]
+        self.assertEqual(chunked_sum(data), sum(data))
+
+    def test_chunked_sum_invalid_chunk(self):
+        with self.assertRaises(ValueError):
+            chunked_sum([1, 2], chunk_size=0)
+
+    def test_parallel_sum_matches(self):
+        data = array('q', range(-5, PARALLEL_THRESHOLD + 3))
+        self.assertEqual(parallel_sum(data, workers=2), sum(data))
+
+    @unittest.skipIf(np is None, 'NumPy не установлен')
+    def test_parallel_sum_matrix(self):
+        rows = PARALLEL_THRESHOLD + 1  # Строк больше порога: параллельный путь
+        data = np.arange(rows * 2, dtype=np.int64).reshape(rows, 2) - 7
+        self.assertEqual(parallel_sum(data, workers=2), int(data.sum()))
+
+    def test_parallel_sum_overflow_falls_back(self):
+        data = [1] * PARALLEL_THRESHOLD + [2**70]
+        self.assertEqual(parallel_sum(data, workers=2), PARALLEL_THRESHOLD + 2**70)
+
+
+class TestRangeSum(unittest.TestCase):
+    def setUp(self):
+        self.data = [5, -3, 8, 0, 12, 7, -1, 4, 9]
+
+    def test_prefix_and_fenwick_match_slices(self):
+        prefix = PrefixSumIndex(self.data)
+        fenwick = FenwickTree(self.data)
+        n = len(self.data)
+        for lo in range(n + 1):
+            for hi in range(lo, n + 1):
+                expected = sum(self.data[lo:hi])
+                self.assertEqual(prefix.range_sum(lo, hi), expected)
+                self.assertEqual(fenwick.range_sum(lo, hi), expected)
+
+    def test_fenwick_updates(self):
+        fenwick = FenwickTree(self.data)
+        fenwick.add(3, 10)
+        fenwick.update(0, -5)
+        self.data[3] += 10
+        self.data[0] = -5
+        self.assertEqual(fenwick.range_sum(0, len(self.data)), sum(self.data))
+        self.assertEqual(fenwick.prefix_sum(4), sum(self.data[:4]))
+
+    def test_fenwick_overflow_switches_to_big_integers(self):
+        fenwick = FenwickTree([2**62, 2**62, 1])
+        self.assertEqual(fenwick.range_sum(0, 3), 2**63 + 1)
+        fenwick.add(2, 2**63)
+        self.assertEqual(fenwick.range_sum(2, 3), 2**63 + 1)
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            PrefixSumIndex(self.data).range_sum(3, 2)
+        with self.assertRaises(IndexError):
+            FenwickTree(self.data).add(len(self.data), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Дополнительные стратегии поиска в отсортированном массиве и
+адаптивный выбор между ними.
+
+Все функции имеют сигнатуру search(arr, target) -> Optional[int],
+как linear_search и binary_search.
+"""
+
+import random
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence
+
+SearchFunc = Callable[[Sequence[int], int], Optional[int]]
+
+
+def interpolation_search(arr: Sequence[int], target: int) -> Optional[int]:
+    """
+    Интерполяционный поиск: позиция пробы вычисляется по значению.
+
+    Сложность: O(log log n) для равномерных данных, O(n) в худшем случае
+    """
+    low = 0  # O(1) - присваивание
+    high = len(arr) - 1  # O(1) - присваивание
+
+    while low <= high and arr[low] <= target <= arr[high]:  # O(log log n) в среднем
+        if arr[high] == arr[low]:  # O(1) - все значения отрезка равны
+            return low if arr[low] == target else None
+        pos = low + (target - arr[low]) * (high - low) // (arr[high] - arr[low])  # O(1)
+        if arr[pos] == target:  # O(1) - сравнение
+            return pos
+        elif arr[pos] < target:  # O(1) - сравнение
+            low = pos + 1  # O(1)
+        else:
+            high = pos - 1  # O(1)
+
+    return None  # O(1) - возврат None
+# Общая сложность: O(log log n) в среднем, O(n) в худшем
+
+
+def exponential_search(arr: Sequence[int], target: int) -> Optional[int]:
+    """
+    Экспоненциальный (галопирующий) поиск: удвоение границы, затем
+    бинарный поиск в найденном отрезке.
+
+    Сложность: O(log i), где i - позиция цели
+    """
+    n = len(arr)  # O(1) - длина массива
+    if n == 0:  # O(1) - пустой массив
+        return None
+
+    bound = 1  # O(1) - граница галопа
+    while bound < n and arr[bound] < target:  # O(log i) - удвоение
+        bound *= 2  # O(1)
+
+    low = bound // 2  # O(1) - начало отрезка
+    high = min(bound + 1, n)  # O(1) - конец отрезка (не включая)
+    i = bisect_left(arr, target, low, high)  # O(log i) - бинарный поиск
+    if i < n and arr[i] == target:  # O(1) - проверка совпадения
+        return i
+    return None  # O(1) - возврат None
+# Общая сложность: O(log i)
+
+
+def interpolation_sequential_search(arr: Sequence[int],
+                                    target: int) -> Optional[int]:
+    """
+    Интерполяционно-последовательный поиск: одна интерполяционная
+    проба, затем последовательный просмотр в сторону цели.
+
+    Сложность: O(sqrt n) в среднем для равномерных данных, O(n) в худшем
+    """
+    n = len(arr)  # O(1) - длина массива
+    if n == 0 or not arr[0] <= target <= arr[-1]:  # O(1) - вне диапазона
+        return None
+    if arr[-1] == arr[0]:  # O(1) - все значения равны
+        return 0
+
+    pos = (target - arr[0]) * (n - 1) // (arr[-1] - arr[0])  # O(1) - проба
+    if arr[pos] < target:  # O(1) - идём вправо
+        while arr[pos] < target:  # O(|pos - i|)
+            pos += 1  # O(1)
+    else:  # O(1) - идём влево к первому вхождению
+        while pos > 0 and arr[pos - 1] >= target:  # O(|pos - i|)
+            pos -= 1  # O(1)
+
+    return pos if arr[pos] == target else None  # O(1)
+# Общая сложность: O(sqrt n) в среднем
+
+
+STRATEGIES: Dict[str, SearchFunc] = {
+    'interpolation': interpolation_search,
+    'exponential': exponential_search,
+    'interpolation_sequential': interpolation_sequential_search,
+}
+
+# Стратегии, которые угадывают позицию по значению: на неравномерных
+# (тяжелохвостых) данных их проба промахивается и они деградируют к O(n)
+INTERPOLATING = {'interpolation', 'interpolation_sequential'}
+SKEW_LIMIT = 0.05  # distribution_skew, выше которого они не рассматриваются
+
+
+def distribution_skew(arr: Sequence[int], samples: int = 64) -> float:
+    """
+    Отклонение распределения значений от равномерного.
+
+    Сравнивает значения в samples равноотстоящих позициях с прямой
+    между arr[0] и arr[-1]. 0 - идеально равномерно, 1 - максимум.
+
+    Сложность: O(samples)
+    """
+    n = len(arr)  # O(1)
+    if n < 3 or arr[-1] == arr[0]:  # O(1) - вырожденный случай
+        return 0.0
+    span = arr[-1] - arr[0]  # O(1) - диапазон значений
+    worst = 0.0  # O(1)
+    for k in range(1, samples):  # O(samples) - выборка позиций
+        i = k * (n - 1) // samples  # O(1)
+        expected = arr[0] + span * i / (n - 1)  # O(1) - значение при равномерности
+        worst = max(worst, abs(arr[i] - expected) / span)  # O(1)
+    return worst  # O(1)
+
+
+class SearchStrategySelector:
+    """Выбирает самую быструю стратегию поиска для конкретного массива.
+
+    При создании один раз снимает выборку значений массива
+    (distribution_skew): если распределение дальше от равномерного, чем
+    SKEW_LIMIT, интерполяционные стратегии исключаются без замеров.
+    Оставшиеся кандидаты прогоняются на наборе пробных запросов;
+    дальнейшие запросы обслуживает победитель.
+    """
+
+    def __init__(self, arr: Sequence[int],
+                 strategies: Optional[Dict[str, SearchFunc]] = None,
+                 sample_queries: int = 200, seed: int = 0):
+        """
+        Args:
+            arr: Отсортированный массив
+            strategies: Кандидаты {имя: функция}, по умолчанию STRATEGIES
+            sample_queries: Число пробных запросов на стратегию
+            seed: Зерно для выборки пробных запросов
+        """
+        self.arr = arr
+        self.strategies = dict(strategies or STRATEGIES)
+        self.skew = distribution_skew(arr)  # O(1) - выборка значений
+        self.candidates = self._prune()
+        self.timings: Dict[str, float] = {}
+        self.strategy = self._calibrate(sample_queries, seed)
+        self._search = self.strategies[self.strategy]
+
+    def _prune(self) -> List[str]:
+        """Кандидаты для замеров: без интерполяции на скошенных данных."""
+        names = list(self.strategies)
+        if self.skew > SKEW_LIMIT:
+            kept = [name for name in names if name not in INTERPOLATING]
+            if kept:  # Если остались только интерполяционные - замеряем их
+                return kept
+        return names
+
+    def _calibrate(self, sample_queries: int, seed: int) -> str:
+        """Замеряет стратегии на пробных запросах и возвращает лучшую.
+
+        Сложность: O(k * q * T(n)), k - число стратегий, q - запросов
+        """
+        arr = self.arr
+        if not arr:
+            return self.candidates[0]
+        rng = random.Random(seed)
+        queries: List[int] = rng.choices(arr, k=sample_queries // 2)  # Попадания
+        queries += [rng.randint(arr[0], arr[-1])
+                    for _ in range(sample_queries - len(queries))]  # Случайные значения
+
+        for name in self.candidates:  # O(k)
+            search = self.strategies[name]
+            best = float('inf')
+            for _ in range(3):  # Минимум из трёх прогонов гасит шум
+                start = time.perf_counter()
+                for target in queries:  # O(q)
+                    search(arr, target)
+                best = min(best, time.perf_counter() - start)
+            self.timings[name] = best / len(queries)
+        return min(self.timings, key=self.timings.get)
+
+    def search(self, target: int) -> Optional[int]:
+        """Поиск выбранной стратегией."""
+        return self._search(self.arr, target)
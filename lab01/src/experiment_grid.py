@@ -0,0 +1,213 @@
+"""
+Параллельный запуск сетки экспериментов (размер, тип цели, алгоритм).
+
+- Каждая ячейка получает детерминированное зерно, поэтому повторный
+  запуск воспроизводит те же массивы и цели.
+- Отсортированные массивы генерируются один раз на размер и кэшируются
+  на диске как сырые int64-файлы. Процессы пула отображают их в память
+  (mmap) и читают через memoryview без копирования.
+- Результаты пишутся в JSON Lines по мере завершения ячеек; при
+  повторном запуске уже посчитанные ячейки пропускаются.
+
+Запуск полной сетки (до 10^7 элементов):
+
+    python experiment_grid.py --workers 4 --out grid_results.jsonl
+"""
+
+import argparse
+import importlib
+import json
+import mmap
+import os
+import random
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from common.timing import measure_batched
+
+GRID_SIZES = [1000, 10000, 100000, 1000000, 10000000]
+TARGET_TYPES = ['first', 'last', 'middle', 'missing', 'random']
+# Алгоритмы задаются именем модуля и функции: так их можно передать в
+# дочерний процесс без pickle функций (и без зависимости от __main__)
+ALGORITHMS: Dict[str, Tuple[str, str]] = {
+    'linear': ('search_comparison', 'linear_search'),
+    'binary': ('search_comparison', 'binary_search'),
+    'interpolation': ('adaptive_search', 'interpolation_search'),
+    'exponential': ('adaptive_search', 'exponential_search'),
+}
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'lab01_arrays')
+
+_mapped: Dict[str, Tuple[mmap.mmap, memoryview]] = {}  # Кэш отображений процесса
+
+
+def cell_seed(seed: int, *parts) -> int:
+    """Детерминированное зерно ячейки (не зависит от PYTHONHASHSEED)."""
+    key = ':'.join(str(part) for part in (seed, *parts))
+    return zlib.crc32(key.encode())
+
+
+def cached_array_path(size: int, seed: int = 0,
+                      cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    """Возвращает путь к кэшу массива размера size, создавая его при необходимости.
+
+    Массив - отсортированная выборка size различных чисел из [0, 3 * size),
+    как в generate_sorted_array. Файл записывается во временный и
+    переименовывается атомарно, поэтому параллельные запуски не видят
+    недописанных данных.
+
+    Сложность: O(n log n) при первом вызове, O(1) далее
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f'sorted_{size}_{seed}.i64')
+    if os.path.exists(path):
+        return path
+
+    rng = np.random.default_rng(cell_seed(seed, size))
+    values = np.sort(rng.choice(3 * size, size=size, replace=False))
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as file:
+        file.write(values.astype(np.int64).tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def open_cached_array(path: str) -> memoryview:
+    """Отображает файл кэша в память и возвращает memoryview int64.
+
+    Отображение переиспользуется в пределах процесса; страницы файла
+    делятся между всеми процессами через кэш ОС.
+    """
+    if path not in _mapped:
+        with open(path, 'rb') as file:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        _mapped[path] = (mm, memoryview(mm).cast('q'))
+    return _mapped[path][1]
+
+
+def pick_target(arr: Sequence[int], target_type: str, seed: int) -> int:
+    """Цель поиска для типа ячейки."""
+    if target_type == 'first':
+        return arr[0]
+    if target_type == 'last':
+        return arr[-1]
+    if target_type == 'middle':
+        return arr[len(arr) // 2]
+    if target_type == 'random':
+        return arr[random.Random(seed).randrange(len(arr))]
+    if target_type == 'missing':
+        return -1
+    raise ValueError(f'Unknown target type: {target_type}')
+
+
+def run_cell(path: str, size: int, target_type: str, algorithm: str,
+             seed: int) -> dict:
+    """Замеряет одну ячейку сетки. Выполняется в процессе пула."""
+    module_name, func_name = ALGORITHMS[algorithm]
+    search = getattr(importlib.import_module(module_name), func_name)
+    arr = open_cached_array(path)
+    target = pick_target(arr, target_type, seed)
+    result = measure_batched(search, arr, target, warmup=1, min_repeats=3,
+                             max_time=0.5)  # Медленный поиск - без пакетов
+    return {
+        'size': size,
+        'target_type': target_type,
+        'algorithm': algorithm,
+        'seed': seed,
+        'found': search(arr, target) is not None,
+        **result.as_dict(),
+    }
+
+
+def _load_done(out_path: str) -> Dict[Tuple[int, str, str], dict]:
+    """Читает уже посчитанные ячейки из JSON Lines."""
+    done = {}
+    if os.path.exists(out_path):
+        with open(out_path) as file:
+            for line in file:
+                if line.strip():
+                    row = json.loads(line)
+                    done[(row['size'], row['target_type'], row['algorithm'])] = row
+    return done
+
+
+def run_grid(sizes: Iterable[int] = GRID_SIZES,
+             target_types: Iterable[str] = TARGET_TYPES,
+             algorithms: Iterable[str] = ('linear', 'binary'),
+             workers: Optional[int] = None, seed: int = 0,
+             cache_dir: str = DEFAULT_CACHE_DIR,
+             out_path: str = 'grid_results.jsonl',
+             resume: bool = True) -> List[dict]:
+    """Запускает сетку экспериментов на пуле процессов.
+
+    Args:
+        sizes: Размеры массивов
+        target_types: Типы целей ('first', 'last', 'middle', 'missing', 'random')
+        algorithms: Имена алгоритмов из ALGORITHMS
+        workers: Число процессов (по умолчанию os.cpu_count())
+        seed: Базовое зерно эксперимента
+        cache_dir: Каталог кэша массивов
+        out_path: Файл JSON Lines для потоковой записи результатов
+        resume: Пропускать ячейки, уже записанные в out_path
+
+    Returns:
+        Строки результатов всех ячеек сетки
+    """
+    sizes, target_types = list(sizes), list(target_types)
+    algorithms = list(algorithms)
+    done = _load_done(out_path) if resume else {}
+    paths = {size: cached_array_path(size, seed, cache_dir) for size in sizes}
+
+    rows, cells = [], []
+    for size in sizes:
+        for target_type in target_types:
+            for algorithm in algorithms:
+                key = (size, target_type, algorithm)
+                row = done.get(key)
+                # Ячейка из файла засчитывается, только если зерно совпадает
+                if row and row['seed'] == cell_seed(seed, *key):
+                    rows.append(row)
+                else:
+                    cells.append(key)
+
+    mode = 'a' if resume else 'w'
+    with open(out_path, mode) as out, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_cell, paths[size], size, target_type, algorithm,
+                        cell_seed(seed, size, target_type, algorithm))
+            for size, target_type, algorithm in cells
+        ]
+        for future in as_completed(futures):
+            row = future.result()
+            out.write(json.dumps(row) + '\n')
+            out.flush()  # Строка на диске сразу после завершения ячейки
+            rows.append(row)
+            print('{size:>10} {target_type:>8} {algorithm:>14} '
+                  '{median:.3e} с'.format(**row))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Параллельная сетка поиска')
+    parser.add_argument('--sizes', type=int, nargs='+', default=GRID_SIZES)
+    parser.add_argument('--algorithms', nargs='+', default=['linear', 'binary'],
+                        choices=sorted(ALGORITHMS))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--out', default='grid_results.jsonl')
+    parser.add_argument('--no-resume', action='store_true')
+    args = parser.parse_args()
+
+    run_grid(args.sizes, TARGET_TYPES, args.algorithms, args.workers,
+             args.seed, args.cache_dir, args.out, not args.no_resume)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Обученный (learned) кусочно-линейный индекс для отсортированных массивов.
+
+Модель приближает функцию ключ -> позиция набором отрезков прямых
+так, что ошибка предсказания на каждом ключе не превышает epsilon.
+Поиск: бинарный поиск по первым ключам отрезков, предсказание позиции
+и бинарный поиск в окне шириной 2 * epsilon + 3 вокруг неё.
+
+Для почти равномерных ключей (как у generate_sorted_array) отрезков
+очень мало, а окно поиска не зависит от n.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Sequence
+
+
+class PiecewiseLinearIndex:
+    """Кусочно-линейная модель позиции ключа с ограниченной ошибкой.
+
+    Построение: O(n) за один проход (алгоритм «сужающегося конуса»).
+    Поиск: O(log s + log epsilon), s - число отрезков.
+    Память: ключи + 3 числа на отрезок.
+    """
+
+    def __init__(self, sorted_keys: Sequence[int], epsilon: int = 32):
+        """
+        Args:
+            sorted_keys: Отсортированный по неубыванию массив ключей
+            epsilon: Допустимая ошибка предсказания позиции
+        """
+        if epsilon < 1:
+            raise ValueError('epsilon должен быть не меньше 1')
+        self.epsilon = epsilon
+        self._keys = array('q', sorted_keys)  # O(n) - компактная копия
+        self._seg_keys = array('q')  # Первый ключ отрезка
+        self._seg_pos = array('q')  # Позиция первого ключа отрезка
+        self._seg_slope = array('d')  # Наклон прямой
+        self._fit()
+
+    def _fit(self) -> None:
+        """Жадно разбивает ключи на отрезки с ошибкой не больше epsilon.
+
+        Для текущего отрезка хранится конус допустимых наклонов
+        [low, high]; каждый новый ключ сужает его. Когда конус
+        становится пустым, начинается новый отрезок. Повторы ключа
+        пропускаются: модель предсказывает первое вхождение, и поиск
+        возвращает его.
+
+        Сложность: O(n)
+        """
+        keys = self._keys  # O(1) - локальная ссылка
+        eps = self.epsilon  # O(1)
+        if not keys:  # O(1) - пустой массив
+            return
+        x0, y0 = keys[0], 0  # O(1) - начало отрезка
+        low, high = 0.0, float('inf')  # O(1) - конус наклонов
+
+        for y in range(1, len(keys)):  # O(n) - единственный проход
+            if keys[y] == keys[y - 1]:  # O(1) - модель учит первые вхождения
+                continue
+            dx = keys[y] - x0  # O(1) - всегда > 0
+            new_low = max(low, (y - y0 - eps) / dx)  # O(1)
+            new_high = min(high, (y - y0 + eps) / dx)  # O(1)
+            if new_low <= new_high:  # O(1) - точка помещается в конус
+                low, high = new_low, new_high
+                continue
+            self._close_segment(x0, y0, low, high)  # O(1)
+            x0, y0 = keys[y], y  # O(1) - новый отрезок
+            low, high = 0.0, float('inf')  # O(1)
+
+        self._close_segment(x0, y0, low, high)  # O(1) - последний отрезок
+
+    def _close_segment(self, x0: int, y0: int, low: float,
+                       high: float) -> None:
+        """Сохраняет отрезок с наклоном из середины конуса. O(1)"""
+        slope = low if high == float('inf') else (low + high) / 2
+        self._seg_keys.append(x0)
+        self._seg_pos.append(y0)
+        self._seg_slope.append(slope)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def segments(self) -> int:
+        """Количество отрезков модели."""
+        return len(self._seg_keys)
+
+    @property
+    def model_bytes(self) -> int:
+        """Размер модели (без самих ключей) в байтах."""
+        return sum(len(a) * a.itemsize
+                   for a in (self._seg_keys, self._seg_pos, self._seg_slope))
+
+    def predict(self, target: int) -> int:
+        """Предсказанная позиция target в массиве ключей.
+
+        Сложность: O(log s)
+        """
+        seg = bisect_right(self._seg_keys, target) - 1  # O(log s) - отрезок
+        if seg < 0:  # O(1) - левее первого ключа
+            return 0
+        pos = self._seg_pos[seg] + self._seg_slope[seg] * (target - self._seg_keys[seg])
+        return min(max(int(round(pos)), 0), len(self._keys) - 1)  # O(1)
+
+    def search(self, target: int) -> Optional[int]:
+        """Позиция target в отсортированном массиве или None.
+
+        Сложность: O(log s + log epsilon)
+        """
+        keys = self._keys  # O(1)
+        if not keys:  # O(1)
+            return None
+        pos = self.predict(target)  # O(log s)
+        lo = max(pos - self.epsilon - 1, 0)  # O(1) - окно с учётом округления
+        hi = min(pos + self.epsilon + 2, len(keys))  # O(1)
+        i = bisect_left(keys, target, lo, hi)  # O(log epsilon)
+        if i < len(keys) and keys[i] == target:  # O(1)
+            return i
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Размер модели и фактическая максимальная ошибка предсказания.
+
+        Ошибка считается для первого вхождения каждого ключа.
+
+        Сложность: O(n log s)
+        """
+        max_error = 0  # O(1)
+        keys = self._keys  # O(1)
+        for i in range(len(keys)):  # O(n)
+            if i and keys[i] == keys[i - 1]:  # O(1) - повтор ключа
+                continue
+            max_error = max(max_error, abs(self.predict(keys[i]) - i))  # O(log s)
+        return {
+            'keys': len(keys),
+            'segments': self.segments,
+            'model_bytes': self.model_bytes,
+            'epsilon': self.epsilon,
+            'max_error': max_error,
+        }
@@ -1,7 +1,16 @@
-import time
+import os
+import sys
 import random
-from typing import List, Optional
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+import numpy as np
 import matplotlib.pyplot as plt
+from search_index import BlockedIndex, EytzingerIndex, generate_compact_sorted
+from learned_index import PiecewiseLinearIndex
+from adaptive_search import STRATEGIES, SearchStrategySelector
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from common.timing import measure, measure_batched
 
 
 def linear_search(arr: List[int], target: int) -> Optional[int]:
@@ -35,37 +44,242 @@ def binary_search(arr: List[int], target: int) -> Optional[int]:
 # Общая сложность: O(log n)
 
 
+def _keys_as(targets: Sequence, dtype: np.dtype):
+    """
+    Запросы в типе элементов массива.
+    
+    Если приведение теряет значения (2.5 -> 2, 2**70 вне int64), такие
+    цели не должны находиться: возвращается маска точно приведённых.
+    
+    Returns:
+        (запросы в dtype, маска точных или None, если потерь нет)
+    """
+    keys = np.asarray(targets)  # O(m) - тип по самим значениям
+    if np.can_cast(keys.dtype, dtype):  # O(1) - приведение без потерь
+        return keys.astype(dtype, copy=False), None
+    if keys.dtype == object:  # O(m) - длинные целые и т.п. поэлементно
+        cast, exact = [], []
+        for target in keys.tolist():  # O(m)
+            try:
+                value = dtype.type(target)  # O(1)
+                same = bool(value == target)  # O(1)
+            except (OverflowError, TypeError, ValueError):
+                value, same = dtype.type(0), False  # O(1) - вне диапазона
+            cast.append(value)
+            exact.append(same)
+        return np.array(cast, dtype=dtype), np.array(exact, dtype=bool)
+    with np.errstate(invalid='ignore', over='ignore'):  # O(m) - NaN, переполнение
+        cast = keys.astype(dtype)
+        return cast, cast == keys  # O(m) - сравнение в общем типе
+# Общая сложность: O(m)
+
+
+def binary_search_many(arr: Sequence[int],
+                       targets: Sequence[int]) -> List[Optional[int]]:
+    """
+    Пакетный поиск множества целей в отсортированном массиве.
+    
+    Запросы сортируются и обрабатываются одним проходом слева направо:
+    нижняя граница поиска для следующего запроса не меньше позиции
+    предыдущего, поэтому массив просматривается монотонно. Для массивов
+    NumPy используется векторизованный np.searchsorted.
+    
+    Для массивов без повторов (как у generate_sorted_array) результат
+    совпадает с [binary_search(arr, t) for t in targets]; при повторах
+    возвращается индекс первого вхождения.
+    """
+    if isinstance(arr, np.ndarray):  # O(1) - проверка типа буфера
+        keys, exact = _keys_as(targets, arr.dtype)  # O(m) - массив запросов
+        pos = np.searchsorted(arr, keys)  # O(m log n) - векторизованно
+        hit = pos < arr.shape[0]  # O(m) - маска попаданий в границы
+        if exact is not None:  # O(m) - непредставимые в arr.dtype цели - промахи
+            hit &= exact
+        hit[hit] = arr[pos[hit]] == keys[hit]  # O(m) - проверка совпадений
+        return [p if h else None  # O(m) - сборка ответа
+                for p, h in zip(pos.tolist(), hit.tolist())]
+    
+    targets = list(targets)  # O(m) - допускаем любые итерируемые
+    order = sorted(range(len(targets)), key=targets.__getitem__)  # O(m log m)
+    result: List[Optional[int]] = [None] * len(targets)  # O(m) - ответы
+    n = len(arr)  # O(1) - длина массива
+    low = 0  # O(1) - монотонная нижняя граница
+    
+    for i in order:  # O(m) - запросы по возрастанию
+        low = bisect_left(arr, targets[i], low)  # O(log(n - low)) - поиск справа от low
+        if low < n and arr[low] == targets[i]:  # O(1) - проверка совпадения
+            result[i] = low  # O(1) - запись ответа на исходное место
+    
+    return result  # O(1) - возврат результата
+# Общая сложность: O(m log m + m log n)
+
+
 def generate_sorted_array(size: int) -> List[int]:
     """Генерация отсортированного массива целых чисел."""
     return sorted(random.sample(range(size*3), size))  # O(n log n) сортировка
 # Общая сложность: O(n log n)
 
 
+def generate_skewed_array(size: int, alpha: float = 1.1) -> List[int]:
+    """Генерация отсортированного массива с неравномерным распределением.
+    
+    Шаги между соседними значениями берутся из распределения Парето:
+    большинство шагов маленькие, редкие - огромные, поэтому значения
+    собираются в плотные кластеры. Повторов нет (шаг >= 1).
+    """
+    arr = []  # O(1) - результат
+    value = 0  # O(1) - текущее значение
+    for _ in range(size):  # O(n) - цикл по элементам
+        value += int(random.paretovariate(alpha))  # O(1) - шаг >= 1
+        arr.append(value)  # O(1) - добавление
+    return arr  # O(1) - возврат
+# Общая сложность: O(n)
+
+
 def measure_time(search_func, arr: List[int], target: int, 
                  iterations: int = 100) -> float:
-    """Измерение среднего времени выполнения функции поиска."""
-    total_time = 0.0  # O(1) - присваивание
+    """Измерение медианного времени выполнения функции поиска (секунды).
+    
+    Замер выполняет common.timing.measure_batched: один замер - пакет
+    из K вызовов в развёрнутом цикле (K подбирается так, чтобы замер
+    был заметно длиннее разрешения таймера), из которого вычитается
+    время пустого цикла. Для O(log n) поиска это убирает стоимость
+    таймера, которая сравнима с самим поиском. Линейный поиск на
+    большом массиве длится дольше одного замера - его measure_batched
+    измеряет поштучно, без пакетов. iterations ограничивает число
+    замеров.
+    """
+    result = measure_batched(search_func, arr, target,  # O(r * K * complexity)
+                             warmup=1, min_repeats=3,
+                             max_repeats=max(iterations, 3), max_time=0.5)
+    return result.median  # O(1) медиана времени одного вызова
+# Общая сложность: O(iterations * K * complexity(search_func))
+
+
+def measure_throughput(arr: Sequence[int], targets: List[int]) -> Dict[str, float]:
+    """Пропускная способность поиска (запросов в секунду)."""
+    def single_loop():  # O(m log n) - по одному вызову на цель
+        for target in targets:  # O(m) - цикл по запросам
+            binary_search(arr, target)  # O(log n) - отдельный вызов
+    
+    buffer = np.asarray(arr)  # O(n) - копия в буфер NumPy
+    m = len(targets)  # O(1)
+    single = measure(single_loop, warmup=1, min_repeats=3,  # O(r * m log n)
+                     max_time=1.0)
+    batched = measure(binary_search_many, arr, targets,  # O(r * m log n)
+                      warmup=1, min_repeats=3, max_time=1.0)
+    vectorized = measure(binary_search_many, buffer, targets,  # O(r * m log n)
+                         warmup=1, min_repeats=3, max_time=1.0)
+    return {  # O(1) - запросов в секунду по медиане
+        'binary': m / single.median,
+        'batched': m / batched.median,
+        'numpy': m / vectorized.median,
+    }
+# Общая сложность: O(r * m log n), r - число повторов
+
+
+LAYOUT_SIZES = [10**4, 10**5, 10**6, 10**7]  # O(1) - по умолчанию до 10^7 ключей
+LARGE_LAYOUT_SIZES = LAYOUT_SIZES + [10**8]  # O(1) - только по флагу --large-layouts
+
+
+def compare_layouts(sizes: Sequence[int] = LAYOUT_SIZES,
+                    lookups: int = 20000) -> Dict[str, List[float]]:
+    """Время одного поиска (секунды) для разных раскладок массива.
+    
+    Ключи хранятся в компактных array('q'): при n = 10^8 это ~800 МБ
+    на массив, поэтому индексы строятся и освобождаются по очереди.
+    """
+    times = {name: [] for name in ('binary', 'eytzinger', 'blocked')}  # O(1)
+    
+    for size in sizes:  # O(s) - цикл по размерам
+        keys = generate_compact_sorted(size)  # O(n) - компактный массив
+        queries = random.choices(keys, k=lookups // 2)  # O(q) - попадания
+        queries += [key + 1 for key in queries]  # O(q) - в основном промахи
+        random.shuffle(queries)  # O(q) - перемешивание
+        
+        searches = {  # O(n) - построение индексов
+            'binary': lambda target: binary_search(keys, target),
+            'eytzinger': EytzingerIndex(keys).search,
+            'blocked': BlockedIndex(keys).search,
+        }
+        for name, search in searches.items():  # O(3) - цикл по раскладкам
+            def lookup_all():  # O(q log n)
+                for target in queries:  # O(q) - цикл по запросам
+                    search(target)  # O(log n) - один поиск
+            
+            result = measure(lookup_all, warmup=1, min_repeats=3,  # O(r * q log n)
+                             max_time=2.0)
+            times[name].append(result.median / len(queries))  # O(1)
+        
+        print('{:>11,} {:>12.3f} {:>12.3f} {:>12.3f}'.format(  # O(1) - вывод в мкс
+            size, *(times[name][-1] * 1e6 for name in times)))
+        del searches, keys  # O(1) - освобождение памяти перед следующим размером
+    
+    return times  # O(1) - возврат
+# Общая сложность: O(s * (n + r * q log n))
+
+
+def compare_strategies(sizes: Sequence[int],
+                       lookups: int = 2000) -> Dict[str, Dict[str, List[float]]]:
+    """Время одного поиска (секунды) для стратегий на равномерных и
+    скошенных массивах, а также выбор SearchStrategySelector."""
+    strategies = {'binary': binary_search, **STRATEGIES}  # O(1) - кандидаты
+    generators = {'uniform': generate_sorted_array,  # O(1)
+                  'skewed': generate_skewed_array}
+    results = {}  # O(1)
     
-    for _ in range(iterations):  # O(iterations) - цикл по iterations
-        start_time = time.perf_counter()  # O(1) - вызов функции
-        search_func(arr, target)          # O(complexity) - вызов поиска
-        end_time = time.perf_counter()    # O(1) - вызов функции
-        total_time += (end_time - start_time)  # O(1) - сложение
+    for kind, generate in generators.items():  # O(2) - типы распределений
+        results[kind] = {name: [] for name in strategies}  # O(1)
+        results[kind]['selected'] = []  # O(1) - выбор селектора
+        for size in sizes:  # O(m) - цикл по размерам
+            arr = generate(size)  # O(n log n) - генерация массива
+            queries = random.choices(arr, k=lookups // 2)  # O(q) - попадания
+            queries += [random.randint(arr[0], arr[-1])  # O(q) - в основном промахи
+                        for _ in range(lookups // 2)]
+            
+            for name, search in strategies.items():  # O(k) - цикл по стратегиям
+                def lookup_all():  # O(q * T(n))
+                    for target in queries:  # O(q)
+                        search(arr, target)  # O(T(n))
+                
+                result = measure(lookup_all, warmup=1, min_repeats=3,  # O(r * q * T(n))
+                                 max_time=1.0)
+                results[kind][name].append(result.median / len(queries))  # O(1)
+            
+            selector = SearchStrategySelector(arr, strategies)  # O(k * q * T(n))
+            results[kind]['selected'].append(selector.strategy)  # O(1)
+            
+            print('{:>8} {:>8} '.format(kind, size) + ' '.join(  # O(k) - вывод в мкс
+                '{:>13.3f}'.format(results[kind][name][-1] * 1e6)
+                for name in strategies) + '  -> ' + selector.strategy
+                + ' (skew={:.3f})'.format(selector.skew))
     
-    return total_time / iterations  # O(1) - деление
-# Общая сложность: O(iterations * complexity(search_func))
+    return results  # O(1) - возврат
+# Общая сложность: O(2 * m * (n log n + k * r * q * T(n)))
 
 
-def run_experiment():
-    """Проведение эксперимента по сравнению времени выполнения."""
+def run_experiment(layout_sizes: Sequence[int] = LAYOUT_SIZES, workers: int = 1):
+    """Проведение эксперимента по сравнению времени выполнения.
+    
+    При workers > 1 замеры линейного и бинарного поиска выполняет
+    experiment_grid.run_grid на пуле процессов с кэшем массивов на диске.
+    """
     sizes = [1000, 2000, 5000, 10000, 20000, 50000, 100000]  # O(1) - список
     target_types = ['first', 'last', 'middle', 'missing']  # O(1) - список
     
     linear_times = {target: [] for target in target_types}  # O(k) - словарь
     binary_times = {target: [] for target in target_types}  # O(k) - словарь
+    learned_times = {target: [] for target in target_types}  # O(k) - словарь
+    learned_models = []  # O(1) - статистика моделей по размерам
+    throughput = {name: [] for name in ('binary', 'batched', 'numpy')}  # O(1)
+    lookups = 20000  # O(1) - запросов в замере пропускной способности
     
     for size in sizes:  # O(m) - цикл по m размерам
         arr = generate_sorted_array(size)  # O(n log n) - генерация массива
+        learned = PiecewiseLinearIndex(arr)  # O(n) - обучение за один проход
+        learned_models.append(learned.stats())  # O(n log s) - размер и ошибка
+        
+        def learned_search(_, target):  # O(log s + log eps) - сигнатура как у поиска
+            return learned.search(target)
         
         for target_type in target_types:  # O(k) - цикл по k типам целей
             if target_type == 'first':    # O(1) - сравнение
@@ -77,16 +291,74 @@ def run_experiment():
             else:                         # O(1) - сравнение
                 target = -1               # O(1) - присваивание
             
-            linear_time = measure_time(linear_search, arr, target)  # O(n)
-            linear_times[target_type].append(linear_time)  # O(1) - добавление
+            if workers == 1:  # O(1) - последовательный режим
+                linear_time = measure_time(linear_search, arr, target)  # O(n)
+                linear_times[target_type].append(linear_time)  # O(1) - добавление
+                
+                binary_time = measure_time(binary_search, arr, target)  # O(log n)
+                binary_times[target_type].append(binary_time)  # O(1) - добавление
             
-            binary_time = measure_time(binary_search, arr, target)  # O(log n)
-            binary_times[target_type].append(binary_time)  # O(1) - добавление
+            learned_time = measure_time(learned_search, arr, target)  # O(log s + log eps)
+            learned_times[target_type].append(learned_time)  # O(1) - добавление
+        
+        # Пропускная способность: половина запросов - попадания, половина - промахи
+        queries = random.choices(arr, k=lookups // 2)  # O(q) - попадания
+        queries += random.choices(range(-size, 0), k=lookups // 2)  # O(q) - промахи
+        random.shuffle(queries)  # O(q) - перемешивание
+        for name, rate in measure_throughput(arr, queries).items():  # O(q log n)
+            throughput[name].append(rate)  # O(1) - добавление
         
         print(f'Завершен размер {size}')  # O(1) - вывод
     
-    return sizes, linear_times, binary_times  # O(1) - возврат
-# Общая сложность: O(m * (n log n + k * (n + log n)))
+    if workers > 1:  # O(1) - сетка (размер, цель, алгоритм) на пуле процессов
+        from experiment_grid import run_grid  # O(1) - модуль сам импортирует этот
+        rows = run_grid(sizes, target_types, ['linear', 'binary'],  # O(см. run_grid)
+                        workers=workers, out_path='search_grid.jsonl',
+                        resume=False)  # Каждый запуск измеряет заново
+        cells = {(row['size'], row['target_type'], row['algorithm']): row['median']
+                 for row in rows}  # O(m * k) - индекс результатов
+        for target_type in target_types:  # O(k)
+            for size in sizes:  # O(m)
+                linear_times[target_type].append(cells[size, target_type, 'linear'])
+                binary_times[target_type].append(cells[size, target_type, 'binary'])
+    
+    print('\nОбученный индекс (время поиска в мкс, модель):')  # O(1) - вывод
+    print('{:>10} {:>9} {:>9} {:>9} {:>9} {:>9} {:>10} {:>8}'.format(
+        'Размер', *target_types, 'Отрезков', 'Байт', 'Ошибка'))  # O(1)
+    for i, size in enumerate(sizes):  # O(m) - строки таблицы
+        model = learned_models[i]  # O(1)
+        print('{:>10} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9} {:>10} {:>8}'.format(
+            size, *(learned_times[t][i] * 1e6 for t in target_types),
+            model['segments'], model['model_bytes'],
+            f"{model['max_error']}/{model['epsilon']}"))  # O(1)
+    
+    print('\nПропускная способность (запросов/с):')  # O(1) - вывод
+    print('{:>10} {:>14} {:>14} {:>14}'.format(
+        'Размер', 'binary', 'batched', 'numpy'))  # O(1) - заголовок
+    for i, size in enumerate(sizes):  # O(m) - строки таблицы
+        print('{:>10} {:>14,.0f} {:>14,.0f} {:>14,.0f}'.format(
+            size, throughput['binary'][i], throughput['batched'][i],
+            throughput['numpy'][i]))  # O(1)
+    
+    print('\nВремя одного поиска по раскладкам (мкс):')  # O(1) - вывод
+    print('{:>11} {:>12} {:>12} {:>12}'.format(
+        'Размер', 'binary', 'eytzinger', 'blocked'))  # O(1) - заголовок
+    layouts = compare_layouts(layout_sizes)  # O(см. функцию)
+    
+    print('\nСтратегии поиска, время одного поиска (мкс) и выбор селектора:')  # O(1)
+    print('{:>8} {:>8} '.format('Данные', 'Размер') + ' '.join(  # O(1) - заголовок
+        '{:>13}'.format(name[:13]) for name in ['binary', *STRATEGIES]))
+    strategies = compare_strategies(sizes)  # O(см. функцию)
+    
+    extra = {  # O(1) - дополнительные результаты
+        'learned': learned_times,
+        'learned_models': learned_models,
+        'throughput': throughput,
+        'layouts': layouts,
+        'strategies': strategies,
+    }
+    return sizes, linear_times, binary_times, extra  # O(1) - возврат
+# Общая сложность: O(m * (n log n + k * (n + log n) + q log n))
 
 
 def plot_results(sizes, linear_times, binary_times):
@@ -128,6 +400,13 @@ def plot_results(sizes, linear_times, binary_times):
 
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Сравнение алгоритмов поиска')
+    parser.add_argument('--large-layouts', action='store_true',
+                        help='раскладки до 10^8 ключей (~2.5 ГБ памяти)')
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()  # O(1)
+    
     print('Характеристики системы:')  # O(1) - вывод
     print('Процессор: Intel Core i5-13400f')  # O(1)
     print('Оперативная память: 16 GB')  # O(1)
@@ -136,7 +415,8 @@ if __name__ == '__main__':
     print()  # O(1)
     
     print('Запуск эксперимента...')  # O(1) - вывод
-    sizes, linear_times, binary_times = run_experiment()  # O(см. функцию)
+    sizes, linear_times, binary_times, _ = run_experiment(  # O(см. функцию)
+        LARGE_LAYOUT_SIZES if args.large_layouts else LAYOUT_SIZES, args.workers)
     
     print('Построение графиков...')  # O(1) - вывод
     plot_results(sizes, linear_times, binary_times)  # O(см. функцию)
@@ -0,0 +1,190 @@
+"""
+Статические индексы поиска с кэш-дружественной раскладкой.
+
+- EytzingerIndex: ключи в порядке обхода в ширину (BFS) неявного
+  двоичного дерева поиска - первые уровни дерева лежат рядом в памяти.
+- BlockedIndex: статическое B+-дерево с узлами по BLOCK ключей;
+  на каждом уровне читается один непрерывный блок.
+
+Ключи хранятся в компактном array('q') (8 байт на ключ). Оба индекса
+возвращают позицию ключа в исходном отсортированном массиве, как
+binary_search.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+BLOCK = 16  # Ключей в узле блочного индекса (128 байт = две кэш-линии)
+
+
+def _to_array(keys: Sequence[int]) -> array:
+    """Копирует ключи в array('q'), для NumPy - без поэлементного цикла."""
+    if isinstance(keys, np.ndarray):
+        compact = array('q')
+        compact.frombytes(np.ascontiguousarray(keys, dtype=np.int64).tobytes())
+        return compact
+    return array('q', keys)
+
+
+def eytzinger_rank(k: int, n: int) -> int:
+    """Позиция в отсортированном массиве для узла k (1..n) раскладки Эйтцингера.
+
+    Полное дерево из n узлов - это совершенное дерево высоты h без
+    части правых листьев последнего уровня. Ранг узла в совершенном
+    дереве считается по его уровню, затем вычитаются отсутствующие
+    листья, стоящие левее в симметричном порядке.
+
+    Сложность: O(1)
+    """
+    h = n.bit_length()  # O(1) - высота совершенного дерева
+    level = k.bit_length() - 1  # O(1) - уровень узла
+    rank = (2 * (k - (1 << level)) + 1) << (h - 1 - level)  # O(1) - ранг с 1
+    present = n - ((1 << (h - 1)) - 1)  # O(1) - листьев на последнем уровне
+    return rank - 1 - max(0, rank // 2 - present)  # O(1)
+
+
+def _eytzinger_ranks(n: int, start: int = 1, stop: Optional[int] = None) -> np.ndarray:
+    """Векторная версия eytzinger_rank для узлов start..stop-1 (по умолчанию 1..n).
+
+    Сложность: O(stop - start) времени и памяти
+    """
+    stop = n + 1 if stop is None else stop
+    k = np.arange(start, stop, dtype=np.int64)
+    h = n.bit_length()
+    level = np.log2(k).astype(np.int64)  # log2 >= 0, отбрасывание дробной части = floor
+    # log2 с плавающей точкой может ошибиться на степенях двойки
+    level -= (np.left_shift(1, level) > k)
+    level += (np.left_shift(1, level + 1) <= k)
+    k -= np.left_shift(1, level)  # На месте: дальше нужен только номер в уровне
+    k *= 2
+    k += 1
+    np.left_shift(k, h - 1 - level, out=k)  # Ранг с 1
+    del level
+    present = n - ((1 << (h - 1)) - 1)
+    shortage = k // 2
+    shortage -= present
+    np.maximum(shortage, 0, out=shortage)  # Отсутствующие листья левее
+    k -= shortage
+    k -= 1
+    return k
+
+
+RANK_BLOCK = 1 << 20  # Узлов в одном блоке построения раскладки (8 МБ рангов)
+
+
+class EytzingerIndex:
+    """Раскладка Эйтцингера (BFS-порядок) отсортированного массива.
+
+    Построение: O(n), поиск: O(log n), память: n + 1 ключей.
+    """
+
+    def __init__(self, sorted_keys: Sequence[int]):
+        """
+        Args:
+            sorted_keys: Отсортированный массив (список, array или NumPy)
+        """
+        n = len(sorted_keys)
+        self._size = n
+        if n == 0:
+            self._tree = array('q', [0])
+            return
+        if isinstance(sorted_keys, array) and sorted_keys.typecode == 'q':
+            keys = np.frombuffer(sorted_keys, dtype=np.int64)  # O(1) - без копии
+        else:
+            keys = np.asarray(sorted_keys, dtype=np.int64)  # O(n)
+        self._tree = array('q', [0]) * (n + 1)  # Индекс 0 не используется
+        layout = np.frombuffer(self._tree, dtype=np.int64)  # Запись прямо в array
+        for start in range(1, n + 1, RANK_BLOCK):  # O(n) - перестановка блоками
+            stop = min(start + RANK_BLOCK, n + 1)
+            layout[start:stop] = keys[_eytzinger_ranks(n, start, stop)]
+        del layout  # Освобождение экспорта буфера array
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Размер хранилища ключей в байтах."""
+        return len(self._tree) * self._tree.itemsize
+
+    def search(self, target: int) -> Optional[int]:
+        """Позиция target в исходном отсортированном массиве или None.
+
+        Сложность: O(log n)
+        """
+        tree = self._tree  # O(1) - локальная ссылка
+        n = self._size  # O(1)
+        k = 1  # O(1) - корень
+        while k <= n:  # O(log n) - спуск без ветвления по результату
+            k = 2 * k + (tree[k] < target)  # O(1)
+        k >>= ((~k) & (k + 1)).bit_length()  # O(1) - подъём к нижней границе
+        if k == 0 or tree[k] != target:  # O(1) - все ключи меньше или промах
+            return None
+        return eytzinger_rank(k, n)  # O(1) - позиция в исходном массиве
+
+
+class BlockedIndex:
+    """Статическое B+-дерево над отсортированным массивом.
+
+    Нижний уровень - сами ключи, разбитые на блоки по BLOCK; каждый
+    верхний уровень хранит максимум каждого блока уровня ниже.
+
+    Построение: O(n), поиск: O(log_B n * log B), память: n * B / (B - 1).
+    """
+
+    def __init__(self, sorted_keys: Sequence[int], block: int = BLOCK):
+        """
+        Args:
+            sorted_keys: Отсортированный массив (список, array или NumPy)
+            block: Количество ключей в узле
+        """
+        if block < 2:
+            raise ValueError('block должен быть не меньше 2')
+        self._block = block
+        level = np.asarray(sorted_keys, dtype=np.int64)  # O(n)
+        levels: List[array] = [_to_array(level)]
+        while len(level) > block:  # O(log_B n) уровней, O(n) суммарно
+            level = level[np.minimum(np.arange(block, len(level) + block, block),
+                                     len(level)) - 1]  # Максимум каждого блока
+            levels.append(_to_array(level))
+        self._levels = levels[::-1]  # Корень первым
+
+    def __len__(self) -> int:
+        return len(self._levels[-1])
+
+    @property
+    def nbytes(self) -> int:
+        """Размер хранилища ключей всех уровней в байтах."""
+        return sum(len(level) * level.itemsize for level in self._levels)
+
+    def search(self, target: int) -> Optional[int]:
+        """Позиция target в исходном отсортированном массиве или None.
+
+        Сложность: O(log_B n * log B)
+        """
+        block = self._block  # O(1)
+        node = 0  # O(1) - номер узла на текущем уровне
+        for level in self._levels:  # O(log_B n) - спуск от корня
+            lo = node * block  # O(1) - начало непрерывного блока
+            hi = min(lo + block, len(level))  # O(1) - конец блока
+            i = bisect_left(level, target, lo, hi)  # O(log B) - внутри блока
+            if i == hi:  # O(1) - target больше всех ключей узла
+                return None
+            node = i  # O(1) - дочерний узел
+        return node if self._levels[-1][node] == target else None  # O(1)
+
+
+def generate_compact_sorted(size: int, seed: Optional[int] = None) -> array:
+    """Отсортированный массив без повторов в компактном array('q').
+
+    Распределение близко к generate_sorted_array (значения в ~[0, 3n)),
+    но без списка объектов int: подходит для n до 10^8.
+
+    Сложность: O(n)
+    """
+    rng = np.random.default_rng(seed)
+    gaps = rng.integers(1, 6, size=size, dtype=np.int64)  # Средний шаг 3
+    return _to_array(np.cumsum(gaps) - 1)
@@ -0,0 +1,211 @@
+# test_search_comparison.py
+# Юнит-тесты алгоритмов поиска лабораторной работы 01
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from search_comparison import (
+    binary_search,
+    binary_search_many,
+    generate_skewed_array,
+    generate_sorted_array,
+    linear_search,
+)
+from adaptive_search import (
+    INTERPOLATING,
+    SKEW_LIMIT,
+    STRATEGIES,
+    SearchStrategySelector,
+    distribution_skew,
+)
+from experiment_grid import cached_array_path, open_cached_array, run_grid
+from learned_index import PiecewiseLinearIndex
+from search_index import (
+    BlockedIndex,
+    EytzingerIndex,
+    eytzinger_rank,
+    generate_compact_sorted,
+)
+
+
+class TestBinarySearchMany(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.arr = generate_sorted_array(500)
+        self.targets = self.arr[::3] + [-1, -100, self.arr[-1] + 1, 7, 8, 9]
+        random.shuffle(self.targets)
+
+    def test_matches_single_target(self):
+        expected = [binary_search(self.arr, t) for t in self.targets]
+        self.assertEqual(binary_search_many(self.arr, self.targets), expected)
+
+    def test_numpy_path_matches(self):
+        expected = [binary_search(self.arr, t) for t in self.targets]
+        buffer = np.array(self.arr, dtype=np.int64)
+        self.assertEqual(binary_search_many(buffer, self.targets), expected)
+
+    def test_duplicates_and_empty(self):
+        self.assertEqual(binary_search_many([1, 2, 2, 2, 5], [2, 5, 3]),
+                         [1, 4, None])
+        self.assertEqual(binary_search_many([], [1, 2]), [None, None])
+        self.assertEqual(binary_search_many([1, 2], []), [])
+
+    def test_numpy_path_lossy_targets_are_misses(self):
+        buffer = np.array([1, 2, 3, 5], dtype=np.int64)
+        self.assertEqual(binary_search_many(buffer, [2.5, 2.0, 5, 4.0]),
+                         [None, 1, 3, None])
+        self.assertEqual(binary_search_many(buffer, [2**70, 3, -2**70]),
+                         [None, 2, None])
+        self.assertEqual(binary_search_many(buffer, [float('nan'), 1e30, 1.0]),
+                         [None, None, 0])
+        self.assertEqual(binary_search_many(buffer, np.array([3, 2**63], dtype=np.uint64)),
+                         [2, None])
+
+    def test_agrees_with_linear_search(self):
+        for target in self.targets[:50]:
+            self.assertEqual(binary_search(self.arr, target),
+                             linear_search(self.arr, target))
+
+
+class TestSearchIndex(unittest.TestCase):
+    def test_layouts_match_binary_search(self):
+        for size in [0, 1, 2, 3, 7, 8, 15, 16, 17, 100, 1000]:
+            arr = sorted(random.sample(range(size * 3 + 1), size))
+            eytzinger = EytzingerIndex(arr)
+            blocked = BlockedIndex(arr, block=4)
+            for target in range(-1, size * 3 + 2):
+                expected = binary_search(arr, target)
+                self.assertEqual(eytzinger.search(target), expected)
+                self.assertEqual(blocked.search(target), expected)
+
+    def test_eytzinger_rank_is_inorder(self):
+        for n in range(1, 40):
+            ranks = sorted(eytzinger_rank(k, n) for k in range(1, n + 1))
+            self.assertEqual(ranks, list(range(n)))
+
+    def test_compact_sorted_array(self):
+        arr = generate_compact_sorted(1000, seed=3)
+        self.assertEqual(arr.typecode, 'q')
+        self.assertTrue(all(a < b for a, b in zip(arr, arr[1:])))
+        index = BlockedIndex(arr)
+        self.assertEqual(index.search(arr[500]), 500)
+        self.assertGreater(index.nbytes, len(arr) * arr.itemsize)
+
+
+class TestLearnedIndex(unittest.TestCase):
+    def test_matches_binary_search(self):
+        random.seed(2)
+        arr = generate_sorted_array(20000)
+        index = PiecewiseLinearIndex(arr, epsilon=8)
+        targets = [arr[0], arr[-1], arr[len(arr) // 2], -1, arr[-1] + 1]
+        targets += random.sample(range(-10, 60010), 2000)
+        for target in targets:
+            self.assertEqual(index.search(target), binary_search(arr, target))
+
+    def test_error_bound_and_model_size(self):
+        random.seed(3)
+        index = PiecewiseLinearIndex(generate_sorted_array(5000), epsilon=4)
+        stats = index.stats()
+        self.assertLessEqual(stats['max_error'], 4)
+        self.assertEqual(stats['model_bytes'], stats['segments'] * 24)
+        self.assertLess(stats['segments'], 5000)
+
+    def test_duplicates_return_first_occurrence(self):
+        arr = sorted([1, 1, 1, 2, 5, 5, 9] * 20)
+        index = PiecewiseLinearIndex(arr, epsilon=2)
+        for target in set(arr):
+            self.assertEqual(index.search(target), arr.index(target))
+        self.assertIsNone(index.search(3))
+
+    def test_edge_cases(self):
+        self.assertIsNone(PiecewiseLinearIndex([]).search(1))
+        self.assertEqual(PiecewiseLinearIndex([7]).search(7), 0)
+        with self.assertRaises(ValueError):
+            PiecewiseLinearIndex([1, 2], epsilon=0)
+
+
+class TestAdaptiveSearch(unittest.TestCase):
+    def test_strategies_match_binary_search(self):
+        random.seed(4)
+        arrays = [generate_sorted_array(300), generate_skewed_array(300),
+                  [], [5], [1, 2], [3, 3, 3]]
+        for arr in arrays:
+            targets = list(set(arr)) + [-1, 0, 4, 10**9]
+            if arr:
+                targets += random.sample(range(arr[0], arr[-1] + 1),
+                                         min(50, arr[-1] - arr[0] + 1))
+            for name, search in STRATEGIES.items():
+                for target in targets:
+                    result = search(arr, target)
+                    if target in arr:
+                        self.assertEqual(arr[result], target, name)
+                    else:
+                        self.assertIsNone(result, name)
+
+    def test_skewed_array_is_sorted_and_unique(self):
+        arr = generate_skewed_array(1000)
+        self.assertEqual(len(arr), 1000)
+        self.assertTrue(all(a < b for a, b in zip(arr, arr[1:])))
+
+    def test_distribution_skew(self):
+        self.assertLess(distribution_skew(list(range(0, 3000, 3))), 0.01)
+        self.assertGreater(distribution_skew([i ** 4 for i in range(1000)]), 0.3)
+
+    def test_selector_picks_a_strategy(self):
+        arr = generate_sorted_array(2000)
+        selector = SearchStrategySelector(arr, sample_queries=50)
+        self.assertIn(selector.strategy, STRATEGIES)
+        self.assertEqual(set(selector.timings), set(STRATEGIES))
+        self.assertEqual(selector.search(arr[123]), 123)
+        self.assertIsNone(selector.search(-5))
+
+    def test_selector_skips_interpolation_on_skewed_data(self):
+        arr = [i ** 4 for i in range(2000)]
+        selector = SearchStrategySelector(arr, sample_queries=50)
+        self.assertGreater(selector.skew, SKEW_LIMIT)
+        self.assertEqual(set(selector.timings), set(STRATEGIES) - INTERPOLATING)
+        self.assertEqual(selector.strategy, 'exponential')
+        self.assertEqual(selector.search(arr[77]), 77)
+
+
+class TestExperimentGrid(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, 'grid.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cached_array_is_deterministic(self):
+        path = cached_array_path(1000, seed=5, cache_dir=self.tmp.name)
+        self.assertEqual(cached_array_path(1000, seed=5, cache_dir=self.tmp.name), path)
+        arr = open_cached_array(path)
+        self.assertEqual(len(arr), 1000)
+        self.assertTrue(all(a < b for a, b in zip(arr, arr[1:])))
+        self.assertTrue(0 <= arr[0] and arr[-1] < 3000)
+
+    def test_grid_streams_and_resumes(self):
+        kwargs = dict(sizes=[100, 1000], target_types=['first', 'missing'],
+                      algorithms=['linear', 'binary'], workers=2,
+                      cache_dir=self.tmp.name, out_path=self.out)
+        rows = run_grid(**kwargs)
+        self.assertEqual(len(rows), 8)
+        with open(self.out) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 8)
+        for row in lines:
+            self.assertEqual(row['found'], row['target_type'] != 'missing')
+
+        # Повторный запуск не пересчитывает готовые ячейки
+        self.assertEqual(len(run_grid(**kwargs)), 8)
+        with open(self.out) as f:
+            self.assertEqual(len(f.readlines()), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
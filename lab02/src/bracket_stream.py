@@ -0,0 +1,232 @@
+"""
+Проверка сбалансированности скобок в больших файлах.
+
+- find_bracket_mismatch: потоковый режим, файл читается блоками
+  фиксированного размера; возвращает байтовое смещение первой ошибки.
+- find_bracket_mismatch_parallel: файл делится на куски, каждый
+  процесс сводит свой кусок к сводке (незакрытые закрывающие и
+  открывающие скобки), сводки объединяются ассоциативной операцией
+  combine_summaries.
+
+Быстрый путь целиком работает в C-коде bytes: translate удаляет всё,
+кроме скобок, а replace вычёркивает соседние пары '()', '[]', '{}'.
+Строка сбалансирована тогда и только тогда, когда такое сокращение
+даёт пустую строку. Смещение ошибки ищется вторым, точным проходом
+со стеком - только если файл не сбалансирован. Смещения - в байтах
+файла (в UTF-8 скобки всегда однобайтовые).
+"""
+
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+BRACKETS = re.compile(rb'[()\[\]{}]')
+OPENERS = b'([{'
+CLOSERS = b')]}'
+_MIRROR = bytes.maketrans(OPENERS, CLOSERS)  # Открывающая -> парная закрывающая
+PAIRS = {ord(')'): ord('('), ord(']'): ord('['), ord('}'): ord('{')}
+_NOT_BRACKETS = bytes(b for b in range(256) if b not in b'()[]{}')
+
+
+def reduce_brackets(brackets):
+    """
+    Вычёркивает соседние пары скобок до неподвижной точки.
+
+    Результат не зависит от порядка вычёркивания. Для корректного
+    префикса он состоит только из открывающих скобок, для куска
+    без несовпадений типов - из закрывающих, за которыми идут
+    открывающие.
+
+    Args:
+        brackets: bytes, содержащие только скобки
+
+    Returns:
+        Сокращённая строка (bytes)
+
+    Complexity: O(n) на проход replace, проходов - по уровню
+    вложенности; при глубокой вложенности (проход сокращает меньше
+    1/8 строки) досокращение стеком за O(n)
+    """
+    while brackets:
+        reduced = brackets.replace(b'()', b'').replace(b'[]', b'').replace(b'{}', b'')
+        if len(reduced) == len(brackets):  # O(1) - неподвижная точка
+            return reduced
+        if len(reduced) * 8 > len(brackets) * 7:  # Глубокая вложенность
+            return _reduce_with_stack(reduced)
+        brackets = reduced
+    return brackets
+
+
+def _reduce_with_stack(brackets):
+    """Полное сокращение одним проходом со стеком. O(n)"""
+    out = bytearray()  # O(1) - стек
+    for char in brackets:  # O(n)
+        if out and out[-1] == PAIRS.get(char):  # O(1) - пара закрылась
+            out.pop()
+        else:
+            out.append(char)  # O(1)
+    return bytes(out)
+
+
+def _seam_pairs(left, right):
+    """
+    Число пар, сокращающихся на стыке сокращённых сводок left и right:
+    хвостовые открывающие left против ведущих закрывающих right до
+    первого несовпадения типов.
+
+    Complexity: O(m), m - число ведущих закрывающих right
+    """
+    leading = len(right) - len(right.lstrip(CLOSERS))  # O(m)
+    tail = bytes(left[max(len(left) - leading, 0):])  # O(m) - не больше m с конца
+    count = len(tail) - len(tail.rstrip(OPENERS))  # O(m) - хвостовые открывающие
+    if not count:
+        return 0
+    mirrored = tail[len(tail) - count:][::-1].translate(_MIRROR)  # O(m)
+    if mirrored == right[:count]:  # O(m) - сравнение в C
+        return count
+    for i, (expected, actual) in enumerate(zip(mirrored, right)):  # Несовпадение типов
+        if expected != actual:
+            return i
+    return count
+
+
+def combine_summaries(left, right):
+    """
+    Сводка конкатенации двух кусков. Ассоциативна: сводки соседних
+    кусков можно объединять в любой группировке.
+
+    Обе сводки уже сокращены, поэтому пары могут сократиться только на
+    стыке; остаток после стыка сокращённый.
+
+    Complexity: O(m) на стык + O(len(left) + len(right)) на копирование в C
+    """
+    pairs = _seam_pairs(left, right)  # O(m)
+    return left[:len(left) - pairs] + right[pairs:]
+
+
+def summarize(data):
+    """Сводка куска: его скобки после сокращения пар. O(n)"""
+    return reduce_brackets(data.translate(None, _NOT_BRACKETS))
+
+
+def _scan(data, base, open_syms, open_pos):
+    """
+    Точный проход по скобкам data с общим стеком.
+
+    Args:
+        data: bytes
+        base: Смещение data[0] в файле
+        open_syms, open_pos: Стек открытых скобок (bytearray и array('q'))
+
+    Returns:
+        Смещение первой ошибки или None
+
+    Complexity: O(n)
+    """
+    for match in BRACKETS.finditer(data):  # O(k) - только скобки
+        char = data[match.start()]  # O(1) - код байта
+        if char in OPENERS:  # O(1) - открывающая
+            open_syms.append(char)  # O(1)
+            open_pos.append(base + match.start())  # O(1)
+        elif not open_syms or open_syms[-1] != PAIRS[char]:  # O(1) - ошибка
+            return base + match.start()
+        else:
+            open_syms.pop()  # O(1)
+            open_pos.pop()  # O(1)
+    return None
+
+
+def _read_chunks(filename, chunk_size):
+    """Генератор блоков файла. Память: O(chunk_size)"""
+    with open(filename, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)  # O(chunk_size)
+            if not chunk:  # O(1) - конец файла
+                return
+            yield chunk
+
+
+def locate_bracket_mismatch(filename, chunk_size=1 << 20):
+    """
+    Точный потоковый поиск первой ошибки (медленный путь).
+
+    Returns:
+        None если скобки сбалансированы, иначе смещение первой ошибки:
+        неверной или лишней закрывающей скобки, либо самой внешней
+        незакрытой открывающей
+
+    Complexity: O(n)
+    """
+    open_syms, open_pos = bytearray(), array('q')  # O(1) - компактный стек
+    base = 0  # O(1) - смещение текущего блока
+    for chunk in _read_chunks(filename, chunk_size):  # O(n / chunk_size)
+        error = _scan(chunk, base, open_syms, open_pos)  # O(chunk_size)
+        if error is not None:  # O(1) - первая ошибка найдена
+            return error
+        base += len(chunk)  # O(1)
+    return open_pos[0] if open_pos else None  # O(1)
+
+
+def find_bracket_mismatch(filename, chunk_size=1 << 20):
+    """
+    Потоковая проверка скобок в файле.
+
+    Память: O(chunk_size + d), d - глубина вложенности (между блоками
+    переносятся только незакрытые открывающие скобки).
+
+    Returns:
+        None если скобки сбалансированы, иначе смещение первой ошибки
+        (см. locate_bracket_mismatch)
+
+    Complexity: O(n)
+    """
+    carry = bytearray()  # O(1) - незакрытые открывающие предыдущих блоков
+    for chunk in _read_chunks(filename, chunk_size):  # O(n / chunk_size)
+        summary = summarize(chunk)  # O(chunk_size)
+        pairs = _seam_pairs(carry, summary)  # O(chunk_size) - только стык
+        del carry[len(carry) - pairs:]  # O(1) амортизированно - с конца
+        rest = summary[pairs:]  # O(chunk_size)
+        if rest.translate(None, OPENERS):  # O(chunk_size) - закрывающая осталась: ошибка
+            return locate_bracket_mismatch(filename, chunk_size)
+        carry += rest  # O(len(rest)) амортизированно
+    if carry:  # O(1) - незакрытые скобки в конце
+        return locate_bracket_mismatch(filename, chunk_size)
+    return None
+
+
+def _summarize_file_range(filename, start, end):
+    """Сводка байтов [start, end) файла; выполняется в процессе пула."""
+    with open(filename, 'rb') as file:
+        file.seek(start)  # O(1)
+        return summarize(file.read(end - start))  # O(end - start)
+
+
+def find_bracket_mismatch_parallel(filename, workers=None, chunk_size=64 << 20):
+    """
+    Параллельная проверка скобок: куски файла сводятся в процессах
+    пула, сводки объединяются слева направо по мере готовности.
+
+    В процесс передаётся только путь и границы куска, обратно -
+    сводка, размер которой не больше числа незакрытых скобок куска.
+
+    Args:
+        filename: Путь к файлу
+        workers: Количество процессов (по умолчанию os.cpu_count())
+        chunk_size: Размер куска в байтах
+
+    Returns:
+        То же, что find_bracket_mismatch
+
+    Complexity: O(n / p + s), s - суммарный размер сводок
+    """
+    size = os.path.getsize(filename)  # O(1)
+    starts = range(0, size, chunk_size)  # O(1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = pool.map(_summarize_file_range, [filename] * len(starts),
+                             starts, [min(s + chunk_size, size) for s in starts])
+        total = reduce(combine_summaries, summaries, b'')  # O(s)
+    if total:  # O(1) - ошибка есть, ищем её смещение
+        return locate_bracket_mismatch(filename)
+    return None
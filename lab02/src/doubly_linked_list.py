@@ -0,0 +1,181 @@
+class DNode:
+    """Узел двусвязного списка. Сам узел служит дескриптором элемента."""
+
+    __slots__ = ('data', 'prev', 'next', 'owner')
+
+    def __init__(self, data=None):
+        """
+        Args:
+            data: Данные для хранения в узле
+        """
+        self.data = data  # O(1) - присваивание
+        self.prev = None  # O(1) - присваивание
+        self.next = None  # O(1) - присваивание
+        self.owner = None  # O(1) - список, в котором стоит узел
+
+
+class DoublyLinkedList:
+    """Двусвязный кольцевой список с узлом-стражем.
+
+    Страж (sentinel) стоит одновременно перед первым и после
+    последнего элемента, поэтому у любого живого узла есть prev и
+    next, и вставка/удаление выполняются без проверок на None.
+    Методы вставки возвращают узел - стабильный дескриптор, по
+    которому элемент удаляется или переносится за O(1).
+    """
+
+    def __init__(self):
+        """Инициализация пустого списка."""  # O(1) - инициализация
+        self._sentinel = DNode()  # O(1) - страж
+        self._sentinel.prev = self._sentinel  # O(1) - пустое кольцо
+        self._sentinel.next = self._sentinel  # O(1)
+        self.size = 0  # O(1) - присваивание
+
+    @staticmethod
+    def _link_after(anchor, node):
+        """Вставляет node сразу после anchor. O(1)"""
+        node.prev = anchor  # O(1)
+        node.next = anchor.next  # O(1)
+        anchor.next.prev = node  # O(1)
+        anchor.next = node  # O(1)
+
+    @staticmethod
+    def _unlink(node):
+        """Исключает node из кольца. O(1)"""
+        node.prev.next = node.next  # O(1)
+        node.next.prev = node.prev  # O(1)
+
+    def _check_owner(self, node):
+        """ValueError, если node не стоит в этом списке. O(1)"""
+        if node.owner is not self:  # O(1) - удалён или из другого списка
+            raise ValueError('Node is not in the list.')
+
+    def insert_at_start(self, data):
+        """
+        Вставка элемента в начало списка.
+
+        Returns:
+            Узел-дескриптор
+
+        Complexity: O(1)
+        """
+        node = DNode(data)  # O(1) - создание узла
+        node.owner = self  # O(1)
+        self._link_after(self._sentinel, node)  # O(1)
+        self.size += 1  # O(1) - инкремент
+        return node  # O(1) - возврат
+
+    def insert_at_end(self, data):
+        """
+        Вставка элемента в конец списка.
+
+        Returns:
+            Узел-дескриптор
+
+        Complexity: O(1)
+        """
+        node = DNode(data)  # O(1) - создание узла
+        node.owner = self  # O(1)
+        self._link_after(self._sentinel.prev, node)  # O(1)
+        self.size += 1  # O(1) - инкремент
+        return node  # O(1) - возврат
+
+    def remove(self, node):
+        """
+        Удаление элемента по дескриптору.
+
+        Returns:
+            Данные удалённого узла
+
+        Raises:
+            ValueError: Если узел уже удалён или принадлежит другому списку
+
+        Complexity: O(1)
+        """
+        self._check_owner(node)  # O(1)
+        self._unlink(node)  # O(1)
+        node.prev = node.next = node.owner = None  # O(1) - помечаем узел удалённым
+        self.size -= 1  # O(1) - декремент
+        return node.data  # O(1) - возврат
+
+    def move_to_front(self, node):
+        """
+        Перенос элемента в начало списка.
+
+        Raises:
+            ValueError: Если узел уже удалён или принадлежит другому списку
+
+        Complexity: O(1)
+        """
+        self._check_owner(node)  # O(1)
+        sentinel = self._sentinel  # O(1)
+        if sentinel.next is node:  # O(1) - уже первый
+            return
+        self._unlink(node)  # O(1)
+        self._link_after(sentinel, node)  # O(1)
+
+    def delete_from_start(self):
+        """
+        Удаление элемента из начала списка.
+
+        Returns:
+            Удаленные данные или None если список пуст
+
+        Complexity: O(1)
+        """
+        if self.size == 0:  # O(1) - проверка
+            return None
+        return self.remove(self._sentinel.next)  # O(1)
+
+    def pop_back(self):
+        """
+        Удаление элемента из конца списка.
+
+        Returns:
+            Удаленные данные или None если список пуст
+
+        Complexity: O(1)
+        """
+        if self.size == 0:  # O(1) - проверка
+            return None
+        return self.remove(self._sentinel.prev)  # O(1)
+
+    def front(self):
+        """Узел первого элемента или None. O(1)"""
+        node = self._sentinel.next  # O(1)
+        return None if node is self._sentinel else node
+
+    def back(self):
+        """Узел последнего элемента или None. O(1)"""
+        node = self._sentinel.prev  # O(1)
+        return None if node is self._sentinel else node
+
+    def __iter__(self):
+        """
+        Ленивый обход элементов от начала к концу.
+
+        Complexity: O(n)
+        """
+        sentinel = self._sentinel  # O(1)
+        node = sentinel.next  # O(1)
+        while node is not sentinel:  # O(n) - цикл по всем элементам
+            yield node.data  # O(1)
+            node = node.next  # O(1) - переход к следующему
+
+    def traversal(self):
+        """
+        Обход всех элементов списка.
+
+        Complexity: O(n)
+        """
+        return list(self)  # O(n)
+
+    def is_empty(self):
+        """Проверка пустоты списка. O(1)"""
+        return self.size == 0  # O(1) - проверка
+
+    def __len__(self):
+        return self.size  # O(1) - возврат
+
+
+# Общая сложность класса: O(1) на все операции по дескриптору, O(n) на обход
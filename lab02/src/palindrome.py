@@ -0,0 +1,133 @@
+"""
+Проверка палиндромов без копирования текста.
+
+Два указателя идут навстречу друг другу по сетке блоков фиксированного
+размера. Нормализуется (нижний регистр, только буквы и цифры) только
+текущий блок с каждой стороны, поэтому дополнительная память - O(block)
+при любом размере входа: str, bytes, bytearray, memoryview или mmap.
+
+Байтовые входы без encoding считаются однобайтовым текстом (ASCII);
+для UTF-8 нужно передать encoding='utf-8' - тогда границы блоков
+сдвигаются на начало символа и блок декодируется целиком.
+"""
+
+import codecs
+from typing import Iterable, List
+
+_ALNUM = b'0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_ASCII_LOWER = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+                               b'abcdefghijklmnopqrstuvwxyz')
+_ASCII_NOT_ALNUM = bytes(b for b in range(256) if b not in _ALNUM)
+
+
+def _normalize_str(chunk):
+    """Только буквы и цифры в нижнем регистре (как в is_palindrome_deque). O(len)"""
+    return ''.join(map(str.lower, filter(str.isalnum, chunk)))
+
+
+def _make_block_reader(text, normalize, encoding):
+    """
+    Функция read(start, end) -> нормализованный блок text[start:end]
+    и функция boundary(pos) -> ближайшая граница символа не левее pos.
+    """
+    if isinstance(text, str):
+        if normalize:
+            return (lambda start, end: _normalize_str(text[start:end])), None
+        return (lambda start, end: text[start:end]), None
+
+    if encoding is None:  # Однобайтовый текст: нормализация в C-коде translate
+        if normalize:
+            return (lambda start, end: bytes(text[start:end]).translate(
+                _ASCII_LOWER, _ASCII_NOT_ALNUM)), None
+        return (lambda start, end: bytes(text[start:end])), None
+
+    def decode(start, end):
+        chunk = bytes(text[start:end]).decode(encoding)  # O(block)
+        return _normalize_str(chunk) if normalize else chunk
+
+    boundary = None
+    if codecs.lookup(encoding).name == 'utf-8':  # Многобайтовые символы UTF-8
+        n = len(text)
+
+        def boundary(pos):
+            while pos < n and text[pos] & 0xC0 == 0x80:  # O(3) - байт продолжения
+                pos += 1
+            return pos
+    return decode, boundary
+
+
+def is_palindrome(text, normalize=True, encoding=None, block=1 << 16):
+    """
+    Проверка палиндрома двумя указателями по блокам.
+
+    Левый указатель читает блоки сетки слева направо, правый - справа
+    налево (нормализованный блок переворачивается). Сравниваются
+    готовые части обоих буферов; когда указатели сходятся, остаток
+    (хвосты буферов и средний блок) проверяется как палиндром сам по
+    себе - все пары снаружи уже совпали.
+
+    Args:
+        text: str, bytes, bytearray, memoryview (формат 'B') или mmap
+        normalize: Игнорировать регистр и символы, кроме букв и цифр
+        encoding: Кодировка байтового входа (None - однобайтовый ASCII)
+        block: Размер блока в элементах входа
+
+    Returns:
+        True если текст - палиндром, иначе False
+
+    Complexity: O(n) по времени, O(block) дополнительной памяти
+    """
+    read, boundary = _make_block_reader(text, normalize, encoding)  # O(1)
+    n = len(text)  # O(1)
+    if n <= block:  # O(n) - короткий текст целиком
+        whole = read(0, n)
+        return whole == whole[::-1]
+
+    blocks = (n + block - 1) // block  # O(1) - число блоков сетки
+
+    def grid(k):  # O(1) - граница k-го блока
+        pos = min(k * block, n)
+        return boundary(pos) if boundary else pos
+
+    left = right = read(0, 0)  # O(1) - пустые буферы нужного типа
+    li, ri = 0, blocks - 1  # O(1) - следующие блоки слева и справа
+    while li < ri:  # O(n / block) - по блоку за шаг
+        if not left:  # O(block) - подгружаем слева
+            left = read(grid(li), grid(li + 1))
+            li += 1
+        elif not right:  # O(block) - подгружаем справа, перевёрнутым
+            right = read(grid(ri), grid(ri + 1))[::-1]
+            ri -= 1
+        else:  # O(block) - сравнение общей части буферов
+            k = min(len(left), len(right))
+            if left[:k] != right[:k]:
+                return False
+            left, right = left[k:], right[k:]
+
+    middle = read(grid(li), grid(li + 1)) if li == ri else left[:0]  # O(block)
+    rest = left + middle + right[::-1]  # O(block) - непроверенная середина
+    return rest == rest[::-1]  # O(block)
+
+
+def is_palindrome_batch(candidates: Iterable, normalize=True,
+                        encoding=None) -> List[bool]:
+    """
+    Проверка множества строк.
+
+    Короткие строки проверяются без блочного механизма: нормализация
+    и сравнение с развёрнутой копией выполняются в C-коде.
+
+    Returns:
+        Список флагов в порядке candidates
+
+    Complexity: O(суммарная длина)
+    """
+    result = []  # O(1)
+    append = result.append  # O(1) - локальная ссылка
+    for text in candidates:  # O(k)
+        if isinstance(text, str) and len(text) <= 1 << 16:  # O(len) - быстрый путь
+            cleaned = _normalize_str(text) if normalize else text
+            append(cleaned == cleaned[::-1])
+        else:
+            append(is_palindrome(text, normalize, encoding))
+    return result
@@ -1,7 +1,19 @@
+import mmap
+import os
+import random
+import tempfile
 import timeit
+import tracemalloc
 import matplotlib.pyplot as plt
 from collections import deque
 from linked_list import LinkedList
+from pooled_linked_list import PooledLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+from doubly_linked_list import DoublyLinkedList
+from ring_buffer import RingBuffer
+from sliding_window import naive_sliding_extremes, sliding_extremes
+from palindrome import is_palindrome, is_palindrome_batch
+from task_solutions import is_palindrome_deque
 
 
 def measure_list_insert_start(n):
@@ -82,6 +94,355 @@ def measure_deque_dequeue(n):
     return time_taken * 1000  # O(1) - умножение
 
 
+def measure_ring_buffer_dequeue(n):
+    """
+    Измерение времени удаления из начала кольцевого буфера.
+    
+    Args:
+        n: Количество операций удаления
+        
+    Returns:
+        Время выполнения в миллисекундах
+    """
+    def operation():
+        rb = RingBuffer('q')  # O(1) - создание буфера
+        rb.push_many(range(n))  # O(n) - пакетная вставка
+        for _ in range(n):  # O(n) - цикл
+            if rb:  # O(1) - проверка
+                rb.pop()  # O(1) - удаление из начала
+    
+    time_taken = timeit.timeit(operation, number=1)  # O(n) - общая сложность
+    return time_taken * 1000  # O(1) - умножение
+
+
+def measure_ring_buffer_bulk_dequeue(n, batch=256):
+    """
+    Измерение времени извлечения из кольцевого буфера пакетами.
+    
+    Args:
+        n: Количество извлекаемых элементов
+        batch: Размер пакета pop_many
+        
+    Returns:
+        Время выполнения в миллисекундах
+    """
+    def operation():
+        rb = RingBuffer('q')  # O(1) - создание буфера
+        rb.push_many(range(n))  # O(n) - пакетная вставка
+        while rb:  # O(n / batch) - цикл
+            rb.pop_many(batch)  # O(batch) - копирование среза
+    
+    time_taken = timeit.timeit(operation, number=1)  # O(n) - общая сложность
+    return time_taken * 1000  # O(1) - умножение
+
+
+def measure_memory_per_element(factory, n):
+    """
+    Измерение памяти на элемент для реализации связного списка.
+
+    Args:
+        factory: Функция без аргументов, создающая пустой список
+        n: Количество элементов
+
+    Returns:
+        Байт на элемент (по данным tracemalloc)
+    """
+    tracemalloc.start()  # O(1) - начало отслеживания выделений
+    ll = factory()  # O(1) - создание списка
+    for i in range(n):  # O(n) - цикл
+        ll.insert_at_end(i)  # O(1) - вставка в конец
+    current, _ = tracemalloc.get_traced_memory()  # O(1) - занятая память
+    tracemalloc.stop()  # O(1)
+    del ll
+    return current / n  # O(1) - деление
+
+
+def measure_linked_list_throughput(factory, n):
+    """
+    Пропускная способность очереди на связном списке: n вставок в
+    конец, затем n удалений из начала.
+
+    Args:
+        factory: Функция без аргументов, создающая пустой список
+        n: Количество элементов
+
+    Returns:
+        Операций в секунду
+    """
+    def operation():
+        ll = factory()  # O(1) - создание списка
+        for i in range(n):  # O(n) - цикл
+            ll.insert_at_end(i)  # O(1) - вставка в конец
+        for _ in range(n):  # O(n) - цикл
+            ll.delete_from_start()  # O(1) - удаление из начала
+
+    time_taken = min(timeit.repeat(operation, number=1, repeat=3))  # O(n) - лучший из трёх
+    return 2 * n / time_taken  # O(1) - деление
+
+
+def compare_linked_list_storage(n=100000):
+    """
+    Сравнение LinkedList на объектах Node и PooledLinkedList на массивах.
+
+    Returns:
+        Словарь {имя: (байт на элемент, операций в секунду)}
+    """
+    variants = {
+        'LinkedList (Node)': LinkedList,
+        'PooledLinkedList': PooledLinkedList,
+        "PooledLinkedList('q')": lambda: PooledLinkedList('q'),
+    }
+    print(f'\nХранение узлов, n = {n}:')
+    print('Реализация            | Байт/элемент | Операций/с')
+    print('-' * 52)
+    results = {}
+    for name, factory in variants.items():  # O(k * n)
+        per_element = measure_memory_per_element(factory, n)
+        rate = measure_linked_list_throughput(factory, n)
+        results[name] = (per_element, rate)
+        print(f'{name:21} | {per_element:12.1f} | {rate:10.0f}')
+    return results
+
+
+def measure_sequence_operations(factory, insert, delete, n):
+    """
+    Время вставки n элементов в конец, полного обхода и n удалений
+    из начала.
+
+    Args:
+        factory: Функция без аргументов, создающая пустую структуру
+        insert: Имя метода вставки в конец
+        delete: Имя метода удаления из начала
+        n: Количество элементов
+
+    Returns:
+        Кортеж (вставка, обход, удаление) в миллисекундах
+    """
+    def timed(operation):
+        return min(timeit.repeat(operation, number=1, repeat=3)) * 1000  # O(1) - лучший из трёх
+
+    filled = factory()  # O(1) - структура для обхода и удаления
+    for i in range(n):  # O(n)
+        getattr(filled, insert)(i)  # O(1)
+
+    def insert_all():
+        seq = factory()  # O(1) - создание структуры
+        append = getattr(seq, insert)  # O(1) - связанный метод
+        for i in range(n):  # O(n) - цикл
+            append(i)  # O(1) - вставка в конец
+
+    def traverse_all():
+        for _ in filled:  # O(n) - ленивый обход
+            pass
+
+    def delete_all():
+        seq = factory()  # O(1) - создание структуры
+        append = getattr(seq, insert)  # O(1)
+        for i in range(n):  # O(n) - подготовка, вне сравнения методик
+            append(i)
+        pop = getattr(seq, delete)  # O(1)
+        start = timeit.default_timer()  # O(1)
+        for _ in range(n):  # O(n) - цикл
+            pop()  # O(1) - удаление из начала
+        return timeit.default_timer() - start  # O(1)
+
+    insert_time = timed(insert_all)  # O(n)
+    if hasattr(filled, '__iter__'):  # O(1) - ленивый обход
+        traverse_time = timed(traverse_all)
+    else:  # O(n) - LinkedList обходится только через traversal()
+        traverse_time = timed(filled.traversal)
+    delete_time = min(delete_all() for _ in range(3)) * 1000  # O(n)
+    return insert_time, traverse_time, delete_time
+
+
+def compare_unrolled_list(n=200000):
+    """
+    Сравнение LinkedList, UnrolledLinkedList и deque на вставке в
+    конец, обходе и удалении из начала.
+
+    Returns:
+        Словарь {имя: (вставка, обход, удаление) в мс}
+    """
+    variants = {
+        'LinkedList': (LinkedList, 'insert_at_end', 'delete_from_start'),
+        'UnrolledLinkedList': (UnrolledLinkedList, 'insert_at_end', 'delete_from_start'),
+        'deque': (deque, 'append', 'popleft'),
+    }
+    print(f'\nРазвёрнутый список, n = {n}:')
+    print('Структура          | Вставка (мс) | Обход (мс) | Удаление (мс)')
+    print('-' * 64)
+    results = {}
+    for name, (factory, insert, delete) in variants.items():  # O(k * n)
+        results[name] = measure_sequence_operations(factory, insert, delete, n)
+        print('{:18} | {:12.2f} | {:10.2f} | {:13.2f}'.format(name, *results[name]))
+
+    bulk = min(timeit.repeat(lambda: UnrolledLinkedList(range(n)),  # O(n) - пакетный extend
+                             number=1, repeat=3)) * 1000
+    print(f'UnrolledLinkedList(range(n)) через extend: {bulk:.2f} мс')
+    results['UnrolledLinkedList.extend'] = bulk
+    return results
+
+
+def recency_workload_list(keys, capacity):
+    """Список последних обращений на list: remove + insert(0). O(m * capacity)"""
+    order = []  # O(1) - от самого свежего к самому старому
+    for key in keys:  # O(m)
+        if key in order:  # O(capacity) - линейный поиск
+            order.remove(key)  # O(capacity)
+        elif len(order) == capacity:  # O(1) - вытесняем самый старый
+            order.pop()  # O(1)
+        order.insert(0, key)  # O(capacity) - сдвиг элементов
+    return order
+
+
+def recency_workload_deque(keys, capacity):
+    """Список последних обращений на deque: remove + appendleft. O(m * capacity)"""
+    order = deque()  # O(1)
+    present = set()  # O(1) - быстрая проверка наличия
+    for key in keys:  # O(m)
+        if key in present:  # O(1)
+            order.remove(key)  # O(capacity) - линейный поиск в деке
+        elif len(order) == capacity:  # O(1)
+            present.discard(order.pop())  # O(1)
+        present.add(key)  # O(1)
+        order.appendleft(key)  # O(1)
+    return order
+
+
+def recency_workload_doubly(keys, capacity):
+    """Список последних обращений на DoublyLinkedList + словарь дескрипторов. O(m)"""
+    order = DoublyLinkedList()  # O(1)
+    handles = {}  # O(1) - ключ -> узел
+    for key in keys:  # O(m)
+        node = handles.get(key)  # O(1)
+        if node is not None:  # O(1) - повторное обращение
+            order.move_to_front(node)  # O(1)
+            continue
+        if len(order) == capacity:  # O(1) - вытесняем самый старый
+            del handles[order.pop_back()]  # O(1)
+        handles[key] = order.insert_at_start(key)  # O(1)
+    return order
+
+
+def compare_recency_workload(capacities=(100, 1000, 10000), accesses=50000):
+    """
+    Сравнение list, deque и DoublyLinkedList на потоке обращений с
+    переносом в начало и вытеснением самого старого (как в LRU-кэше).
+
+    Ключи выбираются из 2 * capacity значений, так что около половины
+    обращений - попадания в середину списка.
+
+    Returns:
+        Словарь {capacity: {имя: время в мс}}
+    """
+    variants = {
+        'list': recency_workload_list,
+        'deque': recency_workload_deque,
+        'DoublyLinkedList': recency_workload_doubly,
+    }
+    print(f'\nСписок последних обращений, {accesses} обращений:')
+    print('Ёмкость | list (мс) | deque (мс) | DoublyLinkedList (мс)')
+    print('-' * 56)
+    rng = random.Random(0)
+    results = {}
+    for capacity in capacities:  # O(len(capacities))
+        keys = [rng.randrange(2 * capacity) for _ in range(accesses)]  # O(m)
+        expected = None
+        results[capacity] = {}
+        for name, workload in variants.items():  # O(k)
+            start = timeit.default_timer()  # O(1)
+            order = workload(keys, capacity)
+            results[capacity][name] = (timeit.default_timer() - start) * 1000
+            if expected is None:  # O(capacity) - все варианты дают одинаковый порядок
+                expected = list(order)
+            assert list(order) == expected
+        row = results[capacity]
+        print(f"{capacity:7} | {row['list']:9.2f} | {row['deque']:10.2f} | "
+              f"{row['DoublyLinkedList']:20.2f}")
+    return results
+
+
+def measure_peak_memory(func, *args):
+    """
+    Время и пиковая дополнительная память вызова func(*args).
+
+    Returns:
+        Кортеж (время в мс, пик памяти в МБ)
+    """
+    tracemalloc.start()  # O(1)
+    start = timeit.default_timer()  # O(1)
+    func(*args)
+    elapsed = (timeit.default_timer() - start) * 1000  # O(1)
+    _, peak = tracemalloc.get_traced_memory()  # O(1)
+    tracemalloc.stop()  # O(1)
+    return elapsed, peak / 2**20
+
+
+def compare_palindrome_checkers(length=2000000, batch=100000):
+    """
+    Сравнение is_palindrome_deque и двухуказательного is_palindrome:
+    длинный текст (str и mmap файла) и пакет коротких строк.
+
+    Returns:
+        Словарь {вариант: (время в мс, пик памяти в МБ)}
+    """
+    rng = random.Random(0)
+    half = ''.join(rng.choice('abc, ABC!') for _ in range(length // 2))  # O(n)
+    text = half + half[::-1]  # O(n) - палиндром с пунктуацией и регистром
+
+    results = {
+        'deque, str': measure_peak_memory(is_palindrome_deque, text),
+        'два указателя, str': measure_peak_memory(is_palindrome, text),
+    }
+
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(text.encode('ascii'))  # O(n)
+        with open(path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            results['два указателя, mmap'] = measure_peak_memory(is_palindrome, mm)
+    finally:
+        os.unlink(path)
+
+    words = [rng.choice(['Level', 'A man, a plan', 'racecar', 'hello', 'Шалаш'])
+             for _ in range(batch)]  # O(batch)
+    results['deque, пакет'] = measure_peak_memory(
+        lambda: [is_palindrome_deque(word) for word in words])
+    results['is_palindrome_batch'] = measure_peak_memory(is_palindrome_batch, words)
+
+    print(f'\nПалиндромы: текст {length} символов, пакет {batch} строк:')
+    print('Вариант              | Время (мс) | Пик памяти (МБ)')
+    print('-' * 52)
+    for name, (elapsed, peak) in results.items():
+        print(f'{name:20} | {elapsed:10.2f} | {peak:15.2f}')
+    return results
+
+
+def compare_sliding_window(n=50000, window_sizes=(10, 100, 1000)):
+    """
+    Максимум/минимум скользящего окна: монотонные деки против
+    пересчёта каждого окна.
+
+    Returns:
+        Словарь {размер окна: (наивно мс, монотонный дек мс)}
+    """
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(n)]  # O(n) - поток метрик
+    print(f'\nСкользящее окно max/min, n = {n}:')
+    print('Окно | Пересчёт O(n*k) (мс) | Монотонный дек O(n) (мс)')
+    print('-' * 56)
+    results = {}
+    for size in window_sizes:  # O(len(window_sizes))
+        naive = timeit.timeit(lambda: naive_sliding_extremes(values, size),  # O(n * k)
+                              number=1) * 1000
+        streaming = timeit.timeit(lambda: list(sliding_extremes(values, size)),  # O(n)
+                                  number=1) * 1000
+        results[size] = (naive, streaming)
+        print(f'{size:4} | {naive:20.2f} | {streaming:24.2f}')
+    return results
+
+
 def run_performance_analysis():
     """Запуск анализа производительности."""
     # Характеристики ПК для тестирования
@@ -102,6 +463,8 @@ def run_performance_analysis():
     linked_list_insert_times = []
     list_dequeue_times = []
     deque_dequeue_times = []
+    ring_dequeue_times = []
+    ring_bulk_dequeue_times = []
     
     print('Сравнение вставки в начало:')
     print('Размер | List (мс) | LinkedList (мс)')
@@ -117,17 +480,28 @@ def run_performance_analysis():
         print(f'{size:6} | {list_time:9.2f} | {linked_list_time:14.2f}')
     
     print('\nСравнение удаления из начала (очередь):')
-    print('Размер | List (мс) | Deque (мс)')
-    print('-' * 40)
+    print('Размер | List (мс) | Deque (мс) | RingBuffer (мс) | pop_many (мс)')
+    print('-' * 68)
     
     for size in sizes:
         list_time = measure_list_dequeue(size)
         deque_time = measure_deque_dequeue(size)
+        ring_time = measure_ring_buffer_dequeue(size)
+        ring_bulk_time = measure_ring_buffer_bulk_dequeue(size)
         
         list_dequeue_times.append(list_time)
         deque_dequeue_times.append(deque_time)
+        ring_dequeue_times.append(ring_time)
+        ring_bulk_dequeue_times.append(ring_bulk_time)
         
-        print(f'{size:6} | {list_time:9.2f} | {deque_time:10.2f}')
+        print(f'{size:6} | {list_time:9.2f} | {deque_time:10.2f} | '
+              f'{ring_time:15.2f} | {ring_bulk_time:13.2f}')
+    
+    storage = compare_linked_list_storage()
+    unrolled = compare_unrolled_list()
+    recency = compare_recency_workload()
+    palindromes = compare_palindrome_checkers()
+    sliding = compare_sliding_window()
     
     # Построение графиков
     plt.figure(figsize=(12, 5))
@@ -146,6 +520,8 @@ def run_performance_analysis():
     plt.subplot(1, 2, 2)
     plt.plot(sizes, list_dequeue_times, 'ro-', label='List pop(0)')
     plt.plot(sizes, deque_dequeue_times, 'go-', label='Deque popleft()')
+    plt.plot(sizes, ring_dequeue_times, 'mo-', label='RingBuffer pop()')
+    plt.plot(sizes, ring_bulk_dequeue_times, 'co-', label='RingBuffer pop_many()')
     plt.xlabel('Количество элементов')
     plt.ylabel('Время (мс)')
     plt.title('Удаление из начала\nList: O(n²) vs Deque: O(n)')
@@ -161,7 +537,14 @@ def run_performance_analysis():
         'list_insert': list_insert_times,
         'linked_list_insert': linked_list_insert_times,
         'list_dequeue': list_dequeue_times,
-        'deque_dequeue': deque_dequeue_times
+        'deque_dequeue': deque_dequeue_times,
+        'ring_dequeue': ring_dequeue_times,
+        'ring_bulk_dequeue': ring_bulk_dequeue_times,
+        'linked_list_storage': storage,
+        'unrolled_list': unrolled,
+        'recency_workload': recency,
+        'palindromes': palindromes,
+        'sliding_window': sliding
     }
 
 
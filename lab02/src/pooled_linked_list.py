@@ -0,0 +1,187 @@
+from array import array
+
+NIL = -1  # Пустая ссылка (аналог None для узлов)
+
+
+class PooledLinkedList:
+    """Односвязный список на параллельных массивах.
+
+    Узел - это целочисленный дескриптор (индекс слота). Данные слота
+    хранятся в self._data, ссылка на следующий слот - в array('q')
+    self._next. Освобождённые слоты связываются в список свободных
+    через тот же массив _next и переиспользуются при вставке, поэтому
+    память не растёт при чередовании вставок и удалений.
+
+    В отличие от LinkedList, здесь нет объекта Node со своим __dict__:
+    на элемент приходится 8 байт ссылки next и 8 байт данных (для
+    typecode='q') вместо сотни с лишним байт на объект узла.
+    """
+
+    def __init__(self, typecode=None):
+        """
+        Инициализация пустого списка.
+
+        Args:
+            typecode: Код типа array для данных ('q', 'd', ...) или None,
+                чтобы хранить произвольные объекты в list
+        """
+        self._data = array(typecode) if typecode else []  # O(1) - данные слотов
+        self._boxed = typecode is None  # O(1) - данные - ссылки на объекты
+        self._next = array('q')  # O(1) - ссылки на следующий слот
+        self._free = NIL  # O(1) - голова списка свободных слотов
+        self.head = NIL  # O(1) - присваивание
+        self.tail = NIL  # O(1) - присваивание
+        self.size = 0  # O(1) - присваивание
+
+    def _allocate(self, data):
+        """
+        Выделение слота под данные.
+
+        Returns:
+            Дескриптор слота
+
+        Complexity: O(1) амортизированно
+        """
+        slot = self._free  # O(1) - свободный слот
+        if slot == NIL:  # O(1) - свободных нет, растим массивы
+            slot = len(self._next)  # O(1)
+            self._data.append(data)  # O(1) амортизированно
+            self._next.append(NIL)  # O(1) амортизированно
+        else:
+            self._free = self._next[slot]  # O(1) - снимаем со списка свободных
+            self._data[slot] = data  # O(1) - запись данных
+            self._next[slot] = NIL  # O(1) - сброс ссылки
+        return slot  # O(1) - возврат
+
+    def insert_at_start(self, data):
+        """
+        Вставка элемента в начало списка.
+
+        Args:
+            data: Данные для вставки
+
+        Returns:
+            Дескриптор нового узла
+
+        Complexity: O(1)
+        """
+        slot = self._allocate(data)  # O(1) - выделение слота
+
+        if self.head == NIL:  # O(1) - проверка
+            self.tail = slot  # O(1) - присваивание
+        else:
+            self._next[slot] = self.head  # O(1) - присваивание
+        self.head = slot  # O(1) - присваивание
+
+        self.size += 1  # O(1) - инкремент
+        return slot  # O(1) - возврат
+
+    def insert_at_end(self, data):
+        """
+        Вставка элемента в конец списка.
+
+        Args:
+            data: Данные для вставки
+
+        Returns:
+            Дескриптор нового узла
+
+        Complexity: O(1) - с использованием tail
+        """
+        slot = self._allocate(data)  # O(1) - выделение слота
+
+        if self.head == NIL:  # O(1) - проверка
+            self.head = slot  # O(1) - присваивание
+        else:
+            self._next[self.tail] = slot  # O(1) - присваивание
+        self.tail = slot  # O(1) - присваивание
+
+        self.size += 1  # O(1) - инкремент
+        return slot  # O(1) - возврат
+
+    def delete_from_start(self):
+        """
+        Удаление элемента из начала списка.
+
+        Returns:
+            Удаленные данные или None если список пуст
+
+        Complexity: O(1)
+        """
+        slot = self.head  # O(1) - присваивание
+        if slot == NIL:  # O(1) - проверка
+            return None
+
+        data = self._data[slot]  # O(1) - доступ
+        self.head = self._next[slot]  # O(1) - присваивание
+        if self.head == NIL:  # O(1) - список опустел
+            self.tail = NIL  # O(1) - присваивание
+
+        if self._boxed:  # O(1) - не держим ссылку на объект
+            self._data[slot] = None
+        self._next[slot] = self._free  # O(1) - слот в список свободных
+        self._free = slot  # O(1) - присваивание
+
+        self.size -= 1  # O(1) - декремент
+        return data  # O(1) - возврат
+
+    def get(self, handle):
+        """
+        Данные узла по дескриптору.
+
+        Complexity: O(1)
+        """
+        return self._data[handle]  # O(1) - доступ
+
+    def next_handle(self, handle):
+        """
+        Дескриптор следующего узла или NIL.
+
+        Complexity: O(1)
+        """
+        return self._next[handle]  # O(1) - доступ
+
+    def traversal(self):
+        """
+        Обход всех элементов списка.
+
+        Returns:
+            Список всех элементов
+
+        Complexity: O(n)
+        """
+        elements = []  # O(1) - создание списка
+        data, next_ = self._data, self._next  # O(1) - локальные ссылки
+        current = self.head  # O(1) - присваивание
+
+        while current != NIL:  # O(n) - цикл по всем элементам
+            elements.append(data[current])  # O(1) - добавление в список
+            current = next_[current]  # O(1) - переход к следующему
+
+        return elements  # O(1) - возврат
+
+    def is_empty(self):
+        """
+        Проверка пустоты списка.
+
+        Complexity: O(1)
+        """
+        return self.head == NIL  # O(1) - проверка
+
+    def __len__(self):
+        return self.size  # O(1) - возврат
+
+    @property
+    def capacity(self):
+        """Число выделенных слотов (занятые + свободные)."""
+        return len(self._next)  # O(1)
+
+    @property
+    def nbytes(self):
+        """Память буферов слотов в байтах (без самих объектов данных)."""
+        data_bytes = (8 * len(self._data) if self._boxed  # O(1)
+                      else len(self._data) * self._data.itemsize)
+        return data_bytes + len(self._next) * self._next.itemsize  # O(1)
+
+
+# Общая сложность класса: O(1) на вставку/удаление, O(n) на обход
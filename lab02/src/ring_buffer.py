@@ -0,0 +1,196 @@
+from array import array
+
+
+class RingBuffer:
+    """Очередь FIFO на кольцевом буфере array.
+
+    Ёмкость - степень двойки, поэтому позиция в буфере вычисляется
+    маской (i & mask) вместо деления по модулю. Буфер удваивается при
+    заполнении и уменьшается вдвое, когда занято не больше четверти
+    (амортизированно O(1) на операцию). Элементы хранятся как числа
+    машинного типа typecode без объектов-обёрток.
+    """
+
+    def __init__(self, typecode='q', capacity=16):
+        """
+        Инициализация пустой очереди.
+
+        Args:
+            typecode: Код типа элементов array ('q', 'd', 'B', ...)
+            capacity: Начальная ёмкость (округляется вверх до степени двойки)
+        """
+        self.typecode = typecode  # O(1)
+        self._min_capacity = 1 << max(capacity - 1, 0).bit_length()  # O(1) - степень двойки
+        self._buf = array(typecode, [0]) * self._min_capacity  # O(capacity)
+        self._mask = self._min_capacity - 1  # O(1) - маска индекса
+        self._head = 0  # O(1) - позиция первого элемента
+        self._size = 0  # O(1) - количество элементов
+        self._shrink_at = -1  # O(1) - порог уменьшения (на минимальной ёмкости нет)
+
+    @property
+    def capacity(self):
+        return len(self._buf)  # O(1)
+
+    def __len__(self):
+        return self._size  # O(1)
+
+    def __bool__(self):
+        return self._size > 0  # O(1)
+
+    def _resize(self, capacity):
+        """
+        Перенос элементов в новый буфер, начиная с позиции 0.
+
+        Старый буфер не изменяется, поэтому ранее выданные memoryview
+        не мешают перераспределению (но перестают отражать очередь).
+
+        Complexity: O(n)
+        """
+        buf = array(self.typecode, [0]) * capacity  # O(capacity)
+        first, second = self._segments()  # O(1) - границы двух частей
+        k = first[1] - first[0]  # O(1)
+        buf[:k] = self._buf[first[0]:first[1]]  # O(k) - копирование в C
+        buf[k:self._size] = self._buf[second[0]:second[1]]  # O(size - k)
+        self._buf = buf  # O(1)
+        self._mask = capacity - 1  # O(1)
+        self._head = 0  # O(1)
+        self._shrink_at = capacity >> 2 if capacity > self._min_capacity else -1  # O(1)
+
+    def _segments(self):
+        """Границы непрерывных частей очереди в буфере: ((a, b), (c, d)). O(1)"""
+        end = self._head + self._size  # O(1)
+        if end <= len(self._buf):  # O(1) - без перехода через конец
+            return (self._head, end), (0, 0)
+        return (self._head, len(self._buf)), (0, end - len(self._buf))
+
+    def _reserve(self, extra):
+        """Рост буфера до степени двойки, вмещающей size + extra. O(n) редко"""
+        need = self._size + extra  # O(1)
+        if need > len(self._buf):  # O(1) - не помещается
+            self._resize(1 << (need - 1).bit_length())  # O(n)
+
+    def _maybe_shrink(self):
+        """Уменьшение вдвое при заполнении не больше четверти. O(n) редко"""
+        if self._size <= self._shrink_at:  # O(1) - порог пересчитывается в _resize
+            self._resize(len(self._buf) >> 1)  # O(n)
+
+    def push(self, value):
+        """
+        Добавление элемента в конец очереди.
+
+        Complexity: O(1) амортизированно
+        """
+        if self._size == len(self._buf):  # O(1) - буфер заполнен
+            self._resize(len(self._buf) << 1)  # O(n) - удвоение
+        self._buf[(self._head + self._size) & self._mask] = value  # O(1)
+        self._size += 1  # O(1)
+
+    def pop(self):
+        """
+        Извлечение элемента из начала очереди.
+
+        Raises:
+            IndexError: Очередь пуста
+
+        Complexity: O(1) амортизированно
+        """
+        size = self._size  # O(1) - локальные копии атрибутов
+        if not size:  # O(1) - проверка
+            raise IndexError('pop from an empty RingBuffer')
+        head = self._head  # O(1)
+        value = self._buf[head]  # O(1) - доступ
+        self._head = (head + 1) & self._mask  # O(1) - сдвиг маской
+        self._size = size - 1  # O(1)
+        if size <= self._shrink_at:  # O(1) - редкое уменьшение буфера
+            self._resize(len(self._buf) >> 1)  # O(n)
+        return value  # O(1)
+
+    def peek(self):
+        """Первый элемент без извлечения. O(1)"""
+        if not self._size:  # O(1)
+            raise IndexError('peek from an empty RingBuffer')
+        return self._buf[self._head]  # O(1)
+
+    def push_many(self, values):
+        """
+        Добавление последовательности элементов не более чем двумя
+        копированиями срезов.
+
+        Args:
+            values: array того же typecode или любая итерируемая коллекция
+
+        Complexity: O(m) + O(n) при росте буфера
+        """
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)  # O(m) - упаковка в машинный тип
+        m = len(values)  # O(1)
+        self._reserve(m)  # O(n) редко
+        start = (self._head + self._size) & self._mask  # O(1) - позиция записи
+        k = min(m, len(self._buf) - start)  # O(1) - до конца буфера
+        if k:  # Пустое присваивание срезу запрещено при выданных memoryview
+            self._buf[start:start + k] = values[:k]  # O(k)
+        if m > k:  # O(m - k) - перенос через начало
+            self._buf[:m - k] = values[k:]
+        self._size += m  # O(1)
+
+    def pop_many(self, count):
+        """
+        Извлечение до count элементов из начала.
+
+        Returns:
+            array извлечённых элементов (может быть короче count)
+
+        Raises:
+            ValueError: Если count отрицательный
+
+        Complexity: O(count)
+        """
+        if count < 0:  # O(1) - проверка
+            raise ValueError('count must be non-negative')
+        count = min(count, self._size)  # O(1)
+        first, second = self._segments()  # O(1)
+        k = min(count, first[1] - first[0])  # O(1) - из первой части
+        result = self._buf[first[0]:first[0] + k]  # O(k) - срез array
+        if count > k:  # O(count - k) - остаток из второй части
+            result += self._buf[:count - k]
+        self._head = (self._head + count) & self._mask  # O(1)
+        self._size -= count  # O(1)
+        self._maybe_shrink()  # O(n) редко
+        return result  # O(1)
+
+    def views(self):
+        """
+        Ожидающие элементы как memoryview без копирования.
+
+        Returns:
+            Кортеж из одного или двух memoryview: непрерывная часть от
+            начала очереди до конца буфера и, если очередь переходит
+            через конец буфера, часть с начала буфера. Представления
+            действительны до следующего изменения очереди.
+
+        Complexity: O(1)
+        """
+        memory = memoryview(self._buf)  # O(1) - без копирования
+        first, second = self._segments()  # O(1)
+        if second[1]:  # O(1) - две части
+            return memory[first[0]:first[1]], memory[:second[1]]
+        return (memory[first[0]:first[1]],)
+
+    def view(self):
+        """Непрерывная часть ожидающих элементов от начала очереди. O(1)"""
+        return self.views()[0]  # O(1)
+
+    def consume(self, count):
+        """
+        Отбрасывание count элементов из начала (после чтения через view).
+
+        Complexity: O(1) амортизированно
+        """
+        if count < 0 or count > self._size:  # O(1) - проверка
+            raise ValueError('count out of range')
+        self._head = (self._head + count) & self._mask  # O(1)
+        self._size -= count  # O(1)
+        self._maybe_shrink()  # O(n) редко
+
+
+# Общая сложность класса: O(1) амортизированно на элемент
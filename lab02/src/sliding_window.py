@@ -0,0 +1,147 @@
+"""
+Максимум и минимум скользящего окна на монотонных деках.
+
+Дек максимумов хранит пары (позиция, значение) с невозрастающими
+значениями: новый элемент выталкивает с конца все меньшие - они уже
+никогда не станут максимумом, так как новый элемент больше и
+покинет окно позже. Голова дека - максимум окна. Каждый элемент
+добавляется и удаляется не более одного раза, поэтому обработка
+элемента стоит O(1) амортизированно вместо O(k) у пересчёта окна.
+
+Позиция - порядковый номер элемента (окно из size последних) или
+метка времени (окно (t - span, t]).
+"""
+
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+
+class SlidingWindowExtremes:
+    """Потоковые max/min окна и их позиции."""
+
+    def __init__(self, size=None, span=None):
+        """
+        Args:
+            size: Размер окна в элементах
+            span: Длительность окна в единицах метки времени
+
+        Ровно один из параметров должен быть задан.
+        """
+        if (size is None) == (span is None):
+            raise ValueError('Нужно задать ровно один параметр: size или span')
+        if size is not None and size < 1:
+            raise ValueError('size должен быть положительным')
+        if span is not None and span <= 0:
+            raise ValueError('span должен быть положительным')
+        self.size = size  # O(1)
+        self.span = span  # O(1)
+        self._max = deque()  # O(1) - (позиция, значение), значения не возрастают
+        self._min = deque()  # O(1) - (позиция, значение), значения не убывают
+        self._count = 0  # O(1) - сколько элементов добавлено
+
+    def push(self, value, timestamp=None):
+        """
+        Добавление элемента и вытеснение устаревших.
+
+        Args:
+            value: Значение
+            timestamp: Метка времени (обязательна для окна по времени,
+                метки должны не убывать)
+
+        Complexity: O(1) амортизированно
+        """
+        if self.span is None:  # O(1) - позиция = порядковый номер
+            position, expired = self._count, self._count - self.size
+        else:
+            if timestamp is None:
+                raise ValueError('Для окна по времени нужна метка timestamp')
+            position, expired = timestamp, timestamp - self.span
+        self._count += 1  # O(1)
+
+        maxq, minq = self._max, self._min  # O(1) - локальные ссылки
+        while maxq and maxq[-1][1] < value:  # O(1) амортизированно
+            maxq.pop()
+        maxq.append((position, value))  # O(1)
+        while minq and minq[-1][1] > value:  # O(1) амортизированно
+            minq.pop()
+        minq.append((position, value))  # O(1)
+
+        while maxq[0][0] <= expired:  # O(1) амортизированно - вышли из окна
+            maxq.popleft()
+        while minq[0][0] <= expired:  # O(1) амортизированно
+            minq.popleft()
+
+    @property
+    def max(self):
+        return self._max[0][1]  # O(1)
+
+    @property
+    def argmax(self):
+        """Позиция (номер или метка) самого раннего максимума окна."""
+        return self._max[0][0]  # O(1)
+
+    @property
+    def min(self):
+        return self._min[0][1]  # O(1)
+
+    @property
+    def argmin(self):
+        """Позиция (номер или метка) самого раннего минимума окна."""
+        return self._min[0][0]  # O(1)
+
+    @property
+    def full(self):
+        """Окно фиксированного размера заполнено (для окна по времени - True)."""
+        return self.size is None or self._count >= self.size  # O(1)
+
+
+def sliding_extremes(values: Iterable, size: int) -> Iterator[Tuple]:
+    """
+    Экстремумы всех полных окон из size элементов.
+
+    Yields:
+        (max, argmax, min, argmin) для окон, заканчивающихся на
+        элементах size-1, size, ...; arg - индексы во входном потоке
+
+    Complexity: O(n) по времени, O(size) памяти
+    """
+    window = SlidingWindowExtremes(size=size)  # O(1)
+    for value in values:  # O(n)
+        window.push(value)  # O(1) амортизированно
+        if window.full:  # O(1)
+            yield window.max, window.argmax, window.min, window.argmin
+
+
+def time_window_extremes(events: Iterable[Tuple], span) -> Iterator[Tuple]:
+    """
+    Экстремумы окна (t - span, t] после каждого события.
+
+    Args:
+        events: Пары (метка времени, значение) с неубывающими метками
+        span: Длительность окна
+
+    Yields:
+        (t, max, argmax, min, argmin); arg - метки времени
+
+    Complexity: O(n)
+    """
+    window = SlidingWindowExtremes(span=span)  # O(1)
+    for timestamp, value in events:  # O(n)
+        window.push(value, timestamp)  # O(1) амортизированно
+        yield timestamp, window.max, window.argmax, window.min, window.argmin
+
+
+def naive_sliding_extremes(values: List, size: int) -> List[Tuple]:
+    """
+    Пересчёт каждого окна заново (для сравнения).
+
+    Complexity: O(n * size)
+    """
+    result = []  # O(1)
+    for end in range(size, len(values) + 1):  # O(n)
+        window = values[end - size:end]  # O(size) - копия окна
+        high, low = max(window), min(window)  # O(size)
+        start = end - size  # O(1)
+        result.append((high, start + window.index(high),  # O(size)
+                       low, start + window.index(low)))
+    return result
@@ -1,3 +1,6 @@
+import queue
+import threading
+import time
 from collections import deque
 
 def check_brackets_balance(expression):
@@ -50,47 +53,295 @@ def is_palindrome_deque(text):
     return True  # O(1) - возврат
 
 
+def _percentile(ordered, q):
+    """Перцентиль q (0..100) отсортированной выборки. O(1)"""
+    if not ordered:  # O(1) - нет данных
+        return 0.0
+    pos = (len(ordered) - 1) * q / 100  # O(1) - позиция с интерполяцией
+    lo = int(pos)  # O(1)
+    hi = min(lo + 1, len(ordered) - 1)  # O(1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)  # O(1)
+
+
+class QueueMetrics:
+    """Счётчики очереди печати, безопасные для нескольких потоков.
+
+    Время ожидания (от enqueue до начала обработки) хранится для
+    последних window задач, поэтому память ограничена при любом
+    числе задач.
+    """
+
+    def __init__(self, window=10000):
+        """
+        Args:
+            window: Сколько последних времён ожидания хранить
+        """
+        self._lock = threading.Lock()  # O(1) - защита счётчиков
+        self._waits = deque(maxlen=window)  # O(1) - скользящее окно ожиданий
+        self.enqueued = 0  # O(1) - принято задач
+        self.dequeued = 0  # O(1) - взято в обработку
+        self.completed = 0  # O(1) - обработано успешно
+        self.failed = 0  # O(1) - обработчик выбросил исключение
+        self.rejected = 0  # O(1) - отказ по таймауту переполненной очереди
+        self._started = time.perf_counter()  # O(1)
+        self._last = (self._started, 0, 0)  # O(1) - момент и счётчики прошлого снимка
+
+    def record_enqueue(self):
+        with self._lock:  # O(1)
+            self.enqueued += 1
+
+    def record_rejected(self):
+        with self._lock:  # O(1)
+            self.rejected += 1
+
+    def record_dequeue(self, wait):
+        with self._lock:  # O(1)
+            self.dequeued += 1
+            self._waits.append(wait)
+
+    def record_done(self, ok=True):
+        with self._lock:  # O(1)
+            if ok:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def snapshot(self, depth):
+        """
+        Текущее состояние очереди.
+
+        Скорости enqueue/dequeue считаются с момента предыдущего
+        снимка (живые значения), *_total_rate - с момента создания.
+
+        Args:
+            depth: Текущая глубина очереди
+
+        Returns:
+            Словарь метрик; времена ожидания в секундах
+
+        Complexity: O(w log w), w - размер окна ожиданий
+        """
+        now = time.perf_counter()  # O(1)
+        with self._lock:  # O(w) - копия под блокировкой
+            waits = sorted(self._waits)  # O(w log w)
+            enqueued, dequeued = self.enqueued, self.dequeued
+            last_time, last_enqueued, last_dequeued = self._last
+            self._last = (now, enqueued, dequeued)
+            completed, failed, rejected = self.completed, self.failed, self.rejected
+        interval = max(now - last_time, 1e-9)  # O(1) - защита от деления на 0
+        elapsed = max(now - self._started, 1e-9)  # O(1)
+        return {
+            'depth': depth,
+            'enqueued': enqueued,
+            'dequeued': dequeued,
+            'completed': completed,
+            'failed': failed,
+            'rejected': rejected,
+            'enqueue_rate': (enqueued - last_enqueued) / interval,
+            'dequeue_rate': (dequeued - last_dequeued) / interval,
+            'enqueue_total_rate': enqueued / elapsed,
+            'dequeue_total_rate': dequeued / elapsed,
+            'wait_p50': _percentile(waits, 50),
+            'wait_p95': _percentile(waits, 95),
+            'wait_p99': _percentile(waits, 99),
+        }
+
+
 class PrintQueue:
-    """Очередь печати на основе deque."""
+    """Ограниченная очередь печати на основе deque с пулом потоков.
+
+    Производители блокируются в enqueue, пока очередь заполнена
+    (обратное давление), или получают queue.Full по таймауту.
+    start() запускает workers потоков, каждый забирает задачи и
+    вызывает handler. Для I/O-обработчиков (печать, сеть) потоки
+    работают параллельно: GIL освобождается на время ожидания.
+    """
     
-    def __init__(self):
-        """Инициализация очереди."""  # O(1) - инициализация
-        self.queue = deque()  # O(1) - создание дека
+    def __init__(self, maxsize=0, workers=1, handler=None):
+        """
+        Инициализация очереди.
+        
+        Args:
+            maxsize: Максимальная глубина очереди (0 - без ограничения)
+            workers: Количество потоков-обработчиков для start()
+            handler: Функция обработки задачи (по умолчанию печать)
+        """  # O(1) - инициализация
+        self.queue = deque()  # O(1) - создание дека пар (задача, время постановки)
+        self.maxsize = maxsize  # O(1)
+        self.workers = workers  # O(1)
+        self.handler = handler or self._print_task  # O(1)
+        self.metrics = QueueMetrics()  # O(1)
+        self._lock = threading.Lock()  # O(1) - общая блокировка состояния
+        self._not_empty = threading.Condition(self._lock)  # O(1) - ждут обработчики
+        self._not_full = threading.Condition(self._lock)  # O(1) - ждут производители
+        self._all_done = threading.Condition(self._lock)  # O(1) - ждёт join()
+        self._unfinished = 0  # O(1) - поставлено, но не обработано
+        self._closed = False  # O(1) - новые задачи обработчикам не нужны
+        self._threads = []  # O(1)
+
+    @staticmethod
+    def _print_task(task):
+        print(f'Печатается: {task}')  # O(1) - вывод
     
-    def enqueue(self, task):
+    def enqueue(self, task, block=True, timeout=None):
         """
         Добавление задачи в очередь.
         
         Args:
             task: Задача для печати
+            block: Ждать ли освобождения места в заполненной очереди
+            timeout: Максимальное ожидание в секундах (None - без ограничения)
+            
+        Raises:
+            queue.Full: Очередь заполнена, а ждать нельзя или истёк таймаут
             
         Complexity: O(1)
         """
-        self.queue.append(task)  # O(1) - добавление в конец
+        with self._not_full:  # O(1) - захват блокировки
+            if self.maxsize > 0:  # O(1) - ограниченная очередь
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(self.queue) >= self.maxsize:  # Обратное давление
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        self.metrics.record_rejected()  # O(1)
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+            self.queue.append((task, time.perf_counter()))  # O(1) - добавление в конец
+            self._unfinished += 1  # O(1)
+            self.metrics.record_enqueue()  # O(1)
+            self._not_empty.notify()  # O(1) - будим одного обработчика
     
-    def dequeue(self):
+    def _take(self):
+        """Извлекает задачу под блокировкой и пишет метрику ожидания. O(1)"""
+        task, enqueued_at = self.queue.popleft()  # O(1) - удаление из начала
+        self._not_full.notify()  # O(1) - место для производителя
+        self.metrics.record_dequeue(time.perf_counter() - enqueued_at)  # O(1)
+        return task
+
+    def dequeue(self, block=False, timeout=None):
         """
         Извлечение задачи из очереди.
         
+        Args:
+            block: Ждать ли появления задачи в пустой очереди
+            timeout: Максимальное ожидание в секундах
+            
         Returns:
             Задача или None если очередь пуста
             
         Complexity: O(1)
         """
-        if self.queue:  # O(1) - проверка
-            return self.queue.popleft()  # O(1) - удаление из начала
+        with self._not_empty:  # O(1) - захват блокировки
+            if block:
+                self._not_empty.wait_for(lambda: self.queue or self._closed, timeout)
+            if self.queue:  # O(1) - проверка
+                return self._take()  # O(1)
         return None  # O(1) - возврат
+
+    def task_done(self, ok=True):
+        """
+        Отметка о завершении обработки извлечённой задачи.
+
+        Raises:
+            ValueError: Если вызвана больше раз, чем поставлено задач
+
+        Complexity: O(1)
+        """
+        with self._all_done:  # O(1)
+            if self._unfinished <= 0:  # O(1) - как queue.Queue.task_done
+                raise ValueError('task_done() called too many times')
+            self._unfinished -= 1
+            if self._unfinished == 0:  # O(1) - очередь полностью обработана
+                self._all_done.notify_all()
+        self.metrics.record_done(ok)  # O(1)
+
+    def _worker(self):
+        """Цикл потока-обработчика: до закрытия очереди и её опустошения."""
+        while True:
+            with self._not_empty:  # O(1)
+                while not self.queue and not self._closed:  # Ожидание задач
+                    self._not_empty.wait()
+                if not self.queue:  # O(1) - закрыта и пуста
+                    return
+                task = self._take()  # O(1)
+            try:
+                self.handler(task)  # Обработка вне блокировки
+            except Exception:  # Ошибка одной задачи не останавливает поток
+                self.task_done(ok=False)
+            else:
+                self.task_done()
+
+    def start(self):
+        """
+        Запуск потоков-обработчиков.
+
+        Complexity: O(workers)
+        """
+        with self._lock:  # O(1)
+            self._closed = False
+        for i in range(self.workers):  # O(workers)
+            thread = threading.Thread(target=self._worker, daemon=True,
+                                      name=f'print-worker-{i}')
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def join(self, timeout=None):
+        """
+        Ожидание обработки всех поставленных задач.
+
+        Returns:
+            True если все задачи обработаны, False по таймауту
+        """
+        with self._all_done:  # O(1)
+            return self._all_done.wait_for(lambda: self._unfinished <= 0, timeout)
+
+    def stop(self):
+        """
+        Остановка обработчиков после опустошения очереди.
+
+        Complexity: O(workers)
+        """
+        with self._lock:  # O(1)
+            self._closed = True
+            self._not_empty.notify_all()  # O(workers) - будим всех
+        for thread in self._threads:  # O(workers)
+            thread.join()
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.join()
+        self.stop()
+
+    def stats(self):
+        """
+        Живые метрики: глубина, скорости, перцентили ожидания.
+
+        Complexity: O(w log w)
+        """
+        return self.metrics.snapshot(len(self.queue))
     
     def process_queue(self):
         """
-        Обработка всех задач в очереди.
+        Обработка всех задач в очереди в текущем потоке.
         
         Complexity: O(n)
         """
         print('Обработка очереди печати:')
-        while self.queue:  # O(n) - цикл
-            task = self.dequeue()  # O(1) - извлечение
-            print(f'Печатается: {task}')  # O(1) - вывод
+        while True:  # O(n) - цикл
+            with self._lock:  # O(1) - проверка и извлечение атомарно:
+                if not self.queue:  # запущенные обработчики могли забрать задачу
+                    break
+                task = self._take()  # O(1) - извлечение (задача может быть None)
+            try:
+                self.handler(task)  # O(1) - вывод
+            except Exception:
+                self.task_done(ok=False)
+            else:
+                self.task_done()
         print('Все задачи обработаны.')  # O(1) - вывод
     
     def is_empty(self):
@@ -105,6 +356,43 @@ class PrintQueue:
         return len(self.queue) == 0  # O(1) - проверка
 
 
+def simulate_print_load(jobs=5000, workers=32, maxsize=256, io_delay=0.005,
+                        producers=4):
+    """
+    Нагрузочная симуляция очереди печати с медленными I/O-обработчиками.
+
+    producers потоков ставят jobs задач в ограниченную очередь,
+    workers потоков обрабатывают их, засыпая на io_delay секунд
+    (имитация ожидания принтера или сети).
+
+    Returns:
+        Метрики очереди и достигнутая пропускная способность (задач/с)
+
+    Complexity: O(jobs)
+    """
+    print_queue = PrintQueue(maxsize=maxsize, workers=workers,
+                             handler=lambda task: time.sleep(io_delay))
+
+    def produce(count):
+        for i in range(count):  # O(count)
+            print_queue.enqueue(i)  # Блокируется при заполненной очереди
+
+    start = time.perf_counter()  # O(1)
+    with print_queue:  # Запуск и ожидание обработчиков
+        share, extra = divmod(jobs, producers)  # Остаток - первым extra потокам
+        threads = [threading.Thread(target=produce, args=(share + (k < extra),))
+                   for k in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - start  # O(1)
+
+    stats = print_queue.stats()  # O(w log w)
+    stats['throughput'] = stats['completed'] / elapsed  # O(1)
+    return stats
+
+
 def test_practical_tasks():
     """Тестирование практических задач."""
     # Тест проверки скобок
@@ -152,6 +440,15 @@ def test_practical_tasks():
     
     print()
     print_queue.process_queue()
+    
+    print('\n' + '='*50 + '\n')
+    
+    # Нагрузочный тест: пул обработчиков и ограниченная очередь
+    stats = simulate_print_load()
+    print('Нагрузка: 5000 задач, 32 обработчика, очередь до 256, I/O 5 мс')
+    print(f"Пропускная способность: {stats['throughput']:.0f} задач/с")
+    print(f"Ожидание в очереди: p50 {stats['wait_p50'] * 1000:.1f} мс, "
+          f"p95 {stats['wait_p95'] * 1000:.1f} мс, p99 {stats['wait_p99'] * 1000:.1f} мс")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,397 @@
+# test_lab02.py
+# Юнит-тесты структур данных лабораторной 2 (запуск из lab02/src: python -m unittest test_lab02)
+
+import mmap
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+
+from linked_list import LinkedList
+from pooled_linked_list import NIL, PooledLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+from doubly_linked_list import DoublyLinkedList
+from task_solutions import (PrintQueue, check_brackets_balance, is_palindrome_deque,
+                            simulate_print_load)
+from palindrome import is_palindrome, is_palindrome_batch
+from ring_buffer import RingBuffer
+from sliding_window import (SlidingWindowExtremes, naive_sliding_extremes,
+                            sliding_extremes, time_window_extremes)
+from bracket_stream import (combine_summaries, find_bracket_mismatch,
+                            find_bracket_mismatch_parallel, summarize)
+
+
+class TestPooledLinkedList(unittest.TestCase):
+    def test_same_behaviour_as_linked_list(self):
+        for typecode in (None, 'q'):
+            pooled, reference = PooledLinkedList(typecode), LinkedList()
+            for i in range(10):
+                if i % 3 == 0:
+                    pooled.insert_at_start(i)
+                    reference.insert_at_start(i)
+                else:
+                    pooled.insert_at_end(i)
+                    reference.insert_at_end(i)
+            self.assertEqual(pooled.traversal(), reference.traversal())
+            for _ in range(12):
+                self.assertEqual(pooled.delete_from_start(),
+                                 reference.delete_from_start())
+            self.assertTrue(pooled.is_empty())
+            self.assertEqual(len(pooled), 0)
+
+    def test_handles_and_free_list_reuse(self):
+        ll = PooledLinkedList()
+        first = ll.insert_at_end('a')
+        second = ll.insert_at_end('b')
+        self.assertEqual(ll.get(first), 'a')
+        self.assertEqual(ll.next_handle(first), second)
+        self.assertEqual(ll.next_handle(second), NIL)
+
+        for _ in range(100):  # Чередование не увеличивает число слотов
+            ll.delete_from_start()
+            ll.insert_at_end('x')
+        self.assertEqual(ll.capacity, 2)
+        self.assertEqual(ll.traversal(), ['x', 'x'])
+
+    def test_compact_storage(self):
+        ll = PooledLinkedList('q')
+        for i in range(1000):
+            ll.insert_at_end(i)
+        self.assertEqual(ll.nbytes, 16 * 1000)
+
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def test_mixed_operations_match_reference(self):
+        ll, reference = UnrolledLinkedList(capacity=4), []
+        for i in range(30):
+            if i % 5 == 0:
+                ll.insert_at_start(i)
+                reference.insert(0, i)
+            else:
+                ll.insert_at_end(i)
+                reference.append(i)
+            if i % 7 == 0:
+                self.assertEqual(ll.delete_from_start(), reference.pop(0))
+        self.assertEqual(list(ll), reference)
+        self.assertEqual(len(ll), len(reference))
+        while reference:
+            self.assertEqual(ll.delete_from_start(), reference.pop(0))
+        self.assertIsNone(ll.delete_from_start())
+        self.assertTrue(ll.is_empty())
+        ll.insert_at_end('x')
+        self.assertEqual(ll.traversal(), ['x'])
+
+    def test_extend_fills_chunks(self):
+        ll = UnrolledLinkedList([1, 2], capacity=4)
+        ll.extend(iter(range(3, 11)))
+        self.assertEqual(list(ll), list(range(1, 11)))
+        self.assertEqual(len(ll.head.items), 4)
+        self.assertEqual(len(ll), 10)
+
+    def test_concat_and_splice(self):
+        a = UnrolledLinkedList(range(5), capacity=2)
+        b = UnrolledLinkedList(range(5, 8), capacity=2)
+        c = UnrolledLinkedList(['s'], capacity=2)
+        a.concat(b)
+        a.splice(c)
+        self.assertEqual(list(a), ['s'] + list(range(8)))
+        self.assertEqual(len(a), 9)
+        self.assertTrue(b.is_empty() and c.is_empty())
+        a.insert_at_end(8)
+        self.assertEqual(list(a)[-1], 8)
+
+        empty = UnrolledLinkedList()
+        empty.concat(a)
+        self.assertEqual(len(empty), 10)
+
+
+class TestDoublyLinkedList(unittest.TestCase):
+    def test_handles_remove_and_move_to_front(self):
+        dll = DoublyLinkedList()
+        nodes = [dll.insert_at_end(i) for i in range(5)]
+        dll.move_to_front(nodes[3])
+        self.assertEqual(list(dll), [3, 0, 1, 2, 4])
+        self.assertEqual(dll.remove(nodes[1]), 1)
+        self.assertEqual(dll.pop_back(), 4)
+        self.assertEqual(dll.delete_from_start(), 3)
+        self.assertEqual(dll.traversal(), [0, 2])
+        self.assertIs(dll.front(), nodes[0])
+        self.assertIs(dll.back(), nodes[2])
+        with self.assertRaises(ValueError):
+            dll.remove(nodes[1])
+
+    def test_empty_list(self):
+        dll = DoublyLinkedList()
+        self.assertIsNone(dll.pop_back())
+        self.assertIsNone(dll.delete_from_start())
+        self.assertIsNone(dll.front())
+        node = dll.insert_at_start('a')
+        dll.move_to_front(node)
+        self.assertEqual(dll.remove(node), 'a')
+        self.assertTrue(dll.is_empty())
+        self.assertEqual(list(dll), [])
+
+    def test_rejects_detached_and_foreign_nodes(self):
+        dll, other = DoublyLinkedList(), DoublyLinkedList()
+        node = dll.insert_at_end(1)
+        foreign = other.insert_at_end(2)
+        dll.remove(node)
+        with self.assertRaises(ValueError):
+            dll.move_to_front(node)
+        with self.assertRaises(ValueError):
+            dll.move_to_front(foreign)
+        with self.assertRaises(ValueError):
+            dll.remove(foreign)
+        self.assertEqual((len(dll), len(other)), (0, 1))
+        self.assertEqual(list(other), [2])
+
+
+class TestPrintQueue(unittest.TestCase):
+    def test_backpressure_timeout(self):
+        pq = PrintQueue(maxsize=2)
+        pq.enqueue('a')
+        pq.enqueue('b')
+        with self.assertRaises(queue.Full):
+            pq.enqueue('c', timeout=0.01)
+        with self.assertRaises(queue.Full):
+            pq.enqueue('c', block=False)
+        self.assertEqual(pq.stats()['rejected'], 2)
+        self.assertEqual(pq.dequeue(), 'a')
+
+    def test_blocked_producer_resumes(self):
+        pq = PrintQueue(maxsize=1)
+        pq.enqueue(1)
+        producer = threading.Thread(target=pq.enqueue, args=(2,))
+        producer.start()
+        time.sleep(0.02)
+        self.assertTrue(producer.is_alive())  # Ждёт свободного места
+        self.assertEqual(pq.dequeue(), 1)
+        producer.join(1)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(pq.dequeue(), 2)
+
+    def test_workers_process_all_jobs(self):
+        handled, lock = [], threading.Lock()
+
+        def handler(task):
+            if task == 13:
+                raise RuntimeError('paper jam')
+            time.sleep(0.001)
+            with lock:
+                handled.append(task)
+
+        with PrintQueue(maxsize=8, workers=4, handler=handler) as pq:
+            for i in range(100):
+                pq.enqueue(i)
+        stats = pq.stats()
+        self.assertEqual(sorted(handled), [i for i in range(100) if i != 13])
+        self.assertEqual(stats['enqueued'], 100)
+        self.assertEqual(stats['completed'], 99)
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual(stats['depth'], 0)
+        self.assertLessEqual(stats['wait_p50'], stats['wait_p99'])
+
+    def test_simulated_load_enqueues_every_job(self):
+        stats = simulate_print_load(jobs=103, workers=4, maxsize=8,
+                                    io_delay=0, producers=4)
+        self.assertEqual(stats['enqueued'], 103)
+        self.assertEqual(stats['completed'], 103)
+
+    def test_task_done_too_many_times(self):
+        pq = PrintQueue(handler=lambda task: None)
+        pq.enqueue('a')
+        pq.dequeue()
+        pq.task_done()
+        with self.assertRaises(ValueError):
+            pq.task_done()
+        self.assertTrue(pq.join(timeout=0))
+        self.assertEqual(pq.stats()['completed'], 1)
+
+    def test_process_queue_sequential(self):
+        seen = []
+        pq = PrintQueue(handler=seen.append)
+        for task in ['x', None, 'y']:
+            pq.enqueue(task)
+        pq.process_queue()
+        self.assertEqual(seen, ['x', None, 'y'])
+        self.assertTrue(pq.join(0))
+
+    def test_process_queue_with_running_workers(self):
+        seen, lock = [], threading.Lock()
+
+        def handler(task):
+            with lock:
+                seen.append(task)
+
+        with PrintQueue(workers=4, handler=handler) as pq:
+            for i in range(500):
+                pq.enqueue(i)
+            pq.process_queue()
+        self.assertEqual(sorted(seen), list(range(500)))
+        self.assertEqual(pq.stats()['completed'], 500)
+
+
+class TestBracketStream(unittest.TestCase):
+    CASES = {
+        b'': None,
+        b'x = (a[0] + {b: c})': None,
+        b'(]': 1,
+        b'([)]': 2,
+        b'ab)': 2,
+        b'f((x) [y]': 1,
+        b'(' * 30 + b')' * 30: None,
+    }
+
+    def _write(self, data):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_stream_offsets_across_chunks(self):
+        for data, expected in self.CASES.items():
+            path = self._write(data)
+            for chunk_size in (1, 3, 1 << 20):
+                self.assertEqual(find_bracket_mismatch(path, chunk_size), expected, data)
+            self.assertEqual(expected is None,
+                             check_brackets_balance(data.decode()))
+
+    def test_parallel_matches_stream(self):
+        data = b'{[(' * 1000 + b'text' + b')]}' * 1000
+        path = self._write(data)
+        self.assertIsNone(find_bracket_mismatch_parallel(path, 2, 257))
+        path = self._write(data[:-1] + b')')
+        self.assertEqual(find_bracket_mismatch_parallel(path, 2, 257),
+                         len(data) - 1)
+
+    def test_summaries_are_associative(self):
+        parts = [b'a)(', b'(]', b'[x]}', b'{(']
+        a, b, c, d = (summarize(part) for part in parts)
+        left = combine_summaries(combine_summaries(combine_summaries(a, b), c), d)
+        tree = combine_summaries(combine_summaries(a, b), combine_summaries(c, d))
+        self.assertEqual(left, tree)
+        self.assertEqual(summarize(b'x)(y'), b')(')
+        self.assertEqual(combine_summaries(b')([', b']}('), b')(}(')
+        self.assertEqual(combine_summaries(b'(({', b'})]'), b'(]')
+
+    def test_deep_nesting_is_linear(self):
+        n = 400_000
+        data = b'(' * n + b')' * n
+        for tail, expected in ((b'', None), (b')', 2 * n)):
+            path = self._write(data + tail)
+            start = time.perf_counter()
+            self.assertEqual(find_bracket_mismatch(path, 1024), expected)
+            # Пересокращение всего переноса на каждом блоке занимало ~25 с
+            self.assertLess(time.perf_counter() - start, 5.0)
+        chunks = [summarize(data[i:i + 1024]) for i in range(0, len(data), 1024)]
+        total = b''
+        for summary in chunks:
+            total = combine_summaries(total, summary)
+        self.assertEqual(total, b'')
+
+
+class TestPalindrome(unittest.TestCase):
+    TEXTS = ['А роза упала на лапу Азора', 'racecar', 'hello',
+             "Madam, I'm Adam", 'not a palindrome', '', '!!', 'ab, BA']
+
+    def test_matches_deque_version_for_all_block_sizes(self):
+        for text in self.TEXTS:
+            expected = is_palindrome_deque(text)
+            for block in (1, 2, 5, 1 << 16):
+                self.assertEqual(is_palindrome(text, block=block), expected, text)
+                self.assertEqual(is_palindrome(text.encode(), encoding='utf-8',
+                                               block=block), expected, text)
+
+    def test_buffers_and_raw_mode(self):
+        self.assertTrue(is_palindrome(memoryview(b'Was it a car, or a cat I saw?'), block=3))
+        self.assertTrue(is_palindrome(bytearray(b'abba'), normalize=False, block=1))
+        self.assertFalse(is_palindrome('Abba', normalize=False))
+
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as file:
+            file.write(b'No lemon, no melon')
+        self.addCleanup(os.unlink, path)
+        with open(path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            self.assertTrue(is_palindrome(mm, block=4))
+
+    def test_batch(self):
+        self.assertEqual(is_palindrome_batch(self.TEXTS + [b'xyx']),
+                         [is_palindrome_deque(t) for t in self.TEXTS] + [True])
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_fifo_with_wraparound_and_growth(self):
+        rb = RingBuffer('q', capacity=4)
+        self.assertEqual(rb.capacity, 4)
+        for i in range(3):
+            rb.push(i)
+        self.assertEqual(rb.pop(), 0)
+        rb.push_many(range(3, 10))  # Рост с переходом через конец буфера
+        self.assertEqual(rb.capacity, 16)
+        self.assertEqual(rb.peek(), 1)
+        self.assertEqual(list(rb.pop_many(4)), [1, 2, 3, 4])
+        self.assertEqual([rb.pop() for _ in range(len(rb))], [5, 6, 7, 8, 9])
+        with self.assertRaises(IndexError):
+            rb.pop()
+
+    def test_shrinks_back_to_minimum(self):
+        rb = RingBuffer('d', capacity=8)
+        rb.push_many(float(i) for i in range(1000))
+        self.assertEqual(rb.capacity, 1024)
+        self.assertEqual(len(rb.pop_many(990)), 990)
+        while rb:
+            rb.pop()
+        self.assertEqual(rb.capacity, 8)
+
+    def test_views_without_copy(self):
+        rb = RingBuffer('q', capacity=8)
+        rb.push_many(range(6))
+        rb.consume(5)
+        rb.push_many(range(6, 10))  # Очередь: 5..9, переход через конец
+        parts = rb.views()
+        self.assertEqual(len(parts), 2)
+        self.assertEqual([x for part in parts for x in part.tolist()], [5, 6, 7, 8, 9])
+        self.assertEqual(rb.view().tolist(), [5, 6, 7])
+        rb.push(10)  # Запись при выданных memoryview допустима
+        rb.consume(3)
+        self.assertEqual(list(rb.pop_many(10)), [8, 9, 10])
+        with self.assertRaises(ValueError):
+            rb.consume(1)
+        rb.push_many([1, 2])
+        with self.assertRaises(ValueError):
+            rb.pop_many(-1)
+        self.assertEqual(list(rb.pop_many(5)), [1, 2])
+
+
+class TestSlidingWindow(unittest.TestCase):
+    def test_fixed_window_matches_naive(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9]
+        for size in (1, 2, 3, 5, len(values)):
+            self.assertEqual(list(sliding_extremes(iter(values), size)),
+                             naive_sliding_extremes(values, size))
+
+    def test_time_window(self):
+        events = [(0, 5), (5, 1), (10, 3), (26, 2), (28, 7)]
+        result = list(time_window_extremes(events, span=20))
+        self.assertEqual(result[2], (10, 5, 0, 1, 5))
+        self.assertEqual(result[3], (26, 3, 10, 2, 26))  # 0 и 5 вышли из (6, 26]
+        self.assertEqual(result[4], (28, 7, 28, 2, 26))
+
+    def test_parameters(self):
+        with self.assertRaises(ValueError):
+            SlidingWindowExtremes()
+        with self.assertRaises(ValueError):
+            SlidingWindowExtremes(size=3, span=1.0)
+        with self.assertRaises(ValueError):
+            SlidingWindowExtremes(span=1.0).push(1)
+        for span in (0, -2.5):
+            with self.assertRaises(ValueError):
+                SlidingWindowExtremes(span=span)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+from itertools import islice
+
+
+class Chunk:
+    """Узел развёрнутого списка: массив до capacity элементов."""
+
+    __slots__ = ('items', 'start', 'next')
+
+    def __init__(self, items, start=0):
+        """
+        Args:
+            items: Элементы узла (list)
+            start: Индекс первого живого элемента в items
+        """
+        self.items = items  # O(1) - присваивание
+        self.start = start  # O(1) - присваивание
+        self.next = None  # O(1) - присваивание
+
+
+class UnrolledLinkedList:
+    """Развёрнутый (unrolled) связный список.
+
+    Каждый узел хранит до capacity элементов подряд, поэтому обход
+    делает один переход по ссылке на capacity элементов, а объектов
+    узлов в capacity раз меньше, чем у LinkedList. Удаление из начала
+    сдвигает индекс start головного узла, не перемещая элементы.
+    """
+
+    def __init__(self, iterable=(), capacity=64):
+        """
+        Инициализация списка.
+
+        Args:
+            iterable: Начальные элементы
+            capacity: Максимальное число элементов в узле
+        """
+        if capacity < 1:
+            raise ValueError('capacity должна быть положительной')
+        self.capacity = capacity  # O(1) - присваивание
+        self.head = None  # O(1) - присваивание
+        self.tail = None  # O(1) - присваивание
+        self.size = 0  # O(1) - присваивание
+        self.extend(iterable)  # O(k) - начальные элементы
+
+    def _append_chunk(self, chunk):
+        """Подвешивает узел в конец. O(1)"""
+        if self.tail is None:  # O(1) - пустой список
+            self.head = chunk  # O(1)
+        else:
+            self.tail.next = chunk  # O(1)
+        self.tail = chunk  # O(1)
+
+    def insert_at_start(self, data):
+        """
+        Вставка элемента в начало списка.
+
+        Complexity: O(1) амортизированно
+        """
+        head = self.head  # O(1) - присваивание
+        if head is not None and head.start > 0:  # O(1) - есть место перед start
+            head.start -= 1  # O(1)
+            head.items[head.start] = data  # O(1)
+        else:  # O(capacity) - новый узел, заполняемый справа налево
+            chunk = Chunk([None] * (self.capacity - 1) + [data],
+                          self.capacity - 1)
+            chunk.next = head  # O(1)
+            self.head = chunk  # O(1)
+            if self.tail is None:  # O(1)
+                self.tail = chunk  # O(1)
+        self.size += 1  # O(1) - инкремент
+
+    def insert_at_end(self, data):
+        """
+        Вставка элемента в конец списка.
+
+        Complexity: O(1) амортизированно
+        """
+        tail = self.tail  # O(1) - присваивание
+        if tail is not None and len(tail.items) < self.capacity:  # O(1)
+            tail.items.append(data)  # O(1) - место в хвостовом узле
+        else:
+            self._append_chunk(Chunk([data]))  # O(1) - новый узел
+        self.size += 1  # O(1) - инкремент
+
+    def extend(self, iterable):
+        """
+        Добавление элементов в конец пакетами по capacity.
+
+        Хвостовой узел дозаполняется, затем узлы создаются целыми
+        срезами без поэлементных вставок.
+
+        Complexity: O(k), k - число добавляемых элементов
+        """
+        it = iter(iterable)  # O(1) - итератор
+        tail = self.tail  # O(1)
+        if tail is not None:  # O(capacity) - дозаполнение хвоста
+            before = len(tail.items)  # O(1)
+            tail.items.extend(islice(it, self.capacity - before))
+            self.size += len(tail.items) - before  # O(1)
+        while True:  # O(k / capacity) - по узлу за итерацию
+            block = list(islice(it, self.capacity))  # O(capacity)
+            if not block:  # O(1) - данные закончились
+                break
+            self._append_chunk(Chunk(block))  # O(1)
+            self.size += len(block)  # O(1)
+
+    def delete_from_start(self):
+        """
+        Удаление элемента из начала списка.
+
+        Returns:
+            Удаленные данные или None если список пуст
+
+        Complexity: O(1)
+        """
+        head = self.head  # O(1) - присваивание
+        if head is None:  # O(1) - проверка
+            return None
+
+        data = head.items[head.start]  # O(1) - доступ
+        head.items[head.start] = None  # O(1) - освобождаем ссылку
+        head.start += 1  # O(1) - сдвиг начала
+        if head.start == len(head.items):  # O(1) - узел опустел
+            self.head = head.next  # O(1)
+            if self.head is None:  # O(1)
+                self.tail = None  # O(1)
+
+        self.size -= 1  # O(1) - декремент
+        return data  # O(1) - возврат
+
+    def concat(self, other):
+        """
+        Присоединение всех узлов other в конец списка; other пустеет.
+
+        Complexity: O(1) - узлы не копируются
+        """
+        if other is self or other.head is None:  # O(1) - нечего переносить
+            return
+        self._append_chunk(other.head)  # O(1) - перевешиваем цепочку
+        self.tail = other.tail  # O(1)
+        self.size += other.size  # O(1)
+        other.head = other.tail = None  # O(1)
+        other.size = 0  # O(1)
+
+    def splice(self, other):
+        """
+        Вставка всех узлов other в начало списка; other пустеет.
+
+        Complexity: O(1) - узлы не копируются
+        """
+        if other is self or other.head is None:  # O(1) - нечего переносить
+            return
+        other.tail.next = self.head  # O(1) - цепочка other перед головой
+        self.head = other.head  # O(1)
+        if self.tail is None:  # O(1) - список был пуст
+            self.tail = other.tail  # O(1)
+        self.size += other.size  # O(1)
+        other.head = other.tail = None  # O(1)
+        other.size = 0  # O(1)
+
+    def __iter__(self):
+        """
+        Ленивый обход элементов без построения промежуточного списка.
+
+        Complexity: O(n), один переход по ссылке на узел
+        """
+        chunk = self.head  # O(1)
+        while chunk is not None:  # O(n / capacity) - по узлам
+            if chunk.start:  # O(1) - у головы могут быть удалённые слоты
+                yield from islice(chunk.items, chunk.start, None)
+            else:
+                yield from chunk.items  # O(capacity)
+            chunk = chunk.next  # O(1)
+
+    def traversal(self):
+        """
+        Обход всех элементов списка (совместимость с LinkedList).
+
+        Complexity: O(n)
+        """
+        return list(self)  # O(n)
+
+    def is_empty(self):
+        """Проверка пустоты списка. O(1)"""
+        return self.size == 0  # O(1) - проверка
+
+    def __len__(self):
+        return self.size  # O(1) - возврат
+
+
+# Общая сложность класса: O(1) на вставку/удаление/concat/splice, O(n) на обход
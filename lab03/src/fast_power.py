@@ -0,0 +1,254 @@
+# fast_power.py
+"""
+Итеративное быстрое возведение в степень для любого ассоциативного
+умножения: числа, вычеты по модулю, квадратные матрицы, многочлены.
+
+- power: двоичный метод слева направо, без рекурсии (в отличие от
+  recursion.power, который делает вызов на каждый бит).
+- power_window: скользящее окно - показатель разбивается на нечётные
+  "цифры" шириной до w битов; для каждой цифры одно умножение на
+  заранее вычисленную нечётную степень основания. Умножений
+  примерно L / (w + 1) вместо L / 2 при тех же L возведениях в квадрат.
+- power_many: много оснований в одной степени; разложение показателя
+  на окна строится один раз и используется для всех оснований.
+"""
+
+import os
+import random
+import sys
+from operator import mul
+
+from recursion import power as power_recursive
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from common.timing import measure
+
+
+def _modular(multiply, modulus):
+    """Умножение с приведением по модулю (если модуль задан)."""
+    if modulus is None:
+        return multiply
+    if multiply is mul:
+        return lambda x, y: x * y % modulus
+    return lambda x, y: multiply(x, y) % modulus
+
+
+def power(base, exponent, multiply=mul, identity=1, modulus=None):
+    """
+    base^exponent двоичным методом слева направо.
+
+    Args:
+        base: Основание
+        exponent: Неотрицательный целый показатель
+        multiply: Ассоциативное умножение multiply(x, y)
+        identity: Нейтральный элемент умножения
+        modulus: Модуль для результата каждого умножения (x % modulus);
+            base и identity тоже приводятся оператором %, поэтому элементы
+            должны его поддерживать. Для других типов (матрицы) приведение
+            выполняет сам multiply, как в matrix_power
+
+    Complexity: O(log exponent) умножений, O(1) глубина стека
+    """
+    if exponent < 0:
+        raise ValueError('exponent must be non-negative')
+    multiply = _modular(multiply, modulus)
+    if exponent == 0:
+        return identity if modulus is None else identity % modulus
+    if modulus is not None:
+        base %= modulus
+    result = base
+    for bit in bin(exponent)[3:]:  # Биты после старшего
+        result = multiply(result, result)
+        if bit == '1':
+            result = multiply(result, base)
+    return result
+
+
+def power_mod(base, exponent, modulus):
+    """base^exponent mod modulus. O(log exponent) умножений"""
+    if modulus == 1:
+        return 0
+    return power(base, exponent, modulus=modulus) % modulus
+
+
+def window_width(bits):
+    """Ширина окна, минимизирующая 2^(w-1) + bits / (w + 1) умножений."""
+    for width, limit in ((1, 8), (2, 24), (3, 80), (4, 240), (5, 672), (6, 1792)):
+        if bits <= limit:
+            return width
+    return 7
+
+
+def window_decomposition(exponent, width=None):
+    """
+    Разложение показателя для метода скользящего окна.
+
+    Окна выделяются справа налево: младший единичный бит начинает
+    окно из width битов, поэтому каждая цифра нечётна; серии нулей
+    пропускаются целиком по числу младших нулевых битов.
+
+    Returns:
+        (width, шаги) - шаги (squarings, digit) от старших битов:
+        возвести в квадрат squarings раз, затем умножить на base^digit
+        (digit нечётна; digit = 0 - только квадраты)
+
+    Complexity: O(log exponent / width) итераций над длинным числом
+    """
+    width = width or window_width(exponent.bit_length())
+    mask = (1 << width) - 1
+    windows = []  # (позиция младшего бита окна, цифра), от младших
+    position = 0
+    while exponent:
+        zeros = (exponent & -exponent).bit_length() - 1  # Пропуск нулей
+        exponent >>= zeros
+        position += zeros
+        windows.append((position, exponent & mask))
+        exponent >>= width
+        position += width
+    steps = []
+    previous = windows[-1][0] if windows else 0
+    for position, digit in reversed(windows):
+        steps.append((previous - position, digit))
+        previous = position
+    if previous:
+        steps.append((previous, 0))  # Младшие нули - только квадраты
+    return width, steps
+
+
+def _apply_window(base, width, steps, multiply, identity):
+    """Возведение по готовому разложению. O(2^(w-1) + L) умножений"""
+    square = multiply(base, base)
+    odd = [base]  # base^1, base^3, ..., base^(2^w - 1)
+    for _ in range((1 << (width - 1)) - 1):
+        odd.append(multiply(odd[-1], square))
+    result = None  # None - ещё identity, первые квадраты пропускаются
+    for squarings, digit in steps:
+        if result is not None:
+            for _ in range(squarings):
+                result = multiply(result, result)
+        if digit:
+            value = odd[digit >> 1]
+            result = value if result is None else multiply(result, value)
+    return identity if result is None else result
+
+
+def power_window(base, exponent, multiply=mul, identity=1, modulus=None, width=None):
+    """
+    base^exponent методом скользящего окна.
+
+    Параметры - как у power (modulus требует элементов с %); width -
+    ширина окна (None - по длине показателя).
+
+    Complexity: O(log exponent) квадратов и O(log exponent / width)
+    умножений, O(2^width) памяти на таблицу степеней
+    """
+    if exponent < 0:
+        raise ValueError('exponent must be non-negative')
+    if exponent == 0:
+        return identity if modulus is None else identity % modulus
+    multiply = _modular(multiply, modulus)
+    if modulus is not None:
+        base %= modulus
+    width, steps = window_decomposition(exponent, width)
+    return _apply_window(base, width, steps, multiply, identity)
+
+
+def power_many(bases, exponent, multiply=mul, identity=1, modulus=None, width=None):
+    """
+    Список base^exponent для всех оснований с общим разложением показателя.
+
+    Complexity: O(log exponent) на построение разложения и
+    O(2^width + log exponent) умножений на основание
+    """
+    if exponent < 0:
+        raise ValueError('exponent must be non-negative')
+    if exponent == 0:
+        identity = identity if modulus is None else identity % modulus
+        return [identity for _ in bases]
+    multiply = _modular(multiply, modulus)
+    width, steps = window_decomposition(exponent, width)
+    if modulus is not None:
+        bases = [base % modulus for base in bases]
+    return [_apply_window(base, width, steps, multiply, identity) for base in bases]
+
+
+def identity_matrix(size):
+    return [[int(i == j) for j in range(size)] for i in range(size)]
+
+
+def matrix_multiply(x, y, modulus=None):
+    """
+    Произведение квадратных матриц (списков строк).
+
+    Complexity: O(size^3)
+    """
+    columns = list(zip(*y))
+    if modulus is None:
+        return [[sum(map(mul, row, column)) for column in columns] for row in x]
+    return [[sum(map(mul, row, column)) % modulus for column in columns] for row in x]
+
+
+def matrix_power(matrix, exponent, modulus=None):
+    """
+    Степень квадратной матрицы скользящим окном.
+
+    Complexity: O(size^3 log exponent)
+    """
+    identity = identity_matrix(len(matrix))
+    if modulus is not None:  # Приведение по элементам: у списков нет %
+        matrix = [[value % modulus for value in row] for row in matrix]
+        identity = [[value % modulus for value in row] for row in identity]
+    return power_window(matrix, exponent, lambda x, y: matrix_multiply(x, y, modulus),
+                        identity)
+
+
+def benchmark_power(exponent_bits=(64, 512, 2048), bases=50, big_exponent=10 ** 5, seed=0):
+    """
+    Время возведения в степень разными способами.
+
+    Задачи: длинное число без модуля (здесь можно сравнить с
+    recursion.power), одно основание по модулю и пакет оснований по
+    модулю с одним показателем.
+
+    Returns:
+        Список (задача, {способ: секунды})
+    """
+    rng = random.Random(seed)
+    results = [(f'3^{big_exponent} без модуля', {
+        name: measure(action, warmup=1, max_time=0.5).median for name, action in (
+            ('recursion.power', lambda: power_recursive(3, big_exponent)),
+            ('power', lambda: power(3, big_exponent)),
+            ('power_window', lambda: power_window(3, big_exponent)),
+            ('pow', lambda: pow(3, big_exponent)),
+        )})]
+    for bits in exponent_bits:
+        exponent = rng.getrandbits(bits) | 1 << (bits - 1)
+        modulus = rng.getrandbits(bits) | 1
+        base = rng.getrandbits(bits) % modulus
+        many = [rng.getrandbits(bits) % modulus for _ in range(bases)]
+        results.append((f'{bits} бит по модулю, одно основание', {
+            name: measure(action, warmup=1, max_time=0.5).median for name, action in (
+                ('power', lambda: power(base, exponent, modulus=modulus)),
+                ('power_window', lambda: power_window(base, exponent, modulus=modulus)),
+                ('pow', lambda: pow(base, exponent, modulus)),
+            )}))
+        results.append((f'{bits} бит по модулю, {bases} оснований', {
+            name: measure(action, warmup=1, max_time=0.5).median for name, action in (
+                ('цикл power_window', lambda: [power_window(b, exponent, modulus=modulus)
+                                               for b in many]),
+                ('power_many', lambda: power_many(many, exponent, modulus=modulus)),
+                ('цикл pow', lambda: [pow(b, exponent, modulus) for b in many]),
+            )}))
+    return results
+
+
+if __name__ == "__main__":
+    print(f"power(3, 100) = {power(3, 100)}")
+    print(f"power_mod(2, 10^18, 10^9 + 7) = {power_mod(2, 10 ** 18, 10 ** 9 + 7)}")
+    print(f"[[1, 1], [1, 0]]^90 = {matrix_power([[1, 1], [1, 0]], 90)}")
+
+    print("\n=== Быстрое возведение в степень ===")
+    for task, timings in benchmark_power():
+        print(task)
+        for name, seconds in timings.items():
+            print(f"    {name:<24} {seconds * 1e6:>12.1f} мкс")
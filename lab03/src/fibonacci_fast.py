@@ -0,0 +1,98 @@
+# fibonacci_fast.py
+"""
+Числа Фибоначчи за O(log n) умножений без рекурсии.
+
+Быстрое удвоение использует тождества
+    F(2k)   = F(k) * (2F(k+1) - F(k))
+    F(2k+1) = F(k)^2 + F(k+1)^2
+и проходит биты n от старшего к младшему, поэтому глубина стека не
+зависит от n. Матричный способ возводит [[1, 1], [1, 0]] в степень n
+двоичным возведением: [[F(n+1), F(n)], [F(n), F(n-1)]].
+
+Длина F(n) - около 0.694n бит, поэтому при больших n время
+определяется умножением длинных чисел, а не числом шагов: быстрое
+удвоение делает 3 умножения на бит, матричный способ - до 12.
+
+Необязательный modulus возвращает F(n) mod modulus; промежуточные
+значения тогда не превышают modulus^2.
+"""
+
+
+def fibonacci_doubling(n, modulus=None):
+    """
+    F(n) быстрым удвоением.
+
+    Args:
+        n: Номер числа (n >= 0)
+        modulus: Модуль (None - точное значение)
+
+    Returns:
+        F(n) или F(n) mod modulus
+
+    Complexity: O(log n) умножений, O(1) глубина стека
+    """
+    if n < 0:
+        raise ValueError('n must be non-negative')
+    if n == 0:
+        return 0
+    bits = bin(n)[3:]  # Старший бит задаёт начальное k = 1
+    a, b = 1, 1  # F(k), F(k+1) для k = 1
+    if modulus is not None:
+        a, b = a % modulus, b % modulus
+    for bit in bits[:-1]:  # O(log n) - биты от старшего, кроме последнего
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b  # F(2k+1)
+        if modulus is not None:
+            c %= modulus
+            d %= modulus
+        if bit == '1':
+            a, b = d, c + d  # k -> 2k + 1
+            if modulus is not None:
+                b %= modulus
+        else:
+            a, b = c, d  # k -> 2k
+    if bits:  # Последний шаг - самый дорогой, считаем только нужное число
+        a = a * a + b * b if bits[-1] == '1' else a * (2 * b - a)
+    return a % modulus if modulus is not None else a
+
+
+def _matrix_multiply(x, y, modulus):
+    """Произведение матриц 2x2, записанных кортежами (a, b, c, d). O(1) умножений"""
+    a, b, c, d = x
+    e, f, g, h = y
+    result = (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+    if modulus is not None:
+        return tuple(value % modulus for value in result)
+    return result
+
+
+def matrix_power(matrix, n, modulus=None):
+    """
+    Матрица 2x2 в степени n двоичным возведением (справа налево).
+
+    Complexity: O(log n) умножений матриц
+    """
+    result = (1, 0, 0, 1)  # Единичная матрица
+    while n:  # O(log n)
+        if n & 1:
+            result = _matrix_multiply(result, matrix, modulus)
+        n >>= 1
+        if n:  # Последнее возведение в квадрат не нужно
+            matrix = _matrix_multiply(matrix, matrix, modulus)
+    return result
+
+
+def fibonacci_matrix(n, modulus=None):
+    """
+    F(n) возведением матрицы [[1, 1], [1, 0]] в степень n.
+
+    Args:
+        n: Номер числа (n >= 0)
+        modulus: Модуль (None - точное значение)
+
+    Complexity: O(log n) умножений матриц, O(1) глубина стека
+    """
+    if n < 0:
+        raise ValueError('n must be non-negative')
+    result = matrix_power((1, 1, 1, 0), n, modulus)
+    return result[1] % modulus if modulus is not None else result[1]
@@ -0,0 +1,202 @@
+# file_walker.py
+"""
+Обход дерева каталогов на os.scandir.
+
+Каждый каталог читается ровно один раз: подкаталоги кладутся в
+явный стек (или отдаются пулу потоков), а не обходятся повторно, как
+в прежнем recursive_file_traversal, который вызывал сам себя внутри
+os.walk и перечитывал каталог для каждого предка. os.scandir
+возвращает тип записи вместе с именем, поэтому отдельный stat для
+проверки "файл или каталог" не нужен.
+
+Режим с потоками (workers > 0) полезен на медленных файловых системах
+(сеть, холодный диск): пока один поток ждёт ответа, другие читают
+соседние каталоги. На локальном диске с тёплым кэшем выигрыша почти
+нет из-за GIL.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import redirect_stdout
+
+
+def _scan(path, with_stat):
+    """Чтение одного каталога: (подкаталоги, файлы). O(записей каталога)"""
+    dirs, files = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    else:
+                        if with_stat:  # DirEntry кэширует результат stat
+                            entry.stat(follow_symlinks=False)
+                        files.append(entry)
+                except OSError:  # Запись удалена во время обхода
+                    continue
+    except OSError:  # Нет прав или каталог исчез
+        pass
+    return dirs, files
+
+
+def scan_tree(path, workers=0, with_stat=False):
+    """
+    Генератор (каталог, список os.DirEntry его файлов) по всему дереву.
+
+    Args:
+        path: Корень обхода
+        workers: Число потоков чтения каталогов (0 - в текущем потоке)
+        with_stat: Заранее выполнить stat файлов (в потоках пула)
+
+    Yields:
+        (путь каталога, файлы); порядок каталогов не гарантируется
+
+    Complexity: O(каталоги + файлы), каждый каталог читается один раз
+    """
+    if workers <= 0:
+        stack = [os.fspath(path)]  # Явный стек вместо рекурсии
+        while stack:
+            directory = stack.pop()
+            dirs, files = _scan(directory, with_stat)
+            stack.extend(reversed(dirs))  # Подкаталоги в порядке scandir
+            yield directory, files
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan, os.fspath(path), with_stat): os.fspath(path)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                dirs, files = future.result()
+                for subdirectory in dirs:
+                    pending[pool.submit(_scan, subdirectory, with_stat)] = subdirectory
+                yield directory, files
+
+
+def iter_files(path, workers=0):
+    """Генератор os.DirEntry всех файлов дерева. O(каталоги + файлы)"""
+    for _, files in scan_tree(path, workers):
+        yield from files
+
+
+class TreeSummary:
+    """Сводка по дереву: количество файлов и каталогов, объём, расширения."""
+
+    def __init__(self):
+        self.files = 0
+        self.directories = 0
+        self.total_bytes = 0
+        self.extensions = Counter()  # расширение (в нижнем регистре) -> файлов
+
+    def __repr__(self):
+        return (f'TreeSummary(files={self.files}, directories={self.directories}, '
+                f'total_bytes={self.total_bytes}, '
+                f'extensions={dict(self.extensions.most_common(5))})')
+
+
+def summarize_tree(path, workers=0):
+    """
+    Количество файлов, каталогов, суммарный размер и гистограмма расширений.
+
+    Размер берётся из stat без перехода по символическим ссылкам;
+    при workers > 0 stat выполняется в потоках пула.
+
+    Complexity: O(каталоги + файлы)
+    """
+    summary = TreeSummary()
+    for _, files in scan_tree(path, workers, with_stat=True):
+        summary.directories += 1
+        summary.files += len(files)
+        for entry in files:
+            try:
+                summary.total_bytes += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            summary.extensions[os.path.splitext(entry.name)[1].lower()] += 1
+    return summary
+
+
+def make_test_tree(root, files=100_000, fanout=10, depth=3, size=64):
+    """
+    Дерево fanout^depth листовых каталогов с files файлами поровну.
+
+    Returns:
+        Число созданных файлов
+    """
+    leaves = [root]
+    for _ in range(depth):
+        leaves = [os.path.join(parent, f'd{i}') for parent in leaves for i in range(fanout)]
+    per_leaf = max(files // len(leaves), 1)
+    extensions = ('.py', '.txt', '.json', '.md', '.csv')
+    payload = b'x' * size
+    created = 0
+    for leaf in leaves:
+        os.makedirs(leaf, exist_ok=True)
+        for i in range(per_leaf):
+            with open(os.path.join(leaf, f'f{i}{extensions[i % len(extensions)]}'), 'wb') as file:
+                file.write(payload)
+            created += 1
+    return created
+
+
+def benchmark_walkers(files=100_000, workers=(4, 16)):
+    """
+    Время обхода сгенерированного дерева разными способами.
+
+    Returns:
+        Список (название, секунды, найдено файлов)
+    """
+    from recursion_tasks import recursive_file_traversal
+
+    def rescanning_traversal(path):
+        # Прежняя версия: рекурсия внутри os.walk перечитывает каталоги
+        count = 0
+        for root, dirs, names in os.walk(path):
+            count += len(names)
+            for name in dirs:
+                count += rescanning_traversal(os.path.join(root, name))
+        return count
+
+    def printed_traversal(path):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            recursive_file_traversal(path)
+        return output.getvalue().count('    Файл: ')
+
+    root = tempfile.mkdtemp(prefix='walk_bench_')
+    try:
+        make_test_tree(root, files)
+        for _ in os.walk(root):  # Прогрев кэша каталогов ОС
+            pass
+        candidates = [
+            ('Рекурсия внутри os.walk (прежняя)', rescanning_traversal),
+            ('recursive_file_traversal (печать)', printed_traversal),
+            ('os.walk', lambda path: sum(len(names) for _, _, names in os.walk(path))),
+            ('scan_tree', lambda path: sum(1 for _ in iter_files(path))),
+        ] + [(f'scan_tree, {count} потоков',
+              lambda path, count=count: sum(1 for _ in iter_files(path, count)))
+             for count in workers]
+        candidates.append(('summarize_tree', lambda path: summarize_tree(path).files))
+        results = []
+        for name, walker in candidates:
+            start = time.perf_counter()
+            found = walker(root)
+            results.append((name, time.perf_counter() - start, found))
+        return results
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print(summarize_tree(os.path.dirname(os.path.abspath(__file__))))
+    print("\n=== Обход дерева из 100000 файлов ===")
+    print(f"{'Способ':<36} {'Время, с':>9} {'Файлов':>8}")
+    for name, seconds, found in benchmark_walkers():
+        print(f"{name:<36} {seconds:>9.3f} {found:>8}")
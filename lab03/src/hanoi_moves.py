@@ -0,0 +1,179 @@
+# hanoi_moves.py
+"""
+Ханойские башни без рекурсии и без перечисления всех ходов.
+
+Ход номер m (с 1) двигает диск, равный числу младших нулевых битов
+m плюс 1, с колышка (m & (m - 1)) % 3 на ((m | (m - 1)) + 1) % 3.
+Колышки здесь пронумерованы так, что башня переезжает с 0 на 2 при
+нечётном n и с 0 на 1 при чётном, поэтому k-й ход вычисляется за
+O(1) битовых операций (O(n) для длинных чисел), а генератор ходов
+не хранит стек.
+"""
+
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from recursion_tasks import hanoi
+
+
+def _peg_order(n, source, target, auxiliary):
+    """Колышки в нумерации формулы: 0 - source, башня едет на 2 (n нечётно) или 1."""
+    if n % 2:
+        return source, auxiliary, target
+    return source, target, auxiliary
+
+
+def hanoi_moves(n, source="A", target="C", auxiliary="B"):
+    """
+    Ленивый генератор ходов (диск, откуда, куда).
+
+    Complexity: O(1) на ход, O(1) памяти
+    """
+    pegs = _peg_order(n, source, target, auxiliary)
+    for m in range(1, 1 << n):  # 2^n - 1 ходов
+        yield ((m & -m).bit_length(),
+               pegs[(m & (m - 1)) % 3],
+               pegs[((m | (m - 1)) + 1) % 3])
+
+
+def hanoi_move(n, k, source="A", target="C", auxiliary="B"):
+    """
+    k-й ход (с 1) без перечисления предыдущих.
+
+    Complexity: O(n) - битовые операции над k из n битов
+    """
+    if not 1 <= k < 1 << n:
+        raise ValueError(f'move number must be in [1, 2^{n} - 1]')
+    pegs = _peg_order(n, source, target, auxiliary)
+    return ((k & -k).bit_length(), pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3])
+
+
+def hanoi_state(n, k, source="A", target="C", auxiliary="B"):
+    """
+    Расположение дисков после k ходов.
+
+    Диск d (начиная с самого большого) ещё на исходном колышке своей
+    подзадачи, если k < 2^(d-1); иначе он уже переложен, и остаток
+    k - 2^(d-1) относится ко второй половине подзадачи.
+
+    Returns:
+        {колышек: список дисков снизу вверх}
+
+    Complexity: O(n)
+    """
+    if not 0 <= k < 1 << n:
+        raise ValueError(f'move count must be in [0, 2^{n} - 1]')
+    state = {source: [], target: [], auxiliary: []}
+    for disk in range(n, 0, -1):  # O(n)
+        half = 1 << (disk - 1)
+        if k < half:  # Диск ещё не двигался: подзадача source -> auxiliary
+            state[source].append(disk)
+            target, auxiliary = auxiliary, target
+        else:  # Диск переложен: подзадача auxiliary -> target
+            state[target].append(disk)
+            k -= half
+            source, auxiliary = auxiliary, source
+    return state
+
+
+def _move_line(disk, source, target):
+    return f"Переместить диск {disk} с {source} на {target}\n"
+
+
+def write_moves(n, file, source="A", target="C", auxiliary="B", block_disks=12):
+    """
+    Запись всех ходов в текстовый файл большими блоками.
+
+    Ходы разбиваются на переносы башни из block_disks малых дисков
+    (2^block_disks - 1 ходов) и одиночные ходы больших дисков. Текст
+    переноса малой башни для каждой из 6 пар колышков строится один
+    раз и дальше пишется целиком одним вызовом write. Малая башня
+    перед каждым ходом большого диска стоит на колышке, не занятом
+    этим ходом.
+
+    Args:
+        n: Число дисков
+        file: Текстовый файл (или любой объект с методом write)
+        block_disks: Число малых дисков в одном блоке
+
+    Returns:
+        Число записанных ходов
+
+    Complexity: O(2^n) символов, O(2^block_disks) памяти
+    """
+    small = min(block_disks, n)
+    pegs = (source, target, auxiliary)
+    blocks = {}  # (откуда, куда) -> текст переноса малой башни
+
+    def block(start, end):
+        if (start, end) not in blocks:
+            spare = next(peg for peg in pegs if peg not in (start, end))
+            blocks[start, end] = "".join(
+                _move_line(*move) for move in hanoi_moves(small, start, end, spare))
+        return blocks[start, end]
+
+    write = file.write
+    tower = source  # Где стоит малая башня
+    for disk, start, end in hanoi_moves(n - small, source, target, auxiliary):
+        free = next(peg for peg in pegs if peg not in (start, end))
+        if small:
+            write(block(tower, free))
+        write(_move_line(disk + small, start, end))
+        tower = free
+    if small:
+        write(block(tower, target))
+    return (1 << n) - 1
+
+
+def benchmark_hanoi(n=20):
+    """
+    Ходов в секунду у рекурсивной печати и новых способов.
+
+    Returns:
+        Список (название, секунды, ходов в секунду)
+    """
+    moves = (1 << n) - 1
+    results = []
+
+    def timed(name, action):
+        start = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - start
+        results.append((name, elapsed, moves / elapsed))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'moves.txt')
+
+        def recursive_print():
+            with open(path, 'w', encoding='utf-8') as file, redirect_stdout(file):
+                hanoi(n, "A", "C", "B")
+
+        def generator_lines():
+            with open(path, 'w', encoding='utf-8') as file:
+                for move in hanoi_moves(n):
+                    file.write(_move_line(*move))
+
+        def bulk_writer():
+            with open(path, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                write_moves(n, file)
+
+        timed('Рекурсия с print (hanoi)', recursive_print)
+        timed('Генератор hanoi_moves, без вывода', lambda: sum(1 for _ in hanoi_moves(n)))
+        timed('Генератор + запись строк', generator_lines)
+        timed('write_moves', bulk_writer)
+        timed('write_moves в память', lambda: write_moves(n, io.StringIO()))
+    return results
+
+
+if __name__ == "__main__":
+    print(list(hanoi_moves(3)))
+    print(f"Ход 2^24 из 2^25 - 1: {hanoi_move(25, 1 << 24)}")
+    print(f"Состояние после 10^6 ходов (n = 25): {hanoi_state(25, 10 ** 6)}")
+
+    print("\n=== Ханойские башни, n = 20 ===")
+    print(f"{'Способ':<36} {'Время, с':>9} {'Ходов/с':>14}")
+    for name, seconds, rate in benchmark_hanoi():
+        print(f"{name:<36} {seconds:>9.3f} {rate:>14,.0f}")
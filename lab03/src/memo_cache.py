@@ -0,0 +1,203 @@
+# memo_cache.py
+"""
+Ограниченная мемоизация с подключаемой политикой вытеснения.
+
+    @memoize(maxsize=256)                 # LRU на 256 записей
+    @memoize(policy='lfu', maxsize=1000)  # LFU
+    @memoize(maxsize=None, max_bytes=1 << 20)  # только лимит в байтах
+
+У каждой декорированной функции свой кэш (wrapper.cache), поэтому
+разные функции не делят записи, как общий словарь memo. Доступ к кэшу
+защищён блокировкой; сама функция вычисляется вне блокировки, так что
+рекурсивные вызовы и другие потоки не ждут друг друга (два потока
+могут одновременно вычислить одно значение - сохранится любое).
+"""
+
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from functools import wraps
+
+
+class LRUPolicy:
+    """Вытесняется запись, к которой дольше всего не обращались. Все операции O(1)."""
+
+    def __init__(self):
+        self._order = OrderedDict()  # ключ -> None, от старых к свежим
+
+    def insert(self, key):
+        self._order[key] = None
+
+    def touch(self, key):
+        self._order.move_to_end(key)
+
+    def remove(self, key):
+        del self._order[key]
+
+    def victim(self):
+        return next(iter(self._order))
+
+
+class LFUPolicy:
+    """Вытесняется самая редко используемая запись (при равенстве - самая старая).
+
+    Ключи сгруппированы по частоте обращений, минимальная частота
+    отслеживается отдельно, поэтому insert, touch и remove стоят O(1).
+    Если remove опустошил группу минимальной частоты, минимум
+    пересчитывается лениво в victim() - O(число различных частот), -
+    обычно не пересчитывается вовсе: при вытеснении сразу следует
+    insert, который делает минимумом 1.
+    """
+
+    def __init__(self):
+        self._freq = {}  # ключ -> частота
+        self._buckets = defaultdict(OrderedDict)  # частота -> ключи в порядке вставки
+        self._min_freq = 0
+
+    def insert(self, key):
+        self._freq[key] = 1
+        self._buckets[1][key] = None
+        self._min_freq = 1
+
+    def touch(self, key):
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets[freq + 1][key] = None
+
+    def remove(self, key):
+        freq = self._freq.pop(key)
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:  # Минимум неизвестен до victim() или insert()
+                self._min_freq = None
+
+    def victim(self):
+        if self._min_freq is None:
+            self._min_freq = min(self._buckets)
+        return next(iter(self._buckets[self._min_freq]))
+
+
+POLICIES = {'lru': LRUPolicy, 'lfu': LFUPolicy}
+
+
+class MemoCache:
+    """Кэш значений с ограничением по числу записей и/или по байтам."""
+
+    def __init__(self, maxsize=128, policy='lru', max_bytes=None,
+                 sizeof=sys.getsizeof):
+        """
+        Args:
+            maxsize: Максимум записей (None - без ограничения)
+            policy: 'lru', 'lfu' или объект с методами insert/touch/remove/victim
+            max_bytes: Максимальный суммарный размер ключей и значений
+            sizeof: Оценка размера объекта в байтах
+        """
+        if isinstance(policy, str):
+            if policy not in POLICIES:
+                raise ValueError(f'Unknown eviction policy: {policy}')
+            policy = POLICIES[policy]()
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._sizeof = sizeof
+        self._data = {}  # ключ -> (значение, размер записи)
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+        self.nbytes = 0
+
+    def get(self, key, default=None):
+        """Значение по ключу с учётом обращения в политике. O(1)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.policy.touch(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """Сохранение значения с предварительным вытеснением записей,
+        чтобы новая поместилась в оба лимита. O(1) амортизированно"""
+        size = self._sizeof(key) + self._sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:  # Перезапись: учитываем как новую запись
+                self.nbytes -= old[1]
+                self.policy.remove(key)
+            if self.maxsize == 0 or (self.max_bytes is not None and size > self.max_bytes):
+                return  # Запись не помещается даже в пустой кэш
+            while self._data and (
+                    (self.maxsize is not None and len(self._data) >= self.maxsize)
+                    or (self.max_bytes is not None and self.nbytes + size > self.max_bytes)):
+                victim = self.policy.victim()
+                self.policy.remove(victim)
+                self.nbytes -= self._data.pop(victim)[1]
+                self.evictions += 1
+            self.policy.insert(key)
+            self._data[key] = (value, size)
+            self.nbytes += size
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._data):
+                self.policy.remove(key)
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Счётчики кэша."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'bytes': self.nbytes,
+                'maxsize': self.maxsize,
+                'max_bytes': self.max_bytes,
+            }
+
+
+_MISSING = object()
+_KWARGS_MARK = object()  # Отделяет именованные аргументы в ключе (как functools._make_key)
+
+
+def memoize(maxsize=128, policy='lru', max_bytes=None, sizeof=sys.getsizeof):
+    """
+    Декоратор мемоизации с отдельным ограниченным кэшем для функции.
+
+    Аргументы функции должны быть хешируемыми. Параметры - как у MemoCache.
+    У обёртки есть атрибут cache и методы cache_stats() и cache_clear().
+    """
+    def decorator(func):
+        cache = MemoCache(maxsize, policy, max_bytes, sizeof)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:  # Маркер не даёт совпасть f(1, a=2) и f((1,), (('a', 2),))
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)  # Вне блокировки
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_stats = cache.stats
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -1,21 +1,115 @@
 # memoization.py
+import os
+import random
+import sys
 import time
+import tracemalloc
 import matplotlib.pyplot as plt
+from fibonacci_fast import fibonacci_doubling, fibonacci_matrix
+from memo_cache import memoize
 from recursion import fibonacci as fibonacci_naive
 
-# Мемоизированная версия числа Фибоначчи
-memo = {}
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from common.memo_store import persistent_memoize
+from common.timing import measure
+
+# Файл постоянного кэша (переживает перезапуск скрипта)
+MEMO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.memo', 'lab03.sqlite3')
 
+# Мемоизированная версия числа Фибоначчи
+# Кэш ограничен и принадлежит только этой функции (вместо общего словаря memo)
+@memoize(maxsize=256)
 def fibonacci_memo(n):
-    if n in memo:
-        return memo[n]
-    if n == 0:
-        memo[n] = 0
-    elif n == 1:
-        memo[n] = 1
-    else:
-        memo[n] = fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
-    return memo[n]
+    if n < 2:
+        return n
+    return fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
+
+# Временная сложность: O(n) при первом вызове, O(1) из кэша
+# Память: O(min(n, maxsize))
+
+
+# Та же функция с результатами на диске: при повторном запуске
+# скрипта значения читаются из базы, а не вычисляются заново.
+# Изменение исходного кода функции сбрасывает её записи.
+@persistent_memoize(MEMO_PATH, max_entries=100_000)
+def fibonacci_persistent(n):
+    if n < 2:
+        return n
+    return fibonacci_persistent(n - 1) + fibonacci_persistent(n - 2)
+
+
+def measure_bounded_memory(calls=200_000, sample_every=10_000, seed=0):
+    """
+    Память кэша на длинном потоке вызовов с неограниченным числом
+    различных аргументов (распределение Парето: частые "горячие"
+    ключи и бесконечный хвост редких).
+
+    Returns:
+        {название: (номера вызовов, память в КБ, статистика кэша)}
+    """
+    configs = [
+        ('Без ограничения', dict(maxsize=None)),
+        ('LRU 1024', dict(maxsize=1024)),
+        ('LFU 1024', dict(maxsize=1024, policy='lfu')),
+        ('128 КБ', dict(maxsize=None, max_bytes=128 * 1024)),
+    ]
+    rng = random.Random(seed)
+    keys = [int(rng.paretovariate(0.5)) for _ in range(calls)]
+
+    results = {}
+    for name, options in configs:
+        @memoize(**options)
+        def render(n):
+            return str(n) * 8
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        points, memory = [], []
+        for i, key in enumerate(keys, 1):
+            render(key)
+            if i % sample_every == 0:
+                points.append(i)
+                memory.append((tracemalloc.get_traced_memory()[0] - base) / 1024)
+        tracemalloc.stop()
+        results[name] = (points, memory, render.cache_stats())
+    return results
+
+def measure_fibonacci_sweep(n_values, naive_limit=30):
+    """
+    Время вычисления F(n) разными способами.
+
+    Мемоизированная версия считается с пустым кэшем и падает на глубине
+    рекурсии; наивная - только до naive_limit. Малые n замеряются
+    common.timing.measure, большие - одним запуском (вызов длится
+    секунды, повторы почти не уточняют результат).
+
+    Returns:
+        {название: список времён в секундах, None - не измерялось}
+    """
+    def time_call(func, n):
+        if n < 10 ** 5:
+            return measure(func, n, max_time=0.5).median
+        start = time.perf_counter()
+        func(n)
+        return time.perf_counter() - start
+
+    def memo_cold(n):
+        fibonacci_memo.cache_clear()
+        return fibonacci_memo(n)
+
+    results = {'Наивная рекурсия': [], 'Мемоизация': [],
+               'Быстрое удвоение': [], 'Матрица 2x2': []}
+    for n in n_values:
+        results['Наивная рекурсия'].append(
+            time_call(fibonacci_naive, n) if n <= naive_limit else None)
+        try:
+            results['Мемоизация'].append(time_call(memo_cold, n))
+        except RecursionError:
+            results['Мемоизация'].append(None)
+        results['Быстрое удвоение'].append(time_call(fibonacci_doubling, n))
+        results['Матрица 2x2'].append(time_call(fibonacci_matrix, n))
+    return results
+
 
 print("Сравнение наивной и мемоизированной версий для n = 35")
 
@@ -32,6 +126,13 @@ memoized_time = end - start
 print(f"Наивная версия: {naive_time:.5f} секунд")
 print(f"С мемоизацией: {memoized_time:.5f} секунд")
 
+stored = len(fibonacci_persistent.store)
+start = time.perf_counter()
+fibonacci_persistent(300)
+persistent_time = time.perf_counter() - start
+print(f"Постоянный кэш: F(300) за {persistent_time:.5f} секунд "
+      f"(записей с прошлых запусков: {stored}, {MEMO_PATH})")
+
 n_values = [10, 20, 30, 35]
 naive_times = []
 memoized_times = []
@@ -49,7 +150,42 @@ for n in n_values:
     end = time.time()
     memoized_times.append(end - start)
 
+print("\nВычисление F(n) для n от 10 до 10^7, мс")
+sweep_n = [10 ** k for k in range(1, 8)]
+sweep = measure_fibonacci_sweep(sweep_n)
+print(f"{'n':>10} " + " ".join(f"{name:>18}" for name in sweep))
+for i, n in enumerate(sweep_n):
+    cells = ("-" if times[i] is None else f"{times[i] * 1000:.4f}" for times in sweep.values())
+    print(f"{n:>10} " + " ".join(f"{cell:>18}" for cell in cells))
+
+plt.figure()
+for name, times in sweep.items():
+    points = [(n, t) for n, t in zip(sweep_n, times) if t is not None]
+    plt.loglog([n for n, _ in points], [t for _, t in points], 'o-', label=name)
+plt.xlabel('n')
+plt.ylabel('Время (секунды)')
+plt.title('Вычисление F(n): от O(2^n) до O(log n) умножений')
+plt.legend()
+plt.grid(True, which='both')
+
+print("\nПамять кэша на потоке из 200000 вызовов")
+print(f"{'Кэш':<16} {'Память, КБ':>11} {'Записей':>8} {'Попадания':>10} {'Вытеснения':>11}")
+bounded = measure_bounded_memory()
+for name, (points, memory, stats) in bounded.items():
+    hit_rate = stats['hits'] / (stats['hits'] + stats['misses'])
+    print(f"{name:<16} {memory[-1]:>11.1f} {stats['size']:>8} {hit_rate:>10.1%} {stats['evictions']:>11}")
+
+plt.figure()
+for name, (points, memory, stats) in bounded.items():
+    plt.plot(points, memory, label=name)
+plt.xlabel('Число вызовов')
+plt.ylabel('Память (КБ)')
+plt.title('Память кэша мемоизации')
+plt.legend()
+plt.grid(True)
+
 # Построение графика
+plt.figure()
 plt.plot(n_values, naive_times, label='Наивная рекурсия')
 plt.plot(n_values, memoized_times, label='Мемоизация')
 plt.xlabel('n')
@@ -14,13 +14,28 @@ def binary_search(arr, target, low, high):
         return binary_search(arr, target, mid + 1, high)
 
 # Рекурсивный обход файловой системы
+# Каждый каталог читается один раз: os.scandir возвращает только
+# содержимое текущего каталога (os.walk уже обходит всё поддерево,
+# и рекурсия внутри него перечитывала каталоги для каждого предка)
 def recursive_file_traversal(path):
-    for root, dirs, files in os.walk(path):
-        print(f"Каталог: {root}")
-        for file in files:
-            print(f"    Файл: {file}")
-        for dir in dirs:
-            recursive_file_traversal(os.path.join(root, dir))
+    print(f"Каталог: {path}")
+    try:
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    dirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            dirs.append(entry.path)
+        else:
+            print(f"    Файл: {entry.name}")
+    for dir in dirs:
+        recursive_file_traversal(dir)
+
+# Временная сложность: O(каталоги + файлы)
+# Глубина рекурсии: глубина дерева
+# Без рекурсии и с пулом потоков: file_walker.scan_tree
 
 # Ханойские башни
 def hanoi(n, source, target, auxiliary):
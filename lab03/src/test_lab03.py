@@ -0,0 +1,297 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+
+from file_walker import iter_files, make_test_tree, scan_tree, summarize_tree
+from fast_power import (matrix_multiply, matrix_power, power as power_iterative,
+                        power_many, power_mod, power_window, window_decomposition)
+from hanoi_moves import hanoi_move, hanoi_moves, hanoi_state, write_moves
+from fibonacci_fast import fibonacci_doubling, fibonacci_matrix
+from memo_cache import LFUPolicy, MemoCache, memoize
+from recursion_tasks import hanoi as hanoi_printed, recursive_file_traversal
+from recursion import factorial as factorial_recursive, fibonacci
+from trampoline import (binary_search_stackless, factorial, factorial_binary_split,
+                        hanoi, power, run)
+
+
+class TestMemoCache(unittest.TestCase):
+    def test_lru_evicts_least_recent(self):
+        cache = MemoCache(maxsize=3)
+        for key in 'abc':
+            cache.put(key, key)
+        cache.get('a')
+        cache.put('d', 'd')
+        self.assertEqual(set(cache._data), {'a', 'c', 'd'})
+        self.assertEqual(cache.evictions, 1)
+
+    def test_lfu_evicts_least_frequent(self):
+        cache = MemoCache(maxsize=3, policy='lfu')
+        for key in 'abc':
+            cache.put(key, key)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.put('d', 'd')
+        self.assertEqual(set(cache._data), {'a', 'b', 'd'})
+        cache.put('e', 'e')  # Новая запись d вытесняется первой
+        self.assertEqual(set(cache._data), {'a', 'b', 'e'})
+
+    def test_keyword_arguments_do_not_collide(self):
+        @memoize()
+        def describe(*args, **kwargs):
+            return args, kwargs
+
+        self.assertEqual(describe(1, a=2), ((1,), {'a': 2}))
+        self.assertEqual(describe((1,), (('a', 2),)), (((1,), (('a', 2),)), {}))
+        self.assertEqual(describe(1, a=2), ((1,), {'a': 2}))
+        self.assertEqual(describe.cache_stats()['hits'], 1)
+
+    def test_lfu_recomputes_minimum_after_remove(self):
+        policy = LFUPolicy()
+        for key in 'abc':
+            policy.insert(key)
+        policy.touch('b')
+        policy.touch('b')
+        policy.touch('c')
+        policy.remove('a')  # Группа частоты 1 опустела
+        self.assertEqual(policy.victim(), 'c')
+        policy.remove('c')
+        self.assertEqual(policy.victim(), 'b')
+
+    def test_byte_limit(self):
+        cache = MemoCache(maxsize=None, max_bytes=1000, sizeof=lambda obj: 10)
+        for i in range(500):
+            cache.put(i, i)
+        self.assertEqual(len(cache), 50)
+        self.assertLessEqual(cache.nbytes, 1000)
+        big = MemoCache(maxsize=None, max_bytes=15, sizeof=lambda obj: 10)
+        big.put(1, 1)  # Запись больше лимита не сохраняется
+        self.assertEqual(len(big), 0)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            MemoCache(policy='fifo')
+
+
+class TestMemoize(unittest.TestCase):
+    def test_bounded_recursion(self):
+        @memoize(maxsize=4)
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(200), 280571172992510140037611932413038677189525)
+        stats = fib.cache_stats()
+        self.assertEqual(stats['size'], 4)
+        self.assertEqual(stats['misses'], 201)
+
+    def test_per_function_isolation(self):
+        @memoize()
+        def double(n):
+            return 2 * n
+
+        @memoize()
+        def triple(n):
+            return 3 * n
+
+        self.assertEqual((double(5), triple(5)), (10, 15))
+        self.assertEqual(len(double.cache), 1)
+        double.cache_clear()
+        self.assertEqual(len(double.cache), 0)
+        self.assertEqual(len(triple.cache), 1)
+
+    def test_kwargs_and_threads(self):
+        calls = []
+
+        @memoize(maxsize=None)
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, b=2), add(1, b=2))
+        self.assertEqual(len(calls), 1)
+
+        threads = [threading.Thread(target=lambda: [add(i % 50) for i in range(2000)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = add.cache_stats()
+        self.assertEqual(stats['size'], 51)
+        self.assertEqual(stats['hits'] + stats['misses'], 8002)
+
+
+class TestFastFibonacci(unittest.TestCase):
+    def test_matches_naive(self):
+        for n in range(25):
+            self.assertEqual(fibonacci_doubling(n), fibonacci(n))
+            self.assertEqual(fibonacci_matrix(n), fibonacci(n))
+
+    def test_modulus(self):
+        for n in range(300):
+            for modulus in (1, 2, 10, 10 ** 9 + 7):
+                expected = fibonacci_doubling(n) % modulus
+                self.assertEqual(fibonacci_doubling(n, modulus), expected)
+                self.assertEqual(fibonacci_matrix(n, modulus), expected)
+        # Период Пизано для модуля 10 равен 60
+        self.assertEqual(fibonacci_doubling(10 ** 18, 10), fibonacci_doubling(10 ** 18 % 60) % 10)
+
+    def test_large_n(self):
+        value = fibonacci_doubling(100000)
+        self.assertEqual(value, fibonacci_matrix(100000))
+        self.assertEqual(value.bit_length(), 69424)
+        with self.assertRaises(ValueError):
+            fibonacci_doubling(-1)
+
+
+class TestTrampoline(unittest.TestCase):
+    def test_matches_recursive_versions(self):
+        for n in range(30):
+            self.assertEqual(factorial(n), factorial_recursive(n))
+            self.assertEqual(factorial_binary_split(n), factorial_recursive(n))
+            self.assertEqual(power(3, n), 3 ** n)
+        arr = list(range(0, 100, 3))
+        for target in range(-1, 101):
+            expected = arr.index(target) if target in arr else -1
+            self.assertEqual(binary_search_stackless(arr, target, 0, len(arr) - 1), expected)
+
+    def test_deep_recursion(self):
+        n = 20000  # Обычная рекурсия упала бы с RecursionError
+        self.assertEqual(factorial(n), factorial_binary_split(n))
+
+    def test_hanoi_moves(self):
+        moves = []
+        hanoi(4, 'A', 'C', 'B', lambda disk, source, target: moves.append((disk, source, target)))
+        self.assertEqual(len(moves), 15)
+        self.assertEqual(moves[7], (4, 'A', 'C'))
+
+    def test_exceptions_propagate_to_caller(self):
+        def steps(n):
+            if n == 0:
+                raise ValueError('base')
+            try:
+                return (yield steps(n - 1))
+            except ValueError:
+                return n
+
+        self.assertEqual(run(steps(5)), 1)
+        with self.assertRaises(TypeError):
+            run((yield_value for yield_value in [1]))
+
+
+class TestFileWalker(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        make_test_tree(self.root, files=270, fanout=3, depth=3, size=5)
+        with open(os.path.join(self.root, 'README'), 'wb') as file:
+            file.write(b'abc')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_each_directory_once(self):
+        for workers in (0, 4):
+            directories = [directory for directory, _ in scan_tree(self.root, workers)]
+            self.assertEqual(len(directories), 1 + 3 + 9 + 27)
+            self.assertEqual(len(set(directories)), len(directories))
+            self.assertEqual(len(list(iter_files(self.root, workers))), 271)
+
+    def test_summary(self):
+        for workers in (0, 3):
+            summary = summarize_tree(self.root, workers)
+            self.assertEqual(summary.files, 271)
+            self.assertEqual(summary.directories, 40)
+            self.assertEqual(summary.total_bytes, 270 * 5 + 3)
+            self.assertEqual(summary.extensions['.py'], 54)
+            self.assertEqual(summary.extensions[''], 1)
+
+    def test_recursive_traversal_visits_once(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            recursive_file_traversal(self.root)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(sum(line.startswith('Каталог: ') for line in lines), 40)
+        self.assertEqual(sum(line.startswith('    Файл: ') for line in lines), 271)
+
+
+class TestHanoiMoves(unittest.TestCase):
+    def test_matches_recursive_printer(self):
+        for n in range(1, 9):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                hanoi_printed(n, 'A', 'C', 'B')
+            lines = ''.join(f'Переместить диск {disk} с {source} на {target}\n'
+                            for disk, source, target in hanoi_moves(n))
+            self.assertEqual(lines, output.getvalue())
+            for block_disks in (0, 2, 12):
+                written = io.StringIO()
+                self.assertEqual(write_moves(n, written, block_disks=block_disks), 2 ** n - 1)
+                self.assertEqual(written.getvalue(), output.getvalue())
+
+    def test_random_access(self):
+        n = 7
+        pegs = {'A': list(range(n, 0, -1)), 'B': [], 'C': []}
+        self.assertEqual(hanoi_state(n, 0), pegs)
+        for k, (disk, source, target) in enumerate(hanoi_moves(n), 1):
+            self.assertEqual(hanoi_move(n, k), (disk, source, target))
+            self.assertEqual(pegs[source][-1], disk)
+            pegs[target].append(pegs[source].pop())
+            self.assertEqual(hanoi_state(n, k), pegs)
+        self.assertEqual(hanoi_move(64, 2 ** 63), (64, 'A', 'C'))
+        with self.assertRaises(ValueError):
+            hanoi_move(3, 8)
+
+
+class TestFastPower(unittest.TestCase):
+    def test_matches_builtin_pow(self):
+        for base in (0, 1, 2, 7, 12345):
+            for exponent in range(70):
+                self.assertEqual(power_iterative(base, exponent), base ** exponent)
+                for width in (None, 1, 3):
+                    self.assertEqual(power_window(base, exponent, width=width), base ** exponent)
+                self.assertEqual(power_mod(base, exponent, 1000003), pow(base, exponent, 1000003))
+        self.assertEqual(power_mod(5, 10, 1), 0)
+
+    def test_window_decomposition(self):
+        width, steps = window_decomposition(0b1011000111, 2)
+        self.assertEqual(width, 2)
+        self.assertEqual(steps, [(0, 1), (3, 3), (4, 1), (2, 3)])
+        for digit in (digit for _, digit in steps if digit):
+            self.assertEqual(digit % 2, 1)
+
+    def test_many_bases_and_custom_multiply(self):
+        modulus = 2 ** 127 - 1
+        exponent = 3 ** 40
+        bases = list(range(2, 30))
+        self.assertEqual(power_many(bases, exponent, modulus=modulus),
+                         [pow(base, exponent, modulus) for base in bases])
+        fib = matrix_power([[1, 1], [1, 0]], 90)
+        self.assertEqual(fib[0][1], fibonacci_doubling(90))
+        self.assertEqual(matrix_power([[1, 1], [1, 0]], 10 ** 6, modulus=1000)[0][1],
+                         fibonacci_doubling(10 ** 6, 1000))
+        identity = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        self.assertEqual(matrix_power([[2, 1, 0], [0, 1, 3], [1, 0, 1]], 0), identity)
+        cube = [[2, 1, 0], [0, 1, 3], [1, 0, 1]]
+        self.assertEqual(matrix_power(cube, 3), matrix_multiply(cube, matrix_multiply(cube, cube)))
+        concat = power_iterative('ab', 5, multiply=lambda x, y: x + y, identity='')
+        self.assertEqual(concat, 'ab' * 5)
+
+    def test_zero_exponent_reduces_identity(self):
+        for func in (power_iterative, power_window):
+            self.assertEqual(func(5, 0, modulus=1), 0)
+            self.assertEqual(func(5, 0, identity=10, modulus=7), 3)
+        self.assertEqual(power_many([2, 3], 0, modulus=1), [0, 0])
+        self.assertEqual(power_mod(5, 0, 1), 0)
+
+    def test_matrix_power_reduces_base_and_identity(self):
+        self.assertEqual(matrix_power([[5, 7], [1, 4]], 1, modulus=3), [[2, 1], [1, 1]])
+        self.assertEqual(matrix_power([[5, 7], [1, 4]], 0, modulus=1), [[0, 0], [0, 0]])
+        self.assertEqual(matrix_power([[5, 7], [1, 4]], 0, modulus=3), [[1, 0], [0, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
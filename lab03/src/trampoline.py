@@ -0,0 +1,221 @@
+# trampoline.py
+"""
+Выполнение рекурсивных определений без стека вызовов Python.
+
+Рекурсивная функция записывается генератором: вместо вызова f(x)
+она делает `yield f(x)` и получает результат обратно из yield.
+Функция run() держит незавершённые вызовы в собственном списке
+(явный стек в куче), поэтому глубина ограничена только памятью, а не
+sys.getrecursionlimit():
+
+    def factorial_steps(n):
+        if n <= 1:
+            return 1
+        return n * (yield factorial_steps(n - 1))
+
+    run(factorial_steps(10 ** 5))
+
+Цена - создание генератора и send/StopIteration на каждый вызов:
+в CPython 3.11+ это в несколько раз дороже обычного кадра (см.
+benchmark_depths), зато глубина 10^6 не требует ни поднятия предела
+рекурсии, ни большого стека потока.
+"""
+
+import gc
+import sys
+import time
+from types import GeneratorType
+
+from recursion_tasks import binary_search
+
+
+def run(call):
+    """
+    Выполнение генератора-вызова на явном стеке.
+
+    Исключение во вложенном вызове передаётся вызывающему генератору
+    (throw), поэтому try/except в шагах работает как при рекурсии.
+
+    Args:
+        call: Генератор, который yield-ит вложенные вызовы (генераторы)
+            и возвращает результат через return
+
+    Returns:
+        Результат внешнего вызова
+
+    Complexity: O(число вызовов), память O(максимальная глубина)
+    """
+    stack = []  # Вызывающие генераторы, ожидающие результата
+    push, pop = stack.append, stack.pop
+    current, value, error = call, None, None
+    while True:
+        try:
+            if error is None:
+                nested = current.send(value)
+            else:
+                exc, error = error, None
+                nested = current.throw(exc)
+        except StopIteration as stop:  # Вызов завершён - результат вызывающему
+            if not stack:
+                return stop.value
+            current, value = pop(), stop.value
+            continue
+        except BaseException as exc:  # Исключение - вызывающему
+            if not stack:
+                raise
+            current, error = pop(), exc
+            continue
+        if type(nested) is not GeneratorType:
+            current.close()
+            raise TypeError('recursive steps must yield generator calls')
+        push(current)
+        current, value = nested, None
+
+
+def stackless(steps):
+    """Обычная функция из генератора шагов: f(*args) = run(steps(*args))."""
+    def wrapper(*args):
+        return run(steps(*args))
+    wrapper.__name__ = steps.__name__.replace('_steps', '')
+    wrapper.__doc__ = steps.__doc__
+    wrapper.steps = steps
+    return wrapper
+
+
+# Определения из recursion.py и recursion_tasks.py в виде шагов
+
+def factorial_steps(n):
+    if n == 0 or n == 1:
+        return 1
+    return n * (yield factorial_steps(n - 1))
+
+
+def power_steps(a, n):
+    if n == 0:
+        return 1
+    half = yield power_steps(a, n // 2)
+    return half * half * a if n % 2 else half * half
+
+
+def binary_search_steps(arr, target, low, high):
+    if low > high:
+        return -1
+    mid = (low + high) // 2
+    if arr[mid] == target:
+        return mid
+    elif arr[mid] > target:
+        return (yield binary_search_steps(arr, target, low, mid - 1))
+    else:
+        return (yield binary_search_steps(arr, target, mid + 1, high))
+
+
+def hanoi_steps(n, source, target, auxiliary, move):
+    """Ханойские башни: move(disk, source, target) для каждого хода."""
+    if n == 1:
+        move(1, source, target)
+        return
+    yield hanoi_steps(n - 1, source, auxiliary, target, move)
+    move(n, source, target)
+    yield hanoi_steps(n - 1, auxiliary, target, source, move)
+
+
+factorial = stackless(factorial_steps)
+power = stackless(power_steps)
+binary_search_stackless = stackless(binary_search_steps)
+hanoi = stackless(hanoi_steps)
+
+# Временная и пространственная сложность - как у рекурсивных версий,
+# но глубина не ограничена стеком вызовов
+
+
+def _range_product(low, high):
+    """Произведение low * (low + 1) * ... * (high - 1) делением пополам."""
+    if high - low <= 16:  # Короткий отрезок - простым циклом
+        result = 1
+        for k in range(low, high):
+            result *= k
+        return result
+    mid = (low + high) // 2
+    return _range_product(low, mid) * _range_product(mid, high)
+
+
+def factorial_binary_split(n):
+    """
+    Факториал бинарным разбиением произведения.
+
+    Перемножаются числа близкой длины, поэтому работает быстрое
+    (Карацуба) умножение длинных чисел, а не n умножений большого
+    числа на маленькое. Глубина рекурсии - O(log n).
+
+    Complexity: O(M(n log n) log n), где M - стоимость умножения
+    """
+    if n < 0:
+        raise ValueError('n must be non-negative')
+    return _range_product(2, n + 1)
+
+
+def _depth_native(n):
+    return 0 if n == 0 else 1 + _depth_native(n - 1)
+
+
+def _depth_steps(n):
+    return 0 if n == 0 else 1 + (yield _depth_steps(n - 1))
+
+
+def benchmark_depths(depths=(10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6)):
+    """
+    Время рекурсии глубины n на кадрах Python и на явном стеке.
+
+    Для обычной рекурсии временно поднимается предел глубины
+    (в CPython 3.11+ вызовы Python-функций не расходуют стек C).
+    Сборщик мусора на время замеров отключается: иначе он многократно
+    обходит миллион живых генераторов (или кадров).
+
+    Returns:
+        Список (глубина, время кадров, время явного стека) в секундах
+    """
+    results = []
+    limit = sys.getrecursionlimit()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        sys.setrecursionlimit(max(limit, max(depths) + 100))
+        for depth in depths:
+            start = time.perf_counter()
+            _depth_native(depth)
+            native = time.perf_counter() - start
+            start = time.perf_counter()
+            run(_depth_steps(depth))
+            stack = time.perf_counter() - start
+            results.append((depth, native, stack))
+    finally:
+        sys.setrecursionlimit(limit)
+        if gc_enabled:
+            gc.enable()
+    return results
+
+
+if __name__ == "__main__":
+    arr = list(range(0, 2 * 10 ** 6, 2))
+    print(f"binary_search: {binary_search(arr, 777776, 0, len(arr) - 1)}, "
+          f"явный стек: {binary_search_stackless(arr, 777776, 0, len(arr) - 1)}")
+    print(f"power(3, 100) = {power(3, 100)}")
+    moves = []
+    hanoi(3, "A", "C", "B", lambda disk, source, target: moves.append((disk, source, target)))
+    print(f"Ханойские башни, 3 диска: {moves}")
+
+    print("\n=== Рекурсия на кадрах и на явном стеке ===")
+    print(f"{'Глубина':>9} {'Кадры, мс':>11} {'Явный стек, мс':>15}")
+    for depth, native, stack in benchmark_depths():
+        print(f"{depth:>9} {native * 1000:>11.3f} {stack * 1000:>15.3f}")
+
+    print("\n=== Факториал ===")
+    for n in (10 ** 4, 5 * 10 ** 4, 10 ** 5):
+        start = time.perf_counter()
+        slow = factorial(n)
+        stack_time = time.perf_counter() - start
+        start = time.perf_counter()
+        fast = factorial_binary_split(n)
+        split_time = time.perf_counter() - start
+        assert slow == fast
+        print(f"n = {n}: явный стек {stack_time:.3f} с, бинарное разбиение {split_time:.3f} с")
@@ -3,11 +3,15 @@
 Измеряет время выполнения каждого алгоритма на различных размерах и типах данных.
 """
 
-import timeit  # O(1)
+import os  # O(1)
+import sys  # O(1)
 import json  # O(1)
 from sorts import *  # O(1)
 import generate_data as gen  # O(1)
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))  # O(1)
+from common.timing import measure  # O(1)
+
 sizes = [100, 1000, 5000, 10000]  # O(1)
 types = {  # O(1)
     "random": gen.generate_random,
@@ -36,11 +40,10 @@ for tname, tfunc in types.items():  # O(4) внешний цикл по 4 тип
 
         for aname, afunc in algorithms.items():  # O(5) цикл по 5 алгоритмам
 
-            def test():  # O(1)
-                afunc(arr[:])  # O(n) копирование массива + O(T(n)) сортировка, где T(n) - сложность алгоритма
-
-            duration = timeit.timeit(test, number=5)  # O(5 * T(n)) выполнение тестовой функции 5 раз
-            results[tname][n][aname] = duration  # O(1)
+            # Копия массива создаётся в setup, вне замера времени
+            timing = measure(afunc, setup=lambda: (arr[:],),  # O(r * T(n)) r повторов, не меньше 5
+                             warmup=1, min_repeats=5, max_time=5.0)
+            results[tname][n][aname] = timing.median  # O(1) медиана времени одной сортировки (сек)
 
 with open("results.json", "w") as f:  # O(1)
     json.dump(results, f, indent=4)  # O(r) где r - размер результирующего JSON
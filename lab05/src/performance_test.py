@@ -20,10 +20,15 @@ import string  # O(1) импорт
 import platform  # O(1) импорт
 import multiprocessing  # O(1) импорт
 import statistics  # O(1) импорт
+import os  # O(1) импорт
+import sys  # O(1) импорт
 from hash_functions import simple_hash, poly_hash, djb2_hash  # O(1) импорт
 from hash_table_chaining import HashTableChaining  # O(1) импорт
 from hash_table_open_addressing import HashTableOpenAddressing  # O(1) импорт
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))  # O(1) путь к common
+from common.timing import measure_batched  # O(1) импорт пакетного микро-бенчмарка
+
 HASH_FUNCS = {  # O(1) словарь
     "simple": simple_hash,  # O(1)
     "poly": poly_hash,  # O(1)
@@ -155,6 +160,11 @@ def measure():  # O(3*3*4*5*операции) главная функция дл
                             pass  # O(1) игнорируем ошибку если ключа нет
                     delete_times.append(time.perf_counter() - start)  # O(1) добавление результата
 
+                # Латентность одного get: пакет вызовов между отметками таймера
+                # за вычетом пустого цикла (500 вызовов в одном замере слишком мало)
+                probe_key = existing_keys[len(existing_keys) // 2]  # O(1) ключ из середины вставок
+                get_latency = measure_batched(tbl.get, probe_key, max_time=0.2)  # O(r * K * (1+α))
+
                 stats = tbl.stats()  # O(capacity) получение финальной статистики
 
                 def summarize(times, ops):  # O(REPEATS) функция для суммаризации результатов
@@ -176,6 +186,12 @@ def measure():  # O(3*3*4*5*операции) главная функция дл
                     "search_hit": summarize(search_hit_times, 500),  # O(REPEATS) суммаризация успешных поисков
                     "search_miss": summarize(search_miss_times, 500),  # O(REPEATS) суммаризация промахов поиска
                     "delete": summarize(delete_times, 200),  # O(REPEATS) суммаризация удалений
+                    "get_latency": {  # O(1) пакетный замер get
+                        "per_op_median": get_latency.median,  # O(1) медиана времени одного get
+                        "per_op_min": get_latency.min,  # O(1) минимум
+                        "per_op_iqr": get_latency.iqr,  # O(1) межквартильный размах
+                        "batch": get_latency.number  # O(1) вызовов в одном замере
+                    },
                     "collisions": stats.get("collisions", None),  # O(1) число коллизий
                     "load_factor": stats.get("load_factor", None),  # O(1) коэффициент заполнения
                     "size": stats.get("size", None),  # O(1) число элементов в таблице
@@ -183,7 +199,7 @@ def measure():  # O(3*3*4*5*операции) главная функция дл
                     "repeats": REPEATS  # O(1) число выполненных повторений
                 }
                 # Вывод промежуточного результата для отслеживания прогресса
-                print(f"{hf_name} | {tbl_name} | lf={lf} -> insert per-op {results[hf_name][tbl_name][str(lf)]['insert']['per_op_median']:.6f}s, collisions={stats.get('collisions')}")  # O(1) печать
+                print(f"{hf_name} | {tbl_name} | lf={lf} -> insert per-op {results[hf_name][tbl_name][str(lf)]['insert']['per_op_median']:.6f}s, get {get_latency.median * 1e9:.0f}ns, collisions={stats.get('collisions')}")  # O(1) печать
     # Подготовка выходного словаря с информацией о машине и результатами
     out = {  # O(1) создание итогового словаря
         "machine_info": machine_info,  # O(1) информация об оборудовании
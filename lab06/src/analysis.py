@@ -4,11 +4,15 @@
           Включает визуализацию дерева и сравнение времени поиска
           для сбалансированного и вырожденного дерева.
 """
-import time  # O(1)
+import os  # O(1)
+import sys  # O(1)
 import random  # O(1)
 import matplotlib.pyplot as plt  # O(1)
 from binary_search_tree import BinarySearchTree  # O(1)
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))  # O(1)
+from common.timing import measure  # O(1)
+
 def visualize_tree(node, level=0, prefix="Root: "):  # O(n)
     """
     Текстовая визуализация дерева в консоли с иерархическим представлением.
@@ -57,7 +61,7 @@ def measure_search_time(bst, size, tree_type):  # O(n log n) в среднем,
     """
     Измеряет время поиска всех элементов в дереве.
     Параметры: bst - дерево, size - размер дерева, tree_type - тип дерева
-    Возвращает: время поиска в секундах
+    Возвращает: медианное время поиска в секундах
     Сложность: O(n log n) в среднем, O(n²) в худшем случае
     """
     # Заполнение дерева
@@ -69,13 +73,12 @@ def measure_search_time(bst, size, tree_type):  # O(n log n) в среднем,
     for value in elements:  # O(n)
         bst.insert(value)  # O(log n) в среднем, O(n) в худшем случае
 
-    # Замер времени поиска
-    start_time = time.time()  # O(1)
-    for value in elements:  # O(n)
-        bst.search(value)  # O(log n) в среднем, O(n) в худшем случае
-    end_time = time.time()  # O(1)
+    def search_all():  # O(n log n) в среднем, O(n²) в худшем случае
+        for value in elements:  # O(n)
+            bst.search(value)  # O(log n) в среднем, O(n) в худшем случае
 
-    return end_time - start_time  # O(1)
+    # Замер времени поиска: прогрев, без GC, медиана по повторам
+    return measure(search_all, warmup=1, max_time=1.0).median  # O(r * n log n)
 
 def test_performance():  # O(k * n log n), где k - количество размеров, n - размер дерева
     """
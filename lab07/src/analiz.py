@@ -1,10 +1,15 @@
 # Замеры времени для Heapsort и других алгоритмов сортировки.
 # Добавлены комментарии и оценки сложности для каждой строки.
-import time  # O(1) импорт модуля для работы со временем
+import os  # O(1) импорт модуля для работы с путями
+import sys  # O(1) импорт модуля для настройки путей импорта
 import random  # O(1) импорт модуля для генерации случайных данных
 import matplotlib.pyplot as plt  # O(1) импорт для построения графиков
 
 from heapsort import heapsort  # O(1) импорт функции heapsort из модуля
+from heap import Heap  # O(1) импорт класса кучи
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))  # O(1) путь к common
+from common.timing import measure, measure_batched  # O(1) импорт общего модуля замеров
 
 
 def measure_time():  # O(1) определение функции измерения времени
@@ -16,20 +21,16 @@ def measure_time():  # O(1) определение функции измерен
     for size in sizes:  # O(len(sizes)) итерация по размерам (len(sizes) — константа здесь)
         array = random.sample(range(size * 10), size)  # O(size) создание случайного массива
         
+        copy = lambda: (array[:],)  # O(1) setup: свежая копия перед каждым повтором, вне замера
+
         # Замер Heapsort
-        start = time.time()  # O(1) фиксация времени начала
-        heapsort(array)  # O(n log n) запуск heapsort на массиве длины n
-        heapsort_times.append(time.time() - start)  # O(1) добавление результата
+        heapsort_times.append(measure(heapsort, setup=copy).median)  # O(r * n log n) медиана r повторов
         
         # Замер QuickSort (встроенный .sort())
-        start = time.time()  # O(1) фиксация времени начала
-        array.sort()  # O(n log n) встроенная сортировка (обычно Timsort)  
-        quicksort_times.append(time.time() - start)  # O(1) добавление результата
+        quicksort_times.append(measure(list.sort, setup=copy).median)  # O(r * n log n) встроенная сортировка (обычно Timsort)
         
         # Замер MergeSort (функция sorted)
-        start = time.time()  # O(1) фиксация времени начала
-        sorted(array)  # O(n log n) создание отсортированного нового списка
-        merge_sort_times.append(time.time() - start)  # O(1) добавление результата
+        merge_sort_times.append(measure(sorted, setup=copy).median)  # O(r * n log n) создание отсортированного нового списка
 
     # Построение графиков
     plt.plot(sizes, heapsort_times, label='Heapsort')  # O(len(sizes)) построение линии
@@ -41,4 +42,15 @@ def measure_time():  # O(1) определение функции измерен
     plt.show()  # вывод графика — строка вывода, сложность не проставлена
 
 
+def measure_peek():  # O(len(sizes) * n) замер peek на кучах разного размера
+    """Латентность peek: O(1) операция измеряется пакетами вызовов
+    за вычетом стоимости пустого цикла, иначе результат - время таймера."""
+    for size in [100, 10000, 1000000]:  # O(1) размеры кучи
+        heap = Heap()  # O(1) пустая min-куча
+        heap.build_heap(random.sample(range(size * 10), size))  # O(n) построение кучи
+        result = measure_batched(heap.peek)  # O(r * K) пакетный замер
+        print(f"peek, n={size}: {result.median * 1e9:.1f} нс (K={result.number})")  # O(1) вывод
+
+
+measure_peek()  # O(1) вызов замера peek
 measure_time()  # O(1) вызов функции измерения времени (запуск эксперимента)
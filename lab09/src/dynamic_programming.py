@@ -49,7 +49,9 @@ class Fibonacci:
         
         Args:
             n: порядковый номер чисел Фибоначчи
-            memo: словарь для кэширования результатов
+            memo: словарь для кэширования результатов; подойдёт любой
+                объект с операциями in, [] и []=, например
+                common.memo_store.MemoStore для хранения между запусками
             
         Returns:
             n-е число Фибоначчи